@@ -13,7 +13,6 @@ from src.strategy.bollinger_strategy import BollingerStrategy
 from src.strategy.macd_strategy import MACDStrategy
 from src.strategy.stochastic_strategy import StochasticStrategy
 from src.logger import setup_logging, get_logger
-import json
 
 setup_logging()
 logger = get_logger(__name__)
@@ -81,13 +80,13 @@ def main():
     logger.info("Starting Strategy Parameter Optimization")
     logger.info("=" * 80)
     
-    optimizer = BayesianOptimizer()
+    optimizer = BayesianOptimizer(Backtester(vectorized=True))
     
     results = optimizer.optimize_multiple_strategies(
         strategy_configs=strategy_configs,
         stock_codes=stock_codes,
         n_iterations=30,  # 각 전략당 30회 반복 (빠른 테스트용, 실전에서는 50-100 권장)
-        save_path=str(save_path)
+        save_path=str(save_path)  # 워커 수는 config.yaml의 optimization.n_workers
     )
     
     # 결과 요약 출력
@@ -112,26 +111,9 @@ def main():
             else:
                 print(f"  [{stock_code}] - FAILED")
     
-    # 최종 결과를 JSON으로 저장
+    # 요약(optimization_summary.json)은 optimize_multiple_strategies가 저장
     summary_path = save_path / "optimization_summary.json"
     
-    # 요약 데이터 생성
-    summary = {}
-    for strategy_name, stock_results in results.items():
-        summary[strategy_name] = {}
-        for stock_code, result in stock_results.items():
-            if result:
-                summary[strategy_name][stock_code] = {
-                    'best_params': result['best_params'],
-                    'total_return': result['backtest_result']['total_return'],
-                    'win_rate': result['backtest_result']['win_rate'],
-                    'sharpe_ratio': result['backtest_result']['sharpe_ratio'],
-                    'max_drawdown': result['backtest_result']['max_drawdown']
-                }
-    
-    with open(summary_path, 'w', encoding='utf-8') as f:
-        json.dump(summary, f, indent=2, ensure_ascii=False)
-    
     print(f"\n✅ Summary saved to: {summary_path}")
     print("=" * 80)
 
@@ -1,7 +1,7 @@
 """펀더멘털 분석기"""
 from typing import List, Dict
 from ..logger import get_logger
-from ..api import KISAPIClient
+from ..api import KISAPIClient, get_kis_client
 
 logger = get_logger(__name__)
 
@@ -11,7 +11,7 @@ class FundamentalAnalyzer:
     """
     
     def __init__(self, api_client: KISAPIClient = None):
-        self.api_client = api_client or KISAPIClient(mode='mock')
+        self.api_client = api_client or get_kis_client('mock')
         
     def get_market_cap_rank(self, limit: int = 50) -> List[str]:
         """
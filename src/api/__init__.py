@@ -1,8 +1,15 @@
 """KIS API 패키지"""
-from .kis_client import KISAPIClient
+from .kis_client import KISAPIClient, get_kis_client
+from .kis_websocket import KISWebSocketClient
+from .kis_ws_pool import KISWebSocketPool
+from .kis_parser import Tick, parse_frame
+from .dispatcher import TickDispatcher
+from .token_manager import TokenManager, get_token_manager
+from .rate_limiter import RateLimiter, Priority, get_rate_limiter
 from .kis_models import (
     TokenResponse,
     StockQuote,
+    MinuteBar,
     OrderRequest,
     OrderResponse,
     AccountBalance,
@@ -12,8 +19,20 @@ from .kis_models import (
 
 __all__ = [
     'KISAPIClient',
+    'get_kis_client',
+    'KISWebSocketClient',
+    'KISWebSocketPool',
+    'Tick',
+    'parse_frame',
+    'TickDispatcher',
+    'TokenManager',
+    'get_token_manager',
+    'RateLimiter',
+    'Priority',
+    'get_rate_limiter',
     'TokenResponse',
     'StockQuote',
+    'MinuteBar',
     'OrderRequest',
     'OrderResponse',
     'AccountBalance',
@@ -0,0 +1,151 @@
+"""실시간 틱 분배기 (수신 루프와 핸들러 사이의 유한 큐)
+
+WebSocket 수신 루프는 틱을 샤드별 asyncio.Queue에 넣기만 하고, 샤드마다 하나의
+워커 태스크가 핸들러를 호출한다. 같은 종목은 항상 같은 샤드로 가므로 종목 내
+순서가 보장되고, 느린 핸들러는 자기 샤드만 밀리게 된다.
+
+큐가 가득 찼을 때 정책:
+    drop_oldest: 가장 오래된 틱을 버리고 새 틱을 넣음 (수신 루프는 대기하지 않음)
+    conflate:    처리 대기 중인 같은 종목 틱을 최신 틱으로 덮어씀 (종목당 최대 1개 대기)
+    block:       자리가 날 때까지 수신 루프가 대기 (틱 유실 없음)
+"""
+import asyncio
+import inspect
+import zlib
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+from ..config import get_config
+from ..logger import get_logger
+from .kis_parser import Tick
+
+logger = get_logger(__name__)
+
+OVERFLOW_POLICIES = ('drop_oldest', 'conflate', 'block')
+
+
+class TickDispatcher:
+    """종목 단위로 샤딩된 유한 큐 기반 틱 분배기"""
+
+    def __init__(
+        self,
+        handler: Callable[[Tick], Union[None, Awaitable[None]]],
+        shards: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        overflow: Optional[str] = None
+    ):
+        """
+        Args:
+            handler: 틱 처리 함수 (동기/비동기 모두 가능)
+            shards: 샤드(큐/워커) 수. None이면 설정값 websocket.dispatch.shards
+            queue_size: 샤드별 최대 대기 틱 수. None이면 websocket.dispatch.queue_size
+            overflow: 큐가 가득 찼을 때 정책. None이면 websocket.dispatch.overflow
+        """
+        config = get_config()
+        self.handler = handler
+        self.shards = shards or config.get('websocket.dispatch.shards', 4)
+        self.queue_size = queue_size or config.get('websocket.dispatch.queue_size', 1000)
+        self.overflow = overflow or config.get('websocket.dispatch.overflow', 'drop_oldest')
+        if self.overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {self.overflow}")
+
+        self.queues: List[asyncio.Queue] = []
+        self.workers: List[asyncio.Task] = []
+        # conflate 정책: 샤드별 {종목코드: 최신 틱} (큐에는 종목코드만 들어감)
+        self.pending: List[Dict[str, Tick]] = []
+
+        self.received = 0
+        self.processed = 0
+        self.dropped = 0
+        self.conflated = 0
+        self.errors = 0
+        self.max_depth = 0
+
+    def _shard(self, stock_code: str) -> int:
+        return zlib.crc32(stock_code.encode()) % self.shards
+
+    def start(self):
+        """샤드별 큐와 워커 태스크 생성 (이벤트 루프 안에서 호출)"""
+        if self.workers:
+            return
+        self.queues = [asyncio.Queue(maxsize=self.queue_size) for _ in range(self.shards)]
+        self.pending = [{} for _ in range(self.shards)]
+        self.workers = [asyncio.create_task(self._worker(i)) for i in range(self.shards)]
+        logger.info(f"Tick dispatcher started ({self.shards} shards, "
+                    f"queue {self.queue_size}, overflow={self.overflow})")
+
+    async def stop(self):
+        """워커 태스크 종료 (대기 중인 틱은 버림)"""
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
+
+    async def put(self, tick: Tick):
+        """
+        틱 투입 (WebSocket 수신 루프에서 호출)
+
+        block 정책일 때만 큐에 자리가 날 때까지 대기한다.
+        """
+        self.received += 1
+        index = self._shard(tick.stock_code)
+        queue = self.queues[index]
+
+        if self.overflow == 'conflate':
+            pending = self.pending[index]
+            if tick.stock_code in pending:
+                pending[tick.stock_code] = tick
+                self.conflated += 1
+                return
+            pending[tick.stock_code] = tick
+            item = tick.stock_code
+        else:
+            item = tick
+
+        if self.overflow == 'block':
+            await queue.put(item)
+        else:
+            if queue.full():
+                old = queue.get_nowait()
+                queue.task_done()
+                if self.overflow == 'conflate':
+                    self.pending[index].pop(old, None)
+                self._record_drop()
+            queue.put_nowait(item)
+
+        self.max_depth = max(self.max_depth, queue.qsize())
+
+    def _record_drop(self):
+        self.dropped += 1
+        # 로그 폭주 방지: 처음과 이후 1000건마다 경고
+        if self.dropped == 1 or self.dropped % 1000 == 0:
+            logger.warning(f"Tick queue overflow: {self.dropped} ticks dropped so far")
+
+    async def _worker(self, index: int):
+        queue = self.queues[index]
+        pending = self.pending[index]
+
+        while True:
+            item = await queue.get()
+            tick = pending.pop(item) if self.overflow == 'conflate' else item
+            try:
+                result = self.handler(tick)
+                if inspect.isawaitable(result):
+                    await result
+                self.processed += 1
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"Error in tick handler ({tick.stock_code}): {e}")
+            finally:
+                queue.task_done()
+
+    def stats(self) -> Dict[str, Any]:
+        """큐 깊이 및 처리/유실 카운터"""
+        return {
+            'depth': [queue.qsize() for queue in self.queues],
+            'max_depth': self.max_depth,
+            'received': self.received,
+            'processed': self.processed,
+            'dropped': self.dropped,
+            'conflated': self.conflated,
+            'errors': self.errors,
+        }
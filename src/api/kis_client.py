@@ -1,14 +1,18 @@
 """한국투자증권 API REST 클라이언트"""
 import requests
+import threading
 import time
 from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
 from typing import Optional, List, Dict, Any
 from ..config import get_config
 from ..logger import get_logger
 from .kis_models import (
-    TokenResponse, StockQuote, OrderRequest, OrderResponse,
+    TokenResponse, StockQuote, MinuteBar, OrderRequest, OrderResponse,
     AccountBalance, Position
 )
+from .rate_limiter import Priority, get_rate_limiter
+from .token_manager import get_token_manager
 
 logger = get_logger(__name__)
 
@@ -31,54 +35,52 @@ class KISAPIClient:
         self.account_number = self.credentials.get('account_number')
         self.account_product_code = self.credentials.get('account_product_code')
         
-        self._access_token: Optional[str] = None
-        self._token_expires_at: Optional[datetime] = None
-        
         self.timeout = self.config.get('api.request_timeout', 10)
         self.max_retries = self.config.get('api.max_retries', 3)
         self.retry_delay = self.config.get('api.retry_delay', 1)
-        
-        self._token_file = "data/kis_token.json"
-        self._load_token()
+        self.pool_size = self.config.get('api.pool_size', 10)
+        self.rate_limiter = get_rate_limiter(self.mode)
+        self.session = self._create_session()
+        self.token_manager = get_token_manager(self.mode)
         
         logger.info(f"KIS API Client initialized in {self.mode} mode")
     
-    def _load_token(self):
-        """저장된 토큰 로드"""
-        import json
-        import os
-        
-        try:
-            if os.path.exists(self._token_file):
-                with open(self._token_file, 'r') as f:
-                    data = json.load(f)
-                    expires_at = datetime.fromisoformat(data.get('expires_at'))
-                    
-                    if datetime.now() < expires_at:
-                        self._access_token = data.get('access_token')
-                        self._token_expires_at = expires_at
-                        logger.info(f"Loaded valid token from file (expires: {expires_at})")
-                    else:
-                        logger.info("Saved token is expired")
-        except Exception as e:
-            logger.warning(f"Failed to load token: {e}")
-
-    def _save_token(self):
-        """토큰 파일 저장"""
-        import json
+    def __getstate__(self):
+        """피클링 시 프로세스 로컬 자원(속도 제한기, HTTP 세션, 토큰 관리자)은 제외 (워커 프로세스 전달용)"""
+        state = self.__dict__.copy()
+        state.pop('rate_limiter', None)
+        state.pop('session', None)
+        state.pop('token_manager', None)
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.rate_limiter = get_rate_limiter(self.mode)
+        self.session = self._create_session()
+        self.token_manager = get_token_manager(self.mode)
+    
+    def _create_session(self) -> requests.Session:
+        """
+        keep-alive HTTP 세션 생성
         
-        try:
-            if self._access_token and self._token_expires_at:
-                data = {
-                    'access_token': self._access_token,
-                    'expires_at': self._token_expires_at.isoformat()
-                }
-                with open(self._token_file, 'w') as f:
-                    json.dump(data, f)
-                logger.info("Token saved to file")
-        except Exception as e:
-            logger.warning(f"Failed to save token: {e}")
-
+        연결 풀을 재사용해 요청마다 TCP/TLS 핸드셰이크를 하지 않는다. urllib3 풀은
+        스레드 안전하므로 asyncio.to_thread 워커들이 같은 세션을 공유한다.
+        재시도는 _request에서 속도 제한기와 함께 처리하므로 어댑터 재시도는 끈다.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            max_retries=0
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+    
+    def close(self):
+        """HTTP 세션 및 연결 풀 정리"""
+        self.session.close()
+    
     def _get_headers(self, tr_id: str, include_token: bool = True) -> Dict[str, str]:
         """API 요청 헤더 생성"""
         headers = {
@@ -90,76 +92,31 @@ class KISAPIClient:
         }
         
         if include_token:
-            if not self._access_token or self._is_token_expired():
-                self._refresh_token()
-            
-            if not self._access_token:
+            access_token = self.token_manager.get_token()
+            if not access_token:
                 raise RuntimeError("Failed to obtain access token")
                 
-            headers["authorization"] = f"Bearer {self._access_token}"
+            headers["authorization"] = f"Bearer {access_token}"
         
         return headers
     
-    def _is_token_expired(self) -> bool:
-        """토큰 만료 여부 확인"""
-        if not self._token_expires_at:
-            return True
-        # 만료 5분 전에 갱신
-        return datetime.now() >= (self._token_expires_at - timedelta(minutes=5))
-    
-    def _refresh_token(self):
-        """OAuth2 토큰 발급/갱신"""
-        logger.info("Refreshing access token...")
-        
-        url = f"{self.base_url}/oauth2/tokenP"
-        
-        # KIS API는 JSON이 아닌 form data를 요구함
-        headers = {
-            "Content-Type": "application/json"
-        }
-        data = {
-            "grant_type": "client_credentials",
-            "appkey": self.app_key,
-            "appsecret": self.app_secret
-        }
+    def _request(self, method: str, endpoint: str,
+                 priority: Priority = Priority.QUOTE, **kwargs) -> Dict[str, Any]:
+        """API 요청 (속도 제한 및 재시도 로직 포함)
         
-        try:
-            logger.debug(f"Requesting token from: {url}")
-            response = requests.post(url, json=data, headers=headers, timeout=self.timeout)
-            logger.debug(f"Token response status: {response.status_code}")
-            response.raise_for_status()
-            
-            token_data = response.json()
-            self._access_token = token_data.get('access_token')
-            expires_in = token_data.get('expires_in', 86400)  # 기본 24시간
-            self._token_expires_at = datetime.now() + timedelta(seconds=expires_in)
-            
-            self._save_token()
-            
-            logger.info(f"Access token obtained successfully, expires at {self._token_expires_at}")
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 403:
-                # Rate limit (1분당 1회 제한)
-                logger.warning(f"Token refresh rate limited (1/min).")
-                # 기존 토큰이 없으면 치명적 오류
-                if not self._access_token:
-                    logger.error("No valid token available and refresh limit hit.")
-                    # 여기서 raise를 하면 메인 루프가 죽을 수 있으므로, 
-                    # 호출하는 쪽에서 처리하도록 둠 (하지만 _get_headers에서 체크함)
-            else:
-                logger.error(f"HTTP error during token refresh: {e.response.status_code} - {e.response.text if hasattr(e.response, 'text') else 'No response body'}")
-        except Exception as e:
-            logger.error(f"Failed to refresh token: {type(e).__name__}: {e}")
-    
-    def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
-        """API 요청 (재시도 로직 포함)"""
+        Args:
+            priority: 속도 제한기 우선순위 (주문 > 시세 > 잔고)
+        """
         url = f"{self.base_url}{endpoint}"
         
         for attempt in range(self.max_retries):
+            self.rate_limiter.acquire(priority)
             try:
-                response = requests.request(
+                response = self.session.request(
                     method, url, timeout=self.timeout, **kwargs
                 )
+                if response.status_code == 429 or self._is_rate_limited(response):
+                    self.rate_limiter.pause(1.0)
                 response.raise_for_status()
                 return response.json()
             
@@ -172,6 +129,16 @@ class KISAPIClient:
                     logger.error(f"Request failed after {self.max_retries} attempts")
                     raise
     
+    @staticmethod
+    def _is_rate_limited(response: requests.Response) -> bool:
+        """KIS 초당 거래건수 초과 응답(EGW00201) 여부"""
+        if response.status_code < 400:
+            return False
+        try:
+            return response.json().get('msg_cd') == 'EGW00201'
+        except ValueError:
+            return False
+    
     def get_stock_price(self, stock_code: str) -> StockQuote:
         """주식 현재가 조회
         
@@ -192,6 +159,7 @@ class KISAPIClient:
         result = self._request(
             "GET",
             "/uapi/domestic-stock/v1/quotations/inquire-price",
+            priority=Priority.QUOTE,
             headers=headers,
             params=params
         )
@@ -210,6 +178,65 @@ class KISAPIClient:
             volume=int(output.get('acml_vol', 0))
         )
     
+    def get_minute_bars(self, stock_code: str, start: str, end: str) -> List[MinuteBar]:
+        """당일 분봉 조회 (start < 시각 <= end 구간, 시간 오름차순)
+        
+        KIS 당일분봉조회는 호출당 기준 시각 이전 30개 분봉을 돌려주므로 start에
+        닿을 때까지 기준 시각을 앞당기며 반복 조회한다.
+        
+        Args:
+            stock_code: 종목코드 (6자리)
+            start: 구간 시작 시각 HHMMSS (미포함)
+            end: 구간 끝 시각 HHMMSS (포함)
+        
+        Returns:
+            MinuteBar 리스트
+        """
+        tr_id = "FHKST03010200"  # 주식당일분봉조회
+        
+        bars: Dict[str, MinuteBar] = {}
+        cursor = end
+        # 장중 최대 390분 = 13페이지
+        for _ in range(14):
+            headers = self._get_headers(tr_id)
+            params = {
+                "FID_ETC_CLS_CODE": "",
+                "FID_COND_MRKT_DIV_CODE": "J",
+                "FID_INPUT_ISCD": stock_code,
+                "FID_INPUT_HOUR_1": cursor,
+                "FID_PW_DATA_INCU_YN": "N"
+            }
+            
+            result = self._request(
+                "GET",
+                "/uapi/domestic-stock/v1/quotations/inquire-time-itemchartprice",
+                priority=Priority.QUOTE,
+                headers=headers,
+                params=params
+            )
+            
+            rows = [row for row in result.get('output2', []) if row.get('stck_cntg_hour')]
+            for row in rows:
+                hour = row['stck_cntg_hour']
+                if start < hour <= end:
+                    bars[hour] = MinuteBar(
+                        stock_code=stock_code,
+                        date=row.get('stck_bsop_date', ''),
+                        time=hour,
+                        open=int(row.get('stck_oprc', 0)),
+                        high=int(row.get('stck_hgpr', 0)),
+                        low=int(row.get('stck_lwpr', 0)),
+                        close=int(row.get('stck_prpr', 0)),
+                        volume=int(row.get('cntg_vol', 0))
+                    )
+            
+            earliest = min((row['stck_cntg_hour'] for row in rows), default=start)
+            if len(rows) < 30 or earliest <= start:
+                break
+            cursor = (datetime.strptime(earliest, '%H%M%S') - timedelta(minutes=1)).strftime('%H%M%S')
+        
+        return [bars[hour] for hour in sorted(bars)]
+    
     def place_order(self, order: OrderRequest) -> OrderResponse:
         """주문 실행
         
@@ -231,7 +258,7 @@ class KISAPIClient:
             "CANO": self.account_number,
             "ACNT_PRDT_CD": self.account_product_code,
             "PDNO": order.stock_code,
-            "ORD_DVSN": "01" if order.price > 0 else "01",  # 지정가/시장가
+            "ORD_DVSN": "00" if order.price > 0 else "01",  # 00: 지정가, 01: 시장가
             "ORD_QTY": str(order.quantity),
             "ORD_UNPR": str(order.price) if order.price > 0 else "0"
         }
@@ -242,6 +269,7 @@ class KISAPIClient:
         result = self._request(
             "POST",
             "/uapi/domestic-stock/v1/trading/order-cash",
+            priority=Priority.ORDER,
             headers=headers,
             json=data
         )
@@ -280,6 +308,7 @@ class KISAPIClient:
         result = self._request(
             "GET",
             "/uapi/domestic-stock/v1/trading/inquire-balance",
+            priority=Priority.BALANCE,
             headers=headers,
             params=params
         )
@@ -322,6 +351,7 @@ class KISAPIClient:
         result = self._request(
             "GET",
             "/uapi/domestic-stock/v1/trading/inquire-balance",
+            priority=Priority.BALANCE,
             headers=headers,
             params=params
         )
@@ -338,3 +368,22 @@ class KISAPIClient:
                 ))
         
         return positions
+
+
+# 모드별 전역 클라이언트 (세션/토큰/속도 제한기를 프로세스에서 공유)
+_clients: Dict[str, KISAPIClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_kis_client(mode: Optional[str] = None) -> KISAPIClient:
+    """
+    모드별 KIS API 클라이언트 가져오기 (싱글톤)
+    
+    Args:
+        mode: 'mock' 또는 'real'. None이면 설정 파일에서 읽음
+    """
+    mode = mode or get_config().get_trading_mode()
+    with _clients_lock:
+        if mode not in _clients:
+            _clients[mode] = KISAPIClient(mode=mode)
+        return _clients[mode]
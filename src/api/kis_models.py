@@ -32,6 +32,18 @@ class StockQuote(BaseModel):
         return ((self.current_price - self.prev_close) / self.prev_close) * 100
 
 
+class MinuteBar(BaseModel):
+    """분봉 (당일 분봉 조회 응답)"""
+    stock_code: str = Field(..., description="종목코드")
+    date: str = Field(..., description="영업일자 YYYYMMDD")
+    time: str = Field(..., description="체결시각 HHMM00 (분 구간 시작)")
+    open: int = Field(..., description="시가")
+    high: int = Field(..., description="고가")
+    low: int = Field(..., description="저가")
+    close: int = Field(..., description="종가")
+    volume: int = Field(..., description="체결 거래량")
+
+
 class OrderRequest(BaseModel):
     """주문 요청"""
     stock_code: str = Field(..., description="종목코드")
@@ -50,6 +62,7 @@ class OrderResponse(BaseModel):
     quantity: int
     status: str = Field(..., description="주문상태")
     message: Optional[str] = None
+    filled_quantity: int = Field(default=0, description="누적 체결수량 (체결통보로 갱신)")
 
 
 class AccountBalance(BaseModel):
@@ -0,0 +1,219 @@
+"""한국투자증권 실시간(WebSocket) 데이터 프레임 파서
+
+실시간 데이터 프레임 형식:
+    {암호화 여부}|{tr_id}|{레코드 수}|{필드^필드^...}
+
+한 프레임에 레코드가 여러 개 들어올 수 있으며(레코드 수 = parts[2]), 모든
+레코드의 필드가 '^'로 이어져 있다. tr_id별 필드 오프셋을 미리 정해 두고
+레코드마다 필요한 필드만 변환해 슬롯 객체로 만든다 (pydantic 검증 없음).
+
+체결통보(H0STCNI0/H0STCNI9)는 암호화 여부가 '1'이며, 필드 부분이 구독 응답으로
+받은 key/iv로 AES-256-CBC 암호화(Base64)되어 있다.
+"""
+import base64
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from ..logger import get_logger
+
+try:
+    from Crypto.Cipher import AES
+    from Crypto.Util.Padding import unpad
+except ImportError:  # pycryptodome 미설치 시 체결통보 복호화만 불가
+    AES = None
+
+logger = get_logger(__name__)
+
+
+class Tick:
+    """실시간 체결 틱 (H0STCNT0)"""
+
+    __slots__ = (
+        'stock_code', 'time', 'price', 'change', 'change_rate',
+        'open', 'high', 'low', 'ask', 'bid', 'volume', 'cum_volume'
+    )
+
+    def __init__(self, stock_code: str, time: str, price: int, change: int, change_rate: float,
+                 open: int, high: int, low: int, ask: int, bid: int, volume: int, cum_volume: int):
+        self.stock_code = stock_code
+        self.time = time              # 체결 시각 HHMMSS
+        self.price = price            # 현재가
+        self.change = change          # 전일 대비
+        self.change_rate = change_rate
+        self.open = open              # 당일 시가/고가/저가
+        self.high = high
+        self.low = low
+        self.ask = ask                # 매도/매수 1호가
+        self.bid = bid
+        self.volume = volume          # 체결 거래량
+        self.cum_volume = cum_volume  # 누적 거래량
+
+    def __repr__(self) -> str:
+        return f"Tick({self.stock_code} {self.time} {self.price} x {self.volume})"
+
+
+def _build_trade_tick(f: List[str], b: int) -> Tick:
+    # H0STCNT0 필드 오프셋: 0 종목코드, 1 체결시각, 2 현재가, 3 대비부호, 4 전일대비,
+    # 5 등락률, 6 가중평균가, 7 시가, 8 고가, 9 저가, 10 매도호가1, 11 매수호가1,
+    # 12 체결거래량, 13 누적거래량 (이하 46개 필드까지 미사용)
+    return Tick(
+        f[b], f[b + 1], int(f[b + 2]), int(f[b + 4]), float(f[b + 5]),
+        int(f[b + 7]), int(f[b + 8]), int(f[b + 9]),
+        int(f[b + 10]), int(f[b + 11]), int(f[b + 12]), int(f[b + 13])
+    )
+
+
+class QuoteUpdate:
+    """
+    실시간 호가 (H0STASP0)
+
+    숫자 변환 없이 프레임 필드와 레코드 시작 오프셋만 들고 있고, OrderBook.apply()가
+    필요한 구간을 미리 할당된 배열에 바로 복사한다.
+    """
+
+    __slots__ = ('stock_code', 'time', 'fields', 'base')
+
+    # 레코드 내 오프셋: 0 종목코드, 1 영업시간, 2 시간구분, 3~12 매도호가 1~10,
+    # 13~22 매수호가 1~10, 23~32 매도잔량 1~10, 33~42 매수잔량 1~10,
+    # 43 총매도잔량, 44 총매수잔량 (이하 59개 필드까지 미사용)
+    LEVELS_START = 3
+    LEVELS_END = 43
+    TOTAL_ASK_QTY = 43
+    TOTAL_BID_QTY = 44
+
+    def __init__(self, stock_code: str, time: str, fields: List[str], base: int):
+        self.stock_code = stock_code
+        self.time = time
+        self.fields = fields
+        self.base = base
+
+    def __repr__(self) -> str:
+        return f"QuoteUpdate({self.stock_code} {self.time})"
+
+
+def _build_quote_update(f: List[str], b: int) -> QuoteUpdate:
+    return QuoteUpdate(f[b], f[b + 1], f, b)
+
+
+class Fill:
+    """실시간 체결통보 (H0STCNI0 실전 / H0STCNI9 모의)"""
+
+    __slots__ = (
+        'account', 'order_no', 'orig_order_no', 'order_type', 'stock_code',
+        'quantity', 'price', 'time', 'rejected', 'filled', 'order_quantity', 'order_price',
+        'cancelled'
+    )
+
+    def __init__(self, account: str, order_no: str, orig_order_no: str, order_type: str,
+                 stock_code: str, quantity: int, price: int, time: str, rejected: bool,
+                 filled: bool, order_quantity: int, order_price: int, cancelled: bool = False):
+        self.account = account
+        self.order_no = order_no
+        self.orig_order_no = orig_order_no
+        self.order_type = order_type    # 'BUY' 또는 'SELL'
+        self.stock_code = stock_code
+        self.quantity = quantity        # 체결수량 (접수 통보면 주문수량)
+        self.price = price              # 체결단가 (접수 통보면 주문가격)
+        self.time = time                # 체결 시각 HHMMSS
+        self.rejected = rejected
+        self.filled = filled            # True: 체결, False: 주문/정정/취소 접수
+        self.order_quantity = order_quantity
+        self.order_price = order_price
+        self.cancelled = cancelled      # 취소 주문 통보 (orig_order_no가 취소된 주문)
+
+    def __repr__(self) -> str:
+        kind = 'filled' if self.filled else ('rejected' if self.rejected else 'accepted')
+        return f"Fill({self.order_no} {self.order_type} {self.stock_code} {self.quantity} @ {self.price} {kind})"
+
+
+def _to_int(value: str) -> int:
+    return int(value) if value.strip() else 0
+
+
+def _build_fill(f: List[str], b: int) -> Fill:
+    # H0STCNI0 필드 오프셋: 0 고객ID, 1 계좌번호, 2 주문번호, 3 원주문번호, 4 매도매수구분(01 매도/02 매수),
+    # 5 정정구분, 6 주문종류, 7 주문조건, 8 종목코드, 9 체결수량, 10 체결단가, 11 체결시각,
+    # 12 거부여부, 13 체결여부(1 접수/2 체결), 14 접수여부, 15 지점번호, 16 주문수량,
+    # 17 계좌명, 18 체결종목명, 19 신용구분, 20 신용대출일자, 21 체결종목명40, 22 주문가격
+    return Fill(
+        f[b + 1], f[b + 2], f[b + 3], 'SELL' if f[b + 4] == '01' else 'BUY', f[b + 8],
+        _to_int(f[b + 9]), _to_int(f[b + 10]), f[b + 11], f[b + 12] == '1', f[b + 13] == '2',
+        _to_int(f[b + 16]), _to_int(f[b + 22]), f[b + 5] == '2'  # 정정구분 2: 취소
+    )
+
+
+def decrypt_payload(cipher_text: str, key: str, iv: str) -> str:
+    """
+    암호화 프레임 필드 복호화 (AES-256-CBC, PKCS7, Base64)
+
+    Args:
+        cipher_text: 프레임의 암호화된 필드 부분
+        key: 구독 응답의 body.output.key (32자)
+        iv: 구독 응답의 body.output.iv (16자)
+    """
+    if AES is None:
+        raise RuntimeError("pycryptodome is required to decrypt execution notices")
+    cipher = AES.new(key.encode('utf-8'), AES.MODE_CBC, iv.encode('utf-8'))
+    return unpad(cipher.decrypt(base64.b64decode(cipher_text)), AES.block_size).decode('utf-8')
+
+
+class RecordSchema(NamedTuple):
+    """tr_id별 레코드 스키마"""
+    field_count: int                          # 레코드당 필드 수
+    build: Callable[[List[str], int], object]  # (전체 필드, 레코드 시작 오프셋) -> 레코드
+
+
+SCHEMAS: Dict[str, RecordSchema] = {
+    'H0STCNT0': RecordSchema(46, _build_trade_tick),  # 주식 체결
+    'H0STASP0': RecordSchema(59, _build_quote_update),  # 주식 호가 (10단계)
+    'H0STCNI0': RecordSchema(23, _build_fill),  # 체결통보 (실전)
+    'H0STCNI9': RecordSchema(23, _build_fill),  # 체결통보 (모의)
+}
+
+
+def parse_frame(raw: str, ciphers: Dict[str, Tuple[str, str]] = None) -> Optional[Tuple[str, list]]:
+    """
+    실시간 데이터 프레임 파싱
+
+    Args:
+        raw: 수신한 원본 문자열
+        ciphers: 암호화 프레임 복호화 키 {tr_id: (key, iv)} (구독 응답에서 수집)
+
+    Returns:
+        (tr_id, 레코드 리스트). JSON 제어 프레임, 키가 없는 암호화 프레임, 미지원 tr_id는 None
+    """
+    if not raw or raw[0] not in '01':
+        # '{...}' 제어 프레임 (PINGPONG, 구독 응답)
+        return None
+
+    parts = raw.split('|', 3)
+    if len(parts) < 4:
+        return None
+
+    tr_id = parts[1]
+    schema = SCHEMAS.get(tr_id)
+    if schema is None:
+        return None
+
+    payload = parts[3]
+    if raw[0] == '1':
+        cipher = ciphers.get(tr_id) if ciphers else None
+        if cipher is None:
+            logger.warning(f"No cipher key for encrypted {tr_id} frame")
+            return None
+        payload = decrypt_payload(payload, *cipher)
+
+    fields = payload.split('^')
+    count = int(parts[2]) if parts[2].isdigit() else 1
+    count = max(count, 1)
+
+    # 필드 수가 문서와 달라져도 레코드 수 기준으로 나눠 읽는다
+    stride = len(fields) // count
+    if stride < schema.field_count:
+        if len(fields) < schema.field_count:
+            logger.warning(f"Truncated {tr_id} frame: {len(fields)} fields")
+            return None
+        stride = schema.field_count
+        count = len(fields) // stride
+
+    build = schema.build
+    return tr_id, [build(fields, base) for base in range(0, stride * count, stride)]
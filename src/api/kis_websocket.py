@@ -1,23 +1,30 @@
 """한국투자증권 WebSocket 클라이언트"""
 import asyncio
+import inspect
+import time
 import websockets
 import json
-import aes128
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, List, Tuple, Union, Awaitable
 from ..config import get_config
 from ..logger import get_logger
-from .kis_models import WebSocketMessage
+from .kis_parser import parse_frame
+from .token_manager import get_token_manager
 
 logger = get_logger(__name__)
 
+TR_TRADE = "H0STCNT0"  # 실시간 체결
+TR_QUOTE = "H0STASP0"  # 실시간 호가 (10단계)
+TR_FILL = {"real": "H0STCNI0", "mock": "H0STCNI9"}  # 실시간 체결통보 (모드별, 암호화)
+
 
 class KISWebSocketClient:
     """한국투자증권 WebSocket 실시간 시세 클라이언트"""
     
-    def __init__(self, mode: Optional[str] = None):
+    def __init__(self, mode: Optional[str] = None, tr_ids: Optional[List[str]] = None):
         """
         Args:
             mode: 'mock' 또는 'real'. None이면 설정 파일에서 읽음
+            tr_ids: 종목마다 등록할 실시간 채널. None이면 설정값 websocket.channels
         """
         self.config = get_config()
         self.mode = mode or self.config.get_trading_mode()
@@ -31,24 +38,70 @@ class KISWebSocketClient:
         
         self.app_key = self.credentials.get('app_key')
         self.app_secret = self.credentials.get('app_secret')
+        self.hts_id = self.credentials.get('hts_id')  # 체결통보 등록 키
+        self.approval_key: Optional[str] = None
+        self.approval_rejected = False  # 서버가 접속키를 거부함 (재연결 시 재발급)
         
         self.websocket: Optional[websockets.WebSocketClientProtocol] = None
         self.running = False
         self.subscribed_stocks = set()
+        self.tr_ids = tr_ids or self.config.get('websocket.channels', [TR_TRADE])
+        
+        # 체결통보: 세션당 HTS ID로 한 번 등록하며, 구독 응답으로 받은 key/iv로 복호화
+        self.fill_tr_id = TR_FILL.get(self.mode, TR_FILL['mock'])
+        self.fill_notices = False
+        self.ciphers: Dict[str, Tuple[str, str]] = {}  # tr_id -> (key, iv)
+        
+        # 등록/해제 요청별 응답(ACK/NACK) 추적. 키는 (tr_id, tr_key)
+        self.pending: Dict[Tuple[str, str], Tuple[str, float]] = {}  # -> (tr_type, 요청 시각)
+        self.active: set = set()
+        self.rejected: Dict[Tuple[str, str], str] = {}  # -> 거부 메시지
+        self.ack_timeout = self.config.get('websocket.ack_timeout', 10.0)
+        
+        # 연결 품질 지표
+        self.reconnects = 0
+        self.pings = 0
+        self.acks = 0
+        self.nacks = 0
+        self._resubscribe_started: Optional[float] = None
+        self.last_resubscribe_latency: Optional[float] = None  # 재연결 후 모든 ACK까지 걸린 시간 (초)
+        self.max_resubscribe_latency = 0.0
         
-        # 메시지 핸들러
-        self.message_handler: Optional[Callable[[WebSocketMessage], None]] = None
+        # tr_id별 메시지 핸들러 (체결: Tick, 호가: QuoteUpdate)
+        self.handlers: Dict[str, Callable[[object], Union[None, Awaitable[None]]]] = {}
+        # 원본 프레임 핸들러 (틱 기록 등, 파싱 전에 동기 호출)
+        self.raw_handler: Optional[Callable[[str], None]] = None
+        # 재연결 후 재구독이 끝나면 호출 (구독 종목 목록). 끊긴 동안의 공백 보충용
+        self.reconnect_handler: Optional[Callable[[List[str]], Union[None, Awaitable[None]]]] = None
+        # 체결통보 수신 상태 변경 시 호출 (True: 등록 ACK, False: 세션 종료/재연결/NACK)
+        self.notice_handler: Optional[Callable[[bool], Union[None, Awaitable[None]]]] = None
+        self.connected_once = False
         
         logger.info(f"KIS WebSocket Client initialized in {self.mode} mode")
     
     async def connect(self):
         """WebSocket 연결"""
+        # 실시간 접속키는 REST 접근 토큰과 별도로 발급받아야 함 (만료 시 관리자가 재발급)
+        self.approval_key = await asyncio.to_thread(get_token_manager(self.mode).get_approval_key)
+        if not self.approval_key:
+            raise RuntimeError("Failed to obtain WebSocket approval key")
+        self.approval_rejected = False
+        
+        if self.fill_notices:
+            # 이전 세션의 체결통보가 끊긴 동안 놓친 체결이 있을 수 있음
+            await self._notify_notice(False)
+        
         try:
             self.websocket = await websockets.connect(
                 self.ws_url,
                 ping_interval=20,
                 ping_timeout=10
             )
+            # 구독 상태와 암호화 키는 세션 단위이므로 새 세션에서 다시 받음
+            self.pending.clear()
+            self.active.clear()
+            self.rejected.clear()
+            self.ciphers.clear()
             self.running = True
             logger.info(f"WebSocket connected to {self.ws_url}")
         except Exception as e:
@@ -62,15 +115,16 @@ class KISWebSocketClient:
             await self.websocket.close()
             logger.info("WebSocket disconnected")
     
-    def _create_subscribe_message(self, stock_code: str, tr_type: str = "1") -> str:
+    def _create_subscribe_message(self, stock_code: str, tr_type: str = "1", tr_id: str = TR_TRADE) -> str:
         """실시간 시세 구독 메시지 생성
         
         Args:
             stock_code: 종목코드
-            tr_type: 거래 유형 (1: 체결, 2: 호가)
+            tr_type: 요청 유형 (1: 등록, 2: 해제)
+            tr_id: 실시간 채널 (H0STCNT0: 체결, H0STASP0: 호가)
         """
         header = {
-            "approval_key": self.app_key,
+            "approval_key": self.approval_key,
             "custtype": "P",
             "tr_type": tr_type,
             "content-type": "utf-8"
@@ -78,7 +132,7 @@ class KISWebSocketClient:
         
         body = {
             "input": {
-                "tr_id": "H0STCNT0",  # 실시간 체결
+                "tr_id": tr_id,
                 "tr_key": stock_code
             }
         }
@@ -99,12 +153,29 @@ class KISWebSocketClient:
         if not self.websocket:
             raise RuntimeError("WebSocket not connected")
         
-        message = self._create_subscribe_message(stock_code)
-        await self.websocket.send(message)
+        for tr_id in self.tr_ids:
+            await self._send_request(stock_code, "1", tr_id)
         self.subscribed_stocks.add(stock_code)
         
         logger.info(f"Subscribed to {stock_code}")
     
+    async def _send_request(self, tr_key: str, tr_type: str, tr_id: str):
+        """등록/해제 요청 전송 후 응답 대기 목록에 추가"""
+        await self.websocket.send(self._create_subscribe_message(tr_key, tr_type=tr_type, tr_id=tr_id))
+        self.pending[(tr_id, tr_key)] = (tr_type, time.monotonic())
+    
+    async def subscribe_fills(self):
+        """실시간 체결통보 등록 (계좌 단위, 재연결 시 자동 재등록)"""
+        if not self.websocket:
+            raise RuntimeError("WebSocket not connected")
+        if not self.hts_id:
+            logger.warning("hts_id not configured; execution notices disabled")
+            return
+        
+        await self._send_request(self.hts_id, "1", self.fill_tr_id)
+        self.fill_notices = True
+        logger.info(f"Subscribed to execution notices ({self.fill_tr_id})")
+    
     async def unsubscribe(self, stock_code: str):
         """종목 실시간 시세 구독 해제
         
@@ -115,57 +186,103 @@ class KISWebSocketClient:
             return
         
         # 구독 해제 메시지 (tr_type을 2로 설정)
-        message = self._create_subscribe_message(stock_code, tr_type="2")
-        await self.websocket.send(message)
+        for tr_id in self.tr_ids:
+            await self._send_request(stock_code, "2", tr_id)
         self.subscribed_stocks.discard(stock_code)
         
         logger.info(f"Unsubscribed from {stock_code}")
     
-    def _parse_message(self, raw_data: str) -> Optional[WebSocketMessage]:
+    def _parse_message(self, raw_data: str) -> Optional[Tuple[str, list]]:
         """WebSocket 메시지 파싱
         
         Args:
             raw_data: 원본 메시지
         
         Returns:
-            WebSocketMessage 객체 또는 None
+            (tr_id, 레코드 리스트). 데이터 프레임이 아니면 None
         """
         try:
-            # 메시지 포맷: 헤더 | 본문
-            parts = raw_data.split('|')
-            
-            if len(parts) < 3:
-                return None
-            
-            # 헤더 파싱
-            tr_id = parts[1]
-            
-            # 본문 파싱 (구분자로 분리된 데이터)
-            data_parts = parts[3].split('^') if len(parts) > 3 else []
-            
-            # 체결 데이터 파싱 예시
-            if tr_id == "H0STCNT0" and len(data_parts) >= 15:
-                data = {
-                    'stock_code': data_parts[0],
-                    'current_price': int(data_parts[2]),
-                    'change': int(data_parts[3]),
-                    'change_rate': float(data_parts[4]),
-                    'volume': int(data_parts[9]),
-                    'timestamp': data_parts[1]
-                }
-                
-                return WebSocketMessage(
-                    message_type='tick',
-                    stock_code=data['stock_code'],
-                    data=data
-                )
-            
-            return None
-        
+            return parse_frame(raw_data, self.ciphers)
         except Exception as e:
             logger.error(f"Failed to parse message: {e}")
             return None
     
+    async def _handle_control(self, raw_data: str):
+        """JSON 제어 프레임 처리
+        
+        - PINGPONG: 서버 heartbeat. 응답하지 않으면 서버가 세션을 끊으므로 그대로 돌려보냄
+        - 구독 응답: 요청별 ACK/NACK 반영, 암호화 채널의 key/iv 저장
+        """
+        try:
+            message = json.loads(raw_data)
+        except ValueError:
+            logger.warning(f"Malformed control frame: {raw_data[:100]}")
+            return
+        
+        header = message.get('header') or {}
+        tr_id = header.get('tr_id')
+        
+        if tr_id == 'PINGPONG':
+            self.pings += 1
+            await self.websocket.pong(raw_data)
+            return
+        
+        body = message.get('body') or {}
+        output = body.get('output') or {}
+        if output.get('key') and output.get('iv'):
+            self.ciphers[tr_id] = (output['key'], output['iv'])
+        
+        key = (tr_id, header.get('tr_key'))
+        request = self.pending.pop(key, None)
+        msg = body.get('msg1', '')
+        
+        if body.get('rt_cd') == '0' or 'ALREADY IN SUBSCRIBE' in msg:
+            self.acks += 1
+            if request is not None and request[0] == '2':
+                self.active.discard(key)
+            else:
+                self.active.add(key)
+            self.rejected.pop(key, None)
+        else:
+            self.nacks += 1
+            self.rejected[key] = msg
+            self.active.discard(key)
+            logger.warning(f"Subscription rejected {key}: {msg}")
+            if 'APPROVAL' in msg.upper() and not self.approval_rejected:
+                # 접속키가 거부되면 이 세션의 요청은 모두 실패하므로 닫고 새 키로 재연결
+                self.approval_rejected = True
+                await self.websocket.close()
+        
+        if key == (self.fill_tr_id, self.hts_id):
+            await self._notify_notice(key in self.active)
+        
+        if self._resubscribe_started is not None and not self.pending:
+            # 재연결 후 재구독 요청에 대한 응답이 모두 도착
+            latency = time.monotonic() - self._resubscribe_started
+            self._resubscribe_started = None
+            self.last_resubscribe_latency = latency
+            self.max_resubscribe_latency = max(self.max_resubscribe_latency, latency)
+            logger.info(f"Resubscribed {len(self.active)} channels in {latency * 1000:.0f}ms")
+    
+    def stale_requests(self) -> List[Tuple[str, str]]:
+        """ack_timeout이 지나도록 응답이 없는 등록/해제 요청"""
+        deadline = time.monotonic() - self.ack_timeout
+        return [key for key, (_, sent_at) in self.pending.items() if sent_at < deadline]
+    
+    def stats(self) -> Dict[str, object]:
+        """연결 품질 지표"""
+        return {
+            'reconnects': self.reconnects,
+            'pings': self.pings,
+            'acks': self.acks,
+            'nacks': self.nacks,
+            'active': len(self.active),
+            'pending': len(self.pending),
+            'stale': len(self.stale_requests()),
+            'last_resubscribe_latency': self.last_resubscribe_latency,
+            'max_resubscribe_latency': self.max_resubscribe_latency,
+        }
+    
     async def listen(self):
         """메시지 수신 루프"""
         if not self.websocket:
@@ -173,28 +290,48 @@ class KISWebSocketClient:
         
         logger.info("Started listening for messages")
         
-        try:
-            async for message in self.websocket:
-                if not self.running:
-                    break
-                
-                # 메시지 파싱
-                parsed = self._parse_message(message)
-                
-                if parsed and self.message_handler:
-                    try:
-                        self.message_handler(parsed)
-                    except Exception as e:
-                        logger.error(f"Error in message handler: {e}")
-        
-        except websockets.exceptions.ConnectionClosed:
-            logger.warning("WebSocket connection closed")
-            if self.running:
-                # 자동 재연결
-                await self._reconnect()
-        
-        except Exception as e:
-            logger.error(f"Error in listen loop: {e}")
+        while self.running:
+            try:
+                async for message in self.websocket:
+                    if not self.running:
+                        break
+                    
+                    if self.raw_handler:
+                        try:
+                            self.raw_handler(message)
+                        except Exception as e:
+                            logger.error(f"Error in raw handler: {e}")
+                    
+                    if message[:1] == '{':
+                        await self._handle_control(message)
+                        continue
+                    
+                    # 메시지 파싱 (한 프레임에 여러 레코드)
+                    parsed = self._parse_message(message)
+                    handler = self.handlers.get(parsed[0]) if parsed else None
+                    
+                    if handler:
+                        for record in parsed[1]:
+                            try:
+                                result = handler(record)
+                                if inspect.isawaitable(result):
+                                    await result
+                            except Exception as e:
+                                logger.error(f"Error in message handler: {e}")
+                else:
+                    # 서버가 정상 종료 프레임으로 끊은 경우
+                    if self.running:
+                        await self._reconnect()
+            
+            except websockets.exceptions.ConnectionClosed:
+                logger.warning("WebSocket connection closed")
+                if self.running:
+                    # 자동 재연결 후 수신 재개
+                    await self._reconnect()
+            
+            except Exception as e:
+                logger.error(f"Error in listen loop: {e}")
+                break
     
     async def _reconnect(self):
         """자동 재연결"""
@@ -203,15 +340,23 @@ class KISWebSocketClient:
         max_retries = 5
         retry_delay = 5
         
+        if self.approval_rejected:
+            get_token_manager(self.mode).invalidate_approval_key(self.approval_key)
+        
         for attempt in range(max_retries):
             try:
                 await self.connect()
+                self.reconnects += 1
+                self._resubscribe_started = time.monotonic()
                 
-                # 이전에 구독한 종목 재구독
+                # 이전에 구독한 종목 재구독 (응답이 모두 오면 재구독 지연 기록)
                 for stock_code in list(self.subscribed_stocks):
                     await self.subscribe(stock_code)
+                if self.fill_notices:
+                    await self.subscribe_fills()
                 
                 logger.info("Reconnection successful")
+                await self._notify_reconnect()
                 return
             
             except Exception as e:
@@ -221,25 +366,72 @@ class KISWebSocketClient:
         logger.error("Failed to reconnect after maximum retries")
         self.running = False
     
-    def set_message_handler(self, handler: Callable[[WebSocketMessage], None]):
+    def set_message_handler(self, handler: Callable[[object], Union[None, Awaitable[None]]],
+                            tr_id: str = TR_TRADE):
         """메시지 핸들러 설정
         
         Args:
-            handler: 메시지를 처리할 콜백 함수
+            handler: 레코드를 처리할 콜백 함수. 코루틴 함수면 수신 루프가 await하므로
+                무거운 처리는 TickDispatcher.put처럼 큐에 넘기고 바로 반환해야 함
+            tr_id: 처리할 실시간 채널 (기본: 체결 틱)
         """
-        self.message_handler = handler
+        self.handlers[tr_id] = handler
+    
+    def set_raw_handler(self, handler: Callable[[str], None]):
+        """원본 프레임 핸들러 설정 (수신 직후 파싱 전에 호출)"""
+        self.raw_handler = handler
+    
+    def set_reconnect_handler(self, handler: Callable[[List[str]], Union[None, Awaitable[None]]]):
+        """재연결 핸들러 설정 (재연결/재구독 직후 구독 종목 목록으로 호출)"""
+        self.reconnect_handler = handler
+    
+    def set_notice_handler(self, handler: Callable[[bool], Union[None, Awaitable[None]]]):
+        """체결통보 상태 핸들러 설정 (등록 ACK 시 True, 세션 재연결/NACK 시 False로 호출)"""
+        self.notice_handler = handler
+    
+    async def _notify_notice(self, active: bool):
+        if not self.notice_handler:
+            return
+        try:
+            result = self.notice_handler(active)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.error(f"Error in notice handler: {e}")
     
-    async def run(self, stock_codes: list):
+    async def _notify_reconnect(self):
+        if not self.reconnect_handler or not self.subscribed_stocks:
+            return
+        try:
+            result = self.reconnect_handler(sorted(self.subscribed_stocks))
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.error(f"Error in reconnect handler: {e}")
+    
+    async def run(self, stock_codes: Optional[list] = None):
         """WebSocket 실행 (연결, 구독, 수신)
         
         Args:
-            stock_codes: 구독할 종목 코드 리스트
+            stock_codes: 구독할 종목 코드 리스트. None이면 연결 시점의 subscribed_stocks
         """
         await self.connect()
+        if self.connected_once:
+            # 연결이 완전히 끊겼다가 다시 run()된 경우도 재연결로 취급
+            self.reconnects += 1
+            self._resubscribe_started = time.monotonic()
         
         # 종목 구독
+        if stock_codes is None:
+            stock_codes = list(self.subscribed_stocks)
         for stock_code in stock_codes:
             await self.subscribe(stock_code)
+        if self.fill_notices:
+            await self.subscribe_fills()
+        
+        if self.connected_once:
+            await self._notify_reconnect()
+        self.connected_once = True
         
         # 메시지 수신
         await self.listen()
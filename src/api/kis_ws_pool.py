@@ -0,0 +1,255 @@
+"""실시간 시세 WebSocket 연결 풀
+
+KIS는 세션 하나당 실시간 등록 종목 수를 제한하므로, 감시 종목을 여러 연결에
+나눠 구독한다. 각 연결은 KISWebSocketClient 하나이며 재연결/재구독을 스스로
+처리하고, 모든 연결이 tr_id별로 같은 메시지 핸들러(체결은 보통 TickDispatcher.put)로
+레코드를 넘기므로 수신 측에서는 하나의 스트림처럼 보인다.
+"""
+import asyncio
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Set, Union
+
+from ..config import get_config
+from ..logger import get_logger
+from .kis_websocket import KISWebSocketClient, TR_TRADE
+
+logger = get_logger(__name__)
+
+
+class KISWebSocketPool:
+    """종목 구독을 여러 WebSocket 세션에 분산하는 연결 관리자"""
+
+    def __init__(
+        self,
+        mode: Optional[str] = None,
+        max_per_connection: Optional[int] = None,
+        max_connections: Optional[int] = None,
+        client_factory: Callable[[], KISWebSocketClient] = None
+    ):
+        """
+        Args:
+            mode: 'mock' 또는 'real'. None이면 설정 파일에서 읽음
+            max_per_connection: 연결당 최대 구독 종목 수. None이면 websocket.max_subscriptions_per_connection을
+                종목당 등록 채널 수(websocket.channels)로 나눈 값
+            max_connections: 최대 연결 수. None이면 websocket.max_connections
+            client_factory: 연결 생성 함수 (기본: KISWebSocketClient(mode))
+        """
+        config = get_config()
+        self.mode = mode or config.get_trading_mode()
+        # KIS 등록 한도는 (종목, 채널) 단위이므로 채널 수만큼 나눔
+        channels = len(config.get('websocket.channels', [TR_TRADE]))
+        self.max_per_connection = max_per_connection or max(
+            config.get('websocket.max_subscriptions_per_connection', 40) // channels, 1
+        )
+        self.max_connections = max_connections or config.get('websocket.max_connections', 4)
+        self.client_factory = client_factory or (lambda: KISWebSocketClient(mode=self.mode))
+
+        self.connections: List[KISWebSocketClient] = []
+        self.tasks: Dict[int, asyncio.Task] = {}  # id(연결) -> 연결 유지 태스크
+        self.assignment: Dict[str, KISWebSocketClient] = {}  # 종목코드 -> 담당 연결
+        self.handlers: Dict[str, Callable[[object], Union[None, Awaitable[None]]]] = {}  # tr_id -> 핸들러
+        self.raw_handler: Optional[Callable[[str], None]] = None
+        self.reconnect_handler: Optional[Callable[[List[str]], Union[None, Awaitable[None]]]] = None
+        self.fill_notices = False
+        self.notice_client: Optional[KISWebSocketClient] = None  # 체결통보를 등록한 연결
+        self.notice_handler: Optional[Callable[[bool], Union[None, Awaitable[None]]]] = None
+        self.running = False
+        self.retry_delay = config.get('websocket.reconnect_delay', 5.0)
+
+    @property
+    def capacity(self) -> int:
+        return self.max_per_connection * self.max_connections
+
+    @property
+    def subscribed_stocks(self) -> Set[str]:
+        """풀 전체에 배정된 종목"""
+        return set(self.assignment)
+
+    @property
+    def connected(self) -> bool:
+        """하나 이상의 연결이 살아 있는지 여부"""
+        return any(client.running and client.websocket for client in self.connections)
+
+    def set_message_handler(self, handler: Callable[[object], Union[None, Awaitable[None]]],
+                            tr_id: str = TR_TRADE):
+        """모든 연결에 공통 메시지 핸들러 설정 (tr_id 채널별)"""
+        self.handlers[tr_id] = handler
+        for client in self.connections:
+            client.set_message_handler(handler, tr_id)
+
+    def set_raw_handler(self, handler: Callable[[str], None]):
+        """모든 연결에 공통 원본 프레임 핸들러 설정"""
+        self.raw_handler = handler
+        for client in self.connections:
+            client.set_raw_handler(handler)
+
+    def set_reconnect_handler(self, handler: Callable[[List[str]], Union[None, Awaitable[None]]]):
+        """모든 연결에 공통 재연결 핸들러 설정 (연결별로 재구독한 종목 목록 전달)"""
+        self.reconnect_handler = handler
+        for client in self.connections:
+            client.set_reconnect_handler(handler)
+    
+    def set_notice_handler(self, handler: Callable[[bool], Union[None, Awaitable[None]]]):
+        """체결통보 연결의 수신 상태 핸들러 설정"""
+        self.notice_handler = handler
+        if self.notice_client is not None:
+            self.notice_client.set_notice_handler(handler)
+    
+    def enable_fill_notices(self):
+        """체결통보 수신 설정 (연결 하나에만 등록, 종목이 없어도 그 연결은 유지)"""
+        self.fill_notices = True
+        if self.running and self.notice_client is None:
+            self._open_notice_connection()
+    
+    def _open_notice_connection(self):
+        self.notice_client = self._open_connection()
+        # 연결 태스크가 돌기 전에 설정하므로 run()에서 함께 등록됨
+        self.notice_client.fill_notices = True
+        if self.notice_handler:
+            self.notice_client.set_notice_handler(self.notice_handler)
+    
+    async def start(self, stock_codes: Iterable[str]):
+        """
+        풀 시작: 종목을 연결별로 나눠 배정하고 연결 태스크를 띄움
+
+        Args:
+            stock_codes: 구독할 종목 코드
+        """
+        self.running = True
+        if self.fill_notices and self.notice_client is None:
+            self._open_notice_connection()
+        await self.update(stock_codes)
+
+    async def stop(self):
+        """모든 연결 종료"""
+        self.running = False
+        for client in self.connections:
+            await client.disconnect()
+        for task in self.tasks.values():
+            task.cancel()
+        await asyncio.gather(*self.tasks.values(), return_exceptions=True)
+        self.tasks.clear()
+        self.connections.clear()
+        self.assignment.clear()
+        self.notice_client = None
+
+    async def update(self, stock_codes: Iterable[str]) -> List[str]:
+        """
+        감시 종목 변경 반영 (리밸런싱)
+
+        빠진 종목은 구독 해제하고, 새 종목은 여유가 가장 많은 연결에 배정한다.
+        연결이 모두 차 있으면 새 연결을 연다 (max_connections까지).
+
+        Returns:
+            용량 초과로 구독하지 못한 종목 (REST 폴백 대상)
+        """
+        targets = list(dict.fromkeys(stock_codes))
+        target_set = set(targets)
+
+        for code in [c for c in self.assignment if c not in target_set]:
+            client = self.assignment.pop(code)
+            await self._unsubscribe(client, code)
+
+        unassigned = []
+        for code in targets:
+            if code in self.assignment:
+                continue
+            client = self._pick_connection()
+            if client is None:
+                unassigned.append(code)
+                continue
+            self.assignment[code] = client
+            await self._subscribe(client, code)
+
+        await self._close_idle()
+
+        if unassigned:
+            logger.warning(f"WebSocket subscription capacity ({self.capacity}) exceeded, "
+                           f"{len(unassigned)} symbols left to REST polling")
+        return unassigned
+
+    def _load(self, client: KISWebSocketClient) -> int:
+        # 체결통보 등록도 세션 한도를 하나 차지함
+        notices = 1 if client is self.notice_client else 0
+        return notices + sum(1 for c in self.assignment.values() if c is client)
+
+    def _pick_connection(self) -> Optional[KISWebSocketClient]:
+        """여유가 가장 많은 연결 (모두 차 있으면 새 연결 생성)"""
+        candidates = [c for c in self.connections if self._load(c) < self.max_per_connection]
+        if candidates:
+            return min(candidates, key=self._load)
+        if len(self.connections) < self.max_connections:
+            return self._open_connection()
+        return None
+
+    def _open_connection(self) -> KISWebSocketClient:
+        client = self.client_factory()
+        for tr_id, handler in self.handlers.items():
+            client.set_message_handler(handler, tr_id)
+        if self.raw_handler:
+            client.set_raw_handler(self.raw_handler)
+        if self.reconnect_handler:
+            client.set_reconnect_handler(self.reconnect_handler)
+        self.connections.append(client)
+        self.tasks[id(client)] = asyncio.create_task(self._maintain(client))
+        logger.info(f"Opened WebSocket connection #{len(self.connections)}")
+        return client
+
+    async def _close_idle(self):
+        """배정 종목이 없는 연결 정리"""
+        idle = [c for c in self.connections
+                if c is not self.notice_client and not any(a is c for a in self.assignment.values())]
+        for client in idle:
+            self.connections.remove(client)
+            task = self.tasks.pop(id(client), None)
+            await client.disconnect()
+            if task:
+                task.cancel()
+            logger.info("Closed idle WebSocket connection")
+
+    async def _subscribe(self, client: KISWebSocketClient, code: str):
+        if client.running and client.websocket:
+            try:
+                await client.subscribe(code)
+                return
+            except Exception as e:
+                logger.warning(f"Failed to subscribe {code}: {e}")
+        # 아직 연결 전이거나 실패하면 연결(재연결) 시 함께 구독됨
+        client.subscribed_stocks.add(code)
+
+    async def _unsubscribe(self, client: KISWebSocketClient, code: str):
+        if client.running and client.websocket:
+            try:
+                await client.unsubscribe(code)
+                return
+            except Exception as e:
+                logger.warning(f"Failed to unsubscribe {code}: {e}")
+        client.subscribed_stocks.discard(code)
+
+    async def _maintain(self, client: KISWebSocketClient):
+        """연결 하나의 연결/구독/수신 유지 (완전히 끊기면 잠시 후 다시 연결)"""
+        while self.running and client in self.connections:
+            try:
+                # 연결 대기 중에 배정된 종목까지 연결 직후 한 번에 구독
+                await client.run()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"WebSocket connection unavailable: {e}")
+
+            if self.running and client in self.connections:
+                await asyncio.sleep(self.retry_delay)
+
+    def stats(self) -> Dict[str, object]:
+        """연결별 구독 종목 수 및 연결 품질 지표 합계"""
+        client_stats = [c.stats() for c in self.connections]
+        stats = {
+            'connections': len(self.connections),
+            'connected': sum(1 for c in self.connections if c.running and c.websocket),
+            'subscriptions': [self._load(c) for c in self.connections],
+        }
+        for key in ('reconnects', 'pings', 'acks', 'nacks', 'pending', 'stale'):
+            stats[key] = sum(s.get(key, 0) for s in client_stats)
+        stats['max_resubscribe_latency'] = max(
+            (s.get('max_resubscribe_latency', 0.0) for s in client_stats), default=0.0
+        )
+        return stats
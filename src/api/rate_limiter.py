@@ -0,0 +1,125 @@
+"""KIS API 요청 속도 제한 (토큰 버킷)"""
+import threading
+import time
+from enum import IntEnum
+from typing import Dict, Optional
+from ..config import get_config
+from ..logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class Priority(IntEnum):
+    """요청 우선순위 (값이 작을수록 먼저 처리)"""
+    ORDER = 0    # 주문
+    QUOTE = 1    # 시세 조회
+    BALANCE = 2  # 잔고/포지션 조회
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 capacity개까지 쌓이는 토큰 버킷"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def wait_time(self, now: float) -> float:
+        """토큰 1개를 쓸 수 있을 때까지 남은 시간 (초)"""
+        self._refill(now)
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def consume(self):
+        self.tokens -= 1
+
+
+class RateLimiter:
+    """
+    초당/분당 토큰 버킷을 함께 적용하는 스레드 안전 속도 제한기
+
+    대기 중인 상위 우선순위 요청이 있으면 하위 우선순위 요청은 토큰을 가져가지
+    못하므로, 시세 조회가 몰려도 주문이 먼저 나간다.
+    """
+
+    def __init__(self, requests_per_second: float = 5, requests_per_minute: float = 100):
+        self.buckets = [
+            TokenBucket(requests_per_second, requests_per_second),
+            TokenBucket(requests_per_minute / 60.0, requests_per_minute),
+        ]
+        self._condition = threading.Condition()
+        self._waiting = {priority: 0 for priority in Priority}
+        self._paused_until = 0.0
+
+    def acquire(self, priority: Priority = Priority.QUOTE, timeout: Optional[float] = None) -> bool:
+        """
+        요청 토큰 획득 (필요하면 블로킹 대기)
+
+        Args:
+            priority: 요청 우선순위
+            timeout: 최대 대기 시간 (초). None이면 무제한
+
+        Returns:
+            토큰 획득 여부 (timeout 초과 시 False)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._condition:
+            self._waiting[priority] += 1
+            try:
+                while True:
+                    now = time.monotonic()
+
+                    higher_waiting = any(self._waiting[p] for p in Priority if p < priority)
+                    wait = max(
+                        [self._paused_until - now] + [bucket.wait_time(now) for bucket in self.buckets]
+                    )
+
+                    if not higher_waiting and wait <= 0:
+                        for bucket in self.buckets:
+                            bucket.consume()
+                        return True
+
+                    if deadline is not None:
+                        remaining = deadline - now
+                        if remaining <= 0:
+                            return False
+                        wait = min(wait, remaining) if wait > 0 else remaining
+
+                    # 상위 우선순위 대기 중이면 토큰 소진/알림 시점까지 대기
+                    self._condition.wait(wait if wait > 0 else None)
+            finally:
+                self._waiting[priority] -= 1
+                self._condition.notify_all()
+
+    def pause(self, seconds: float):
+        """서버가 속도 초과를 알린 경우 모든 요청을 잠시 멈춤"""
+        with self._condition:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            for bucket in self.buckets:
+                bucket.tokens = 0
+            logger.warning(f"Rate limit hit, pausing requests for {seconds:.1f}s")
+            self._condition.notify_all()
+
+
+# 모드(mock/real)별 전역 속도 제한기 (앱키 단위로 제한되므로 프로세스에서 공유)
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(mode: str) -> RateLimiter:
+    """모드별 속도 제한기 가져오기 (싱글톤)"""
+    with _limiters_lock:
+        if mode not in _limiters:
+            config = get_config()
+            _limiters[mode] = RateLimiter(
+                requests_per_second=config.get('api.rate_limit.requests_per_second', 5),
+                requests_per_minute=config.get('api.rate_limit.requests_per_minute', 100)
+            )
+        return _limiters[mode]
@@ -0,0 +1,306 @@
+"""KIS API 접근 토큰 관리 (프로세스 전역)"""
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+import requests
+
+from ..config import get_config
+from ..logger import get_logger
+
+logger = get_logger(__name__)
+
+# /oauth2/tokenP는 앱키당 1분에 1회만 호출 가능
+TOKEN_ISSUE_INTERVAL = 60.0
+
+# 모드별 파일로 나뉘기 전의 토큰 파일 (token_dir 기준, 설정된 거래 모드의 토큰)
+LEGACY_TOKEN_FILE = 'kis_token.json'
+
+
+class TokenManager:
+    """
+    모드(mock/real)별 접근 토큰 관리자
+
+    메모리에 토큰 하나만 두고 모든 KISAPIClient가 공유한다. 갱신은 락으로
+    직렬화하므로 동시에 여러 요청이 만료를 감지해도 /oauth2/tokenP는 한 번만
+    호출되며, 발급 제한(1분 1회) 안에서는 재시도하지 않고 기존 토큰을 쓴다.
+    """
+
+    def __init__(self, mode: str, token_file: Optional[str] = None):
+        """
+        Args:
+            mode: 'mock' 또는 'real'
+            token_file: 토큰 저장 파일 (기본: {api.token.dir}/kis_token_{mode}.json)
+        """
+        self.config = get_config()
+        self.mode = mode
+        credentials = self.config.get_credentials(mode)
+
+        self.base_url = credentials.get('base_url')
+        self.app_key = credentials.get('app_key')
+        self.app_secret = credentials.get('app_secret')
+        self.timeout = self.config.get('api.request_timeout', 10)
+        self.refresh_margin = timedelta(minutes=self.config.get('api.token.refresh_margin_minutes', 30))
+        # 실시간 접속키 유효 기간 (발급 후 24시간)
+        self.approval_key_ttl = self.config.get('api.token.approval_key_ttl_hours', 24) * 3600
+
+        token_dir = self.config.get('api.token.dir', 'data')
+        self.token_file = token_file or os.path.join(token_dir, f"kis_token_{mode}.json")
+        # 이전 버전은 거래 모드 하나의 토큰만 kis_token.json에 저장했음
+        self.legacy_token_file = (
+            os.path.join(token_dir, LEGACY_TOKEN_FILE)
+            if token_file is None and mode == self.config.get_trading_mode() else None
+        )
+
+        self._access_token: Optional[str] = None
+        self._expires_at: Optional[datetime] = None
+        self._last_issue_attempt: Optional[float] = None  # time.monotonic() 기준
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._auto_refresh = False
+        self._approval_key: Optional[str] = None
+        self._approval_key_issued_at: Optional[float] = None  # time.monotonic() 기준
+        self.session = requests.Session()  # 발급 호출용 keep-alive 세션
+
+        self._load()
+
+    @property
+    def expires_at(self) -> Optional[datetime]:
+        return self._expires_at
+
+    def _is_valid(self, margin: timedelta = timedelta(minutes=5)) -> bool:
+        """토큰이 margin 이후까지 유효한지 확인"""
+        return (
+            self._access_token is not None
+            and self._expires_at is not None
+            and datetime.now() < self._expires_at - margin
+        )
+
+    def _load(self):
+        """
+        저장된 토큰 로드
+
+        모드별 파일이 없으면 이전 버전의 토큰 파일을 읽고, 유효하면 모드별 파일로 옮겨
+        저장한다 (업그레이드 직후 불필요한 재발급 방지).
+        """
+        try:
+            path = self.token_file
+            if not os.path.exists(path):
+                if not (self.legacy_token_file and os.path.exists(self.legacy_token_file)):
+                    return
+                path = self.legacy_token_file
+
+            with open(path, 'r') as f:
+                data = json.load(f)
+            expires_at = datetime.fromisoformat(data.get('expires_at'))
+
+            if datetime.now() < expires_at:
+                self._access_token = data.get('access_token')
+                self._expires_at = expires_at
+                logger.info(f"Loaded valid {self.mode} token from {path} (expires: {expires_at})")
+                if path != self.token_file:
+                    self._save()
+            else:
+                logger.info(f"Saved {self.mode} token is expired")
+        except Exception as e:
+            logger.warning(f"Failed to load token: {e}")
+
+    def _save(self):
+        """토큰 파일 저장 (임시 파일에 쓴 뒤 교체하므로 다른 프로세스가 반쯤 쓴 파일을 읽지 않음)"""
+        try:
+            directory = os.path.dirname(self.token_file) or '.'
+            os.makedirs(directory, exist_ok=True)
+
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.kis_token_', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump({
+                        'access_token': self._access_token,
+                        'expires_at': self._expires_at.isoformat()
+                    }, f)
+                os.replace(tmp_path, self.token_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            logger.info("Token saved to file")
+        except Exception as e:
+            logger.warning(f"Failed to save token: {e}")
+
+    def get_token(self) -> Optional[str]:
+        """
+        유효한 접근 토큰 반환 (만료 5분 전이면 갱신)
+
+        Returns:
+            접근 토큰. 발급 실패 시 기존 토큰(없으면 None)
+        """
+        if self._is_valid():
+            return self._access_token
+
+        with self._lock:
+            # 락 대기 중 다른 스레드가 이미 갱신했을 수 있음
+            if self._is_valid():
+                return self._access_token
+            self._issue()
+            return self._access_token
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        토큰 선제 갱신
+
+        Args:
+            force: True면 유효 기간과 관계없이 재발급
+
+        Returns:
+            갱신 후 토큰 유효 여부
+        """
+        with self._lock:
+            if force or not self._is_valid(self.refresh_margin):
+                self._issue()
+            return self._is_valid(timedelta(0))
+
+    def _issue(self):
+        """OAuth2 토큰 발급 (락을 잡은 상태에서 호출)"""
+        if self._last_issue_attempt is not None:
+            elapsed = time.monotonic() - self._last_issue_attempt
+            if elapsed < TOKEN_ISSUE_INTERVAL:
+                logger.warning(f"Token issue skipped: last attempt {elapsed:.0f}s ago (limit 1/min)")
+                return
+        self._last_issue_attempt = time.monotonic()
+
+        logger.info(f"Refreshing {self.mode} access token...")
+        url = f"{self.base_url}/oauth2/tokenP"
+        data = {
+            "grant_type": "client_credentials",
+            "appkey": self.app_key,
+            "appsecret": self.app_secret
+        }
+
+        try:
+            response = self.session.post(
+                url, json=data, headers={"Content-Type": "application/json"}, timeout=self.timeout
+            )
+            response.raise_for_status()
+
+            token_data = response.json()
+            self._access_token = token_data.get('access_token')
+            expires_in = token_data.get('expires_in', 86400)  # 기본 24시간
+            self._expires_at = datetime.now() + timedelta(seconds=expires_in)
+
+            self._save()
+            logger.info(f"Access token obtained successfully, expires at {self._expires_at}")
+        except requests.exceptions.HTTPError as e:
+            if e.response.status_code == 403:
+                # Rate limit (1분당 1회 제한)
+                logger.warning("Token refresh rate limited (1/min).")
+                if not self._access_token:
+                    logger.error("No valid token available and refresh limit hit.")
+            else:
+                logger.error(f"HTTP error during token refresh: {e.response.status_code} - {e.response.text}")
+        except Exception as e:
+            logger.error(f"Failed to refresh token: {type(e).__name__}: {e}")
+
+    def get_approval_key(self) -> Optional[str]:
+        """
+        실시간(WebSocket) 접속키 발급 (/oauth2/Approval)
+
+        발급한 키는 유효 기간(approval_key_ttl) 동안 모든 연결이 공유하고, 만료되거나
+        invalidate_approval_key()로 무효화되면 다시 발급한다.
+
+        Returns:
+            접속키. 발급 실패 시 None
+        """
+        with self._lock:
+            if self._approval_key:
+                if time.monotonic() - self._approval_key_issued_at < self.approval_key_ttl:
+                    return self._approval_key
+                logger.info(f"WebSocket approval key expired ({self.mode})")
+                self._approval_key = None
+
+            url = f"{self.base_url}/oauth2/Approval"
+            data = {
+                "grant_type": "client_credentials",
+                "appkey": self.app_key,
+                "secretkey": self.app_secret
+            }
+            try:
+                response = self.session.post(
+                    url, json=data, headers={"Content-Type": "application/json"}, timeout=self.timeout
+                )
+                response.raise_for_status()
+                self._approval_key = response.json().get('approval_key')
+                self._approval_key_issued_at = time.monotonic()
+                logger.info(f"WebSocket approval key obtained ({self.mode})")
+            except Exception as e:
+                logger.error(f"Failed to get approval key: {type(e).__name__}: {e}")
+            return self._approval_key
+
+    def invalidate_approval_key(self, key: Optional[str] = None):
+        """
+        서버가 거부한 접속키 폐기 (다음 get_approval_key()에서 재발급)
+
+        Args:
+            key: 거부된 접속키. 그 사이 다른 연결이 이미 재발급했으면 새 키는 유지
+        """
+        with self._lock:
+            if self._approval_key and (key is None or key == self._approval_key):
+                logger.warning(f"WebSocket approval key invalidated ({self.mode})")
+                self._approval_key = None
+                self._approval_key_issued_at = None
+
+    def start_auto_refresh(self):
+        """만료 refresh_margin 전에 백그라운드에서 토큰을 갱신하도록 예약"""
+        with self._lock:
+            self._auto_refresh = True
+        self._schedule()
+
+    def stop_auto_refresh(self):
+        """백그라운드 갱신 중지"""
+        with self._lock:
+            self._auto_refresh = False
+            if self._timer:
+                self._timer.cancel()
+                self._timer = None
+
+    def _schedule(self):
+        with self._lock:
+            if not self._auto_refresh:
+                return
+            if self._timer:
+                self._timer.cancel()
+
+            if self._expires_at is None:
+                delay = 0.0
+            else:
+                refresh_at = self._expires_at - self.refresh_margin
+                delay = max((refresh_at - datetime.now()).total_seconds(), 0.0)
+            # 발급 실패 시 발급 제한 간격 뒤에 재시도
+            if self._last_issue_attempt is not None:
+                delay = max(delay, TOKEN_ISSUE_INTERVAL - (time.monotonic() - self._last_issue_attempt))
+
+            self._timer = threading.Timer(delay, self._auto_refresh_tick)
+            self._timer.daemon = True
+            self._timer.start()
+            logger.debug(f"Next {self.mode} token refresh in {delay:.0f}s")
+
+    def _auto_refresh_tick(self):
+        try:
+            self.refresh()
+        finally:
+            self._schedule()
+
+
+# 모드별 전역 토큰 관리자
+_managers: Dict[str, TokenManager] = {}
+_managers_lock = threading.Lock()
+
+
+def get_token_manager(mode: str) -> TokenManager:
+    """모드별 토큰 관리자 가져오기 (싱글톤)"""
+    with _managers_lock:
+        if mode not in _managers:
+            _managers[mode] = TokenManager(mode)
+        return _managers[mode]
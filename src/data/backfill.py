@@ -0,0 +1,187 @@
+"""WebSocket 재연결 시 누락 구간 분봉 보충
+
+종목별로 마지막 스트림 틱의 체결 시각과 누적 거래량을 기억해 두었다가, 재연결이
+되면 끊긴 동안 완성되었어야 할 분봉을 REST 당일분봉조회로 받아 BarAggregator에
+시간 순서대로 끼워 넣는다. 보충이 끝날 때까지 해당 종목의 실시간 틱은 잠시 보류했다가
+보충 봉 뒤에 순서대로 흘려보내므로, 지표 상태가 공백 없이 이어진다 (재워밍업 불필요).
+"""
+import asyncio
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from ..api.kis_models import MinuteBar
+from ..api.kis_parser import Tick
+from ..config import get_config
+from ..logger import get_logger
+from .bar_aggregator import BarAggregator
+
+logger = get_logger(__name__)
+
+
+def _shift_minute(hhmmss: str, minutes: int) -> str:
+    """HHMMSS를 분 단위로 이동 (초는 00으로 맞춤)"""
+    moment = datetime.strptime(hhmmss[:4], '%H%M') + timedelta(minutes=minutes)
+    return moment.strftime('%H%M00')
+
+
+class GapBackfiller:
+    """재연결 공백 감지 및 REST 분봉 보충기"""
+
+    def __init__(
+        self,
+        client,
+        aggregator: BarAggregator,
+        release: Callable[[Tick], Awaitable[None]],
+        concurrency: int = None
+    ):
+        """
+        Args:
+            client: KISAPIClient (get_minute_bars 제공)
+            aggregator: 보충 봉을 넣을 봉 집계기
+            release: 보류했던 실시간 틱을 다시 처리할 코루틴 함수
+            concurrency: 동시에 보충할 종목 수. None이면 websocket.backfill.concurrency
+        """
+        config = get_config()
+        self.client = client
+        self.aggregator = aggregator
+        self.release = release
+        self.concurrency = concurrency or config.get('websocket.backfill.concurrency', 4)
+
+        self.last: Dict[str, Tuple[str, int]] = {}  # 종목 -> (마지막 체결 시각, 누적 거래량)
+        self.held: Dict[str, List[Tick]] = {}  # 보충 중인 종목 -> 보류한 실시간 틱
+        self.splicing = False  # 보충 봉을 집계기에 넣는 중인지 (봉 콜백에서 주문 억제용)
+        self._tasks: Set[asyncio.Task] = set()
+
+        self.gaps = 0
+        self.bars_spliced = 0
+        self.failures = 0
+
+    def tracking(self, stock_code: str) -> bool:
+        """스트림 틱을 한 번이라도 받아 공백을 감지할 수 있는 종목인지"""
+        return stock_code in self.last
+
+    def hold(self, tick: Tick) -> bool:
+        """
+        실시간 틱 관찰 (수신 루프에서 호출)
+
+        Returns:
+            보충 중이라 틱을 보류했으면 True (호출 측은 처리하지 않음)
+        """
+        held = self.held.get(tick.stock_code)
+        if held is not None:
+            held.append(tick)
+            return True
+        self.last[tick.stock_code] = (tick.time, tick.cum_volume)
+        return False
+
+    def discard(self, stock_code: str):
+        """감시 종목에서 빠진 종목 정리"""
+        self.last.pop(stock_code, None)
+
+    def on_reconnect(self, stock_codes: List[str]):
+        """재연결 핸들러: 보충을 별도 태스크로 실행 (수신 루프는 바로 재개)"""
+        task = asyncio.get_running_loop().create_task(self.backfill(stock_codes))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def backfill(self, stock_codes: List[str], now: datetime = None):
+        """
+        누락 구간 보충
+
+        마지막 틱의 분과 현재 분 사이에 완전히 빠진 분봉이 있는 종목만 REST로
+        조회한다. 조회는 종목별로 병렬 실행하며 요청 간격은 KISAPIClient의
+        속도 제한기가 맞춘다.
+
+        Args:
+            stock_codes: 재구독한 종목
+            now: 기준 시각. None이면 현재 시각
+        """
+        current = (now or datetime.now()).strftime('%H%M00')
+        gaps = {}
+        for code in stock_codes:
+            if code not in self.last or code in self.held:
+                continue
+            # 마지막 틱이 속한 분 다음부터 현재 분 직전까지 (경계 분은 실시간 틱으로 채워짐)
+            start, end = self.last[code][0][:4] + '59', _shift_minute(current, -1)
+            if start < end:
+                gaps[code] = (start, end)
+
+        if not gaps:
+            return
+
+        self.gaps += len(gaps)
+        for code in gaps:
+            self.held[code] = []
+        logger.info(f"Backfilling {len(gaps)} symbols after reconnect")
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch(code: str, start: str, end: str) -> Optional[List[MinuteBar]]:
+            async with semaphore:
+                try:
+                    return await asyncio.to_thread(self.client.get_minute_bars, code, start, end)
+                except Exception as e:
+                    self.failures += 1
+                    logger.warning(f"[{code}] Backfill failed: {e}")
+                    return None
+
+        codes = list(gaps)
+        results = await asyncio.gather(*(fetch(code, *gaps[code]) for code in codes))
+
+        for code, bars in zip(codes, results):
+            spliced_volume = self._splice(code, bars or [])
+            await self._release(code, spliced_volume)
+
+    def _splice(self, stock_code: str, bars: List[MinuteBar]) -> int:
+        """분봉을 시간 순서대로 집계기에 반영 (분봉 하나 = 시/고/저/종 의사 틱 4개)"""
+        volume = 0
+        self.splicing = True
+        try:
+            for bar in bars:
+                day = datetime.strptime(bar.date, '%Y%m%d').date() if bar.date else None
+                for price, qty in ((bar.open, 0), (bar.high, 0), (bar.low, 0), (bar.close, bar.volume)):
+                    self.aggregator.update(Tick(
+                        stock_code, bar.time, price, 0, 0.0, bar.open, bar.high, bar.low,
+                        0, 0, qty, 0
+                    ), day)
+                volume += bar.volume
+            self.bars_spliced += len(bars)
+        finally:
+            self.splicing = False
+        return volume
+
+    async def _release(self, stock_code: str, spliced_volume: int):
+        """보류한 실시간 틱을 순서대로 다시 처리하고 보충 상태 해제"""
+        held = self.held[stock_code]
+        if held:
+            # 누적 거래량으로 보충 후에도 남은 공백(경계 분의 일부 체결 등) 확인
+            first = held[0]
+            _, last_cum = self.last.get(stock_code, ('', 0))
+            missing = first.cum_volume - first.volume - last_cum - spliced_volume
+            if last_cum and missing:
+                logger.debug(f"[{stock_code}] Unfilled volume after backfill: {missing}")
+
+        # 처리 중 도착한 틱까지 비운 뒤, 대기 없이 보류 해제 (순서 보장)
+        while held:
+            tick = held.pop(0)
+            self.last[stock_code] = (tick.time, tick.cum_volume)
+            try:
+                await self.release(tick)
+            except Exception as e:
+                logger.error(f"[{stock_code}] Error releasing held tick: {e}")
+        del self.held[stock_code]
+
+    async def stop(self):
+        """진행 중인 보충 태스크 정리"""
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'gaps': self.gaps,
+            'bars_spliced': self.bars_spliced,
+            'failures': self.failures,
+            'holding': len(self.held),
+        }
@@ -0,0 +1,252 @@
+"""실시간 틱 → OHLCV 봉 집계기
+
+종목/봉 단위별로 진행 중인 봉 하나만 들고 틱마다 고가/저가/종가/거래량을
+갱신하므로 틱당 O(봉 단위 수)이다. 틱의 체결 시각이 다음 구간으로 넘어가거나
+roll()로 시간이 지나면 완성된 봉을 콜백으로 내보내고 저장 대기열에 쌓는다.
+
+REST 폴백 시세처럼 실제 체결이 아닌 값이 섞인 봉(synthetic)은 전략에는 전달하되
+저장 대기열에는 넣지 않으므로 백테스트가 읽는 이력에 남지 않는다.
+"""
+from datetime import date, datetime, time, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from ..api.kis_parser import Tick
+from ..database.repository import MarketDataRepository
+from ..logger import get_logger
+
+logger = get_logger(__name__)
+
+# 봉 단위별 구간 길이 (초). 일봉은 거래일 단위
+TIMEFRAME_SECONDS = {
+    '1m': 60,
+    '5m': 300,
+    '30m': 1800,
+    '1d': 86400,
+}
+
+
+class Bar:
+    """OHLCV 봉"""
+
+    __slots__ = ('stock_code', 'timeframe', 'start', 'open', 'high', 'low', 'close', 'volume',
+                 'day', 'bucket', 'synthetic')
+
+    def __init__(self, stock_code: str, timeframe: str, day: date, bucket: int,
+                 price: int, volume: int, synthetic: bool = False):
+        self.stock_code = stock_code
+        self.timeframe = timeframe
+        self.day = day
+        self.bucket = bucket  # 구간 시작 (자정 기준 초)
+        self.start = datetime.combine(day, time()) + timedelta(seconds=bucket)
+        self.open = self.high = self.low = self.close = price
+        self.volume = volume
+        self.synthetic = synthetic  # 실제 체결이 아닌 시세가 섞임 (저장하지 않음)
+
+    def as_market_data(self) -> dict:
+        """전략 analyze()에 넘길 시장 데이터 (Backtester와 같은 키)"""
+        return {
+            'current_price': self.close,
+            'open': self.open,
+            'high': self.high,
+            'low': self.low,
+            'volume': self.volume
+        }
+
+    def __repr__(self) -> str:
+        return (f"Bar({self.stock_code} {self.timeframe} {self.start:%Y-%m-%d %H:%M} "
+                f"O{self.open} H{self.high} L{self.low} C{self.close} V{self.volume})")
+
+
+class BarAggregator:
+    """여러 종목의 틱을 여러 봉 단위로 동시에 집계"""
+
+    def __init__(self, timeframes: Iterable[str] = ('1m', '5m', '30m', '1d'),
+                 session_close: Optional[time] = None):
+        """
+        Args:
+            timeframes: 집계할 봉 단위 (TIMEFRAME_SECONDS의 키)
+            session_close: 장 마감 시각 (일봉 완성 기준). None이면 자정
+        """
+        unknown = [tf for tf in timeframes if tf not in TIMEFRAME_SECONDS]
+        if unknown:
+            raise ValueError(f"Unsupported timeframes: {unknown}")
+
+        self.timeframes = [(tf, TIMEFRAME_SECONDS[tf]) for tf in timeframes]
+        self.session_close = session_close
+        self.bars: Dict[Tuple[str, str], Bar] = {}  # (종목, 봉 단위) -> 진행 중인 봉
+        self.completed: Dict[Tuple[str, str], Tuple[date, int]] = {}  # 마지막 완성 봉 (일자, 구간)
+        self.pending: List[Bar] = []  # 저장 대기 중인 완성 봉
+        self.handlers: List[Callable[[Bar], None]] = []
+        self.trade_date: Optional[date] = None  # None이면 오늘 날짜
+
+    def add_handler(self, handler: Callable[[Bar], None]):
+        """완성 봉 콜백 등록"""
+        self.handlers.append(handler)
+
+    def update(self, tick: Tick, trade_date: date = None, synthetic: bool = False):
+        """
+        틱 반영
+
+        Args:
+            tick: 체결 틱 (tick.time = HHMMSS)
+            trade_date: 체결 일자. None이면 self.trade_date 또는 오늘
+            synthetic: 실제 체결이 아닌 시세 (REST 폴백). 이 틱이 들어간 봉은 저장하지 않음
+        """
+        day = trade_date or self.trade_date or date.today()
+        t = tick.time
+        seconds = int(t[0:2]) * 3600 + int(t[2:4]) * 60 + int(t[4:6])
+
+        for timeframe, length in self.timeframes:
+            bucket = seconds - seconds % length
+            key = (tick.stock_code, timeframe)
+            bar = self.bars.get(key)
+
+            if bar is not None and bar.bucket == bucket and bar.day == day:
+                price = tick.price
+                if price > bar.high:
+                    bar.high = price
+                elif price < bar.low:
+                    bar.low = price
+                bar.close = price
+                bar.volume += tick.volume
+                if synthetic:
+                    bar.synthetic = True
+                continue
+
+            if bar is not None:
+                if bar.day == day and bucket < bar.bucket:
+                    # 이미 지나간 구간의 지연 틱은 무시
+                    continue
+                self._complete(bar)
+            else:
+                last = self.completed.get(key)
+                if last is not None and (day, bucket) <= last:
+                    # roll()로 이미 완성된 구간의 지연 틱: 같은 구간 봉을 다시 열지 않음
+                    continue
+
+            self.bars[key] = Bar(tick.stock_code, timeframe, day, bucket, tick.price, tick.volume,
+                                 synthetic)
+
+    def roll(self, now: datetime = None) -> List[Bar]:
+        """
+        구간이 끝났는데 다음 틱이 오지 않은 봉을 완성 처리 (주기적으로 호출)
+
+        Args:
+            now: 기준 시각. None이면 현재 시각
+
+        Returns:
+            완성된 봉 목록
+        """
+        now = now or datetime.now()
+        closed = []
+        for key, bar in list(self.bars.items()):
+            if bar.timeframe == '1d':
+                # 일봉은 장 종료 후 다음 거래일 첫 틱 또는 flush()로 완성
+                continue
+            if now >= self._end(bar):
+                del self.bars[key]
+                self._complete(bar)
+                closed.append(bar)
+        return closed
+
+    def flush(self, now: datetime = None) -> List[Bar]:
+        """
+        종료 시 진행 중인 봉 정리
+
+        구간이 끝난 봉(장 마감 이후의 일봉 포함)만 완성해 저장 대기열에 넣고, 아직 끝나지 않은
+        봉은 버린다. 잘린 봉이 저장되면 같은 날 재시작해도 덮어쓸 수 없고, 종료 중에 전략이
+        주문을 내지 않도록 핸들러는 호출하지 않는다.
+
+        Args:
+            now: 기준 시각. None이면 현재 시각
+
+        Returns:
+            완성된 봉 목록
+        """
+        now = now or datetime.now()
+        closed = []
+        for bar in self.bars.values():
+            if now >= self._end(bar):
+                self._complete(bar, notify=False)
+                closed.append(bar)
+            else:
+                logger.info(f"Discarding incomplete bar on flush: {bar}")
+        self.bars.clear()
+        return closed
+
+    def _end(self, bar: Bar) -> datetime:
+        """봉 구간 종료 시각 (일봉은 장 마감 시각)"""
+        if bar.timeframe == '1d' and self.session_close is not None:
+            return datetime.combine(bar.day, self.session_close)
+        return bar.start + timedelta(seconds=TIMEFRAME_SECONDS[bar.timeframe])
+
+    def _complete(self, bar: Bar, notify: bool = True):
+        self.completed[(bar.stock_code, bar.timeframe)] = (bar.day, bar.bucket)
+        if not bar.synthetic:
+            self.pending.append(bar)
+        if not notify:
+            return
+        for handler in self.handlers:
+            try:
+                handler(bar)
+            except Exception as e:
+                logger.error(f"Error in bar handler: {e}")
+
+    def drain(self) -> Dict[Tuple[str, str], pd.DataFrame]:
+        """
+        저장 대기 중인 완성 봉을 (종목, 봉 단위)별 DataFrame으로 꺼냄
+
+        Returns:
+            {(stock_code, timeframe): DataFrame['date', 'open', 'high', 'low', 'close', 'volume']}
+        """
+        pending, self.pending = self.pending, []
+        groups: Dict[Tuple[str, str], List[Bar]] = {}
+        for bar in pending:
+            groups.setdefault((bar.stock_code, bar.timeframe), []).append(bar)
+
+        return {
+            key: pd.DataFrame({
+                'date': [b.start for b in bars],
+                'open': [b.open for b in bars],
+                'high': [b.high for b in bars],
+                'low': [b.low for b in bars],
+                'close': [b.close for b in bars],
+                'volume': [b.volume for b in bars],
+            })
+            for key, bars in groups.items()
+        }
+
+
+def write_bars(frames: Dict[Tuple[str, str], pd.DataFrame], db, store=None) -> int:
+    """
+    완성 봉 일괄 저장 (MarketData 벌크 업서트 + 선택적으로 OHLCV 저장소 추가)
+
+    frames는 이미 대기열에서 꺼낸 봉이므로 DB 저장이 실패해도 저장소에는 추가한다.
+
+    Args:
+        frames: BarAggregator.drain() 결과
+        db: Database 인스턴스
+        store: OHLCVStore (백테스트용 로컬 저장소). None이면 DB에만 저장
+
+    Returns:
+        DB에 저장한 봉 개수 (DB 저장 실패 시 0)
+    """
+    if not frames:
+        return 0
+
+    written = 0
+    try:
+        with db.get_session() as session:
+            for (stock_code, timeframe), df in frames.items():
+                written += MarketDataRepository.bulk_upsert(session, stock_code, timeframe, df)
+    except Exception as e:
+        logger.error(f"Failed to save bars: {e}")
+        written = 0
+
+    if store is not None:
+        for (stock_code, timeframe), df in frames.items():
+            store.append(stock_code, timeframe, df)
+
+    return written
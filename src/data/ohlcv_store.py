@@ -0,0 +1,199 @@
+"""과거 OHLCV 로컬 저장소
+
+종목/봉 단위별로 파티션을 나누고, 컬럼마다 고정 폭 바이너리 파일 하나에
+append-only로 기록한다. 읽을 때는 np.memmap으로 매핑하므로 수년치 분봉도
+파일 복사나 ORM 객체 생성 없이 바로 NumPy/pandas로 사용할 수 있다.
+
+디렉토리 구조:
+    {root}/{timeframe}/{stock_code}/{column}.bin
+"""
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..config import get_config
+from ..logger import get_logger
+
+logger = get_logger(__name__)
+
+# 컬럼 스키마 (리틀 엔디언 고정 폭). timestamp는 epoch 기준 나노초
+COLUMNS = (
+    ('timestamp', np.dtype('<i8')),
+    ('open', np.dtype('<f8')),
+    ('high', np.dtype('<f8')),
+    ('low', np.dtype('<f8')),
+    ('close', np.dtype('<f8')),
+    ('volume', np.dtype('<i8')),
+)
+
+
+class OHLCVStore:
+    """종목/봉 단위별 컬럼형 OHLCV 저장소"""
+
+    def __init__(self, root: str = None):
+        """
+        Args:
+            root: 저장소 루트 디렉토리. None이면 설정값 data.ohlcv_store.path 사용
+        """
+        self.root = Path(root or get_config().get('data.ohlcv_store.path', 'data/ohlcv'))
+
+    def _partition(self, stock_code: str, timeframe: str) -> Path:
+        return self.root / timeframe / stock_code
+
+    def _row_counts(self, partition: Path) -> Dict[str, int]:
+        counts = {}
+        for name, dtype in COLUMNS:
+            path = partition / f"{name}.bin"
+            counts[name] = path.stat().st_size // dtype.itemsize if path.exists() else 0
+        return counts
+
+    def count(self, stock_code: str, timeframe: str) -> int:
+        """저장된 봉 개수 (중단된 기록으로 컬럼 길이가 다르면 가장 짧은 길이)"""
+        return min(self._row_counts(self._partition(stock_code, timeframe)).values())
+
+    def append(self, stock_code: str, timeframe: str, df: pd.DataFrame) -> int:
+        """
+        봉 데이터 추가 (append-only)
+
+        마지막 저장 시각 이후의 봉만 기록하므로 같은 구간을 다시 넣어도 중복되지 않는다.
+
+        Args:
+            stock_code: 종목 코드
+            timeframe: 봉 단위 ('1m', '5m', '30m', '1d' 등)
+            df: ['date' 또는 'timestamp', 'open', 'high', 'low', 'close', 'volume'] 컬럼
+
+        Returns:
+            실제로 추가된 봉 개수
+        """
+        if df.empty:
+            return 0
+
+        partition = self._partition(stock_code, timeframe)
+        partition.mkdir(parents=True, exist_ok=True)
+
+        time_column = 'timestamp' if 'timestamp' in df.columns else 'date'
+        timestamps = pd.to_datetime(df[time_column]).to_numpy(dtype='datetime64[ns]').astype(np.int64)
+        order = np.argsort(timestamps, kind='stable')
+        timestamps = timestamps[order]
+
+        # 이전 기록이 중간에 끊겼으면 가장 짧은 컬럼 길이에 맞춰 복구
+        counts = self._row_counts(partition)
+        rows = min(counts.values())
+        if any(c != rows for c in counts.values()):
+            logger.warning(f"Repairing partial write in {partition} (truncating to {rows} rows)")
+            for name, dtype in COLUMNS:
+                path = partition / f"{name}.bin"
+                if path.exists():
+                    with open(path, 'r+b') as f:
+                        f.truncate(rows * dtype.itemsize)
+
+        # 마지막 저장 시각 이후 + 배치 내 중복 시각 제거
+        keep = np.ones(len(timestamps), dtype=bool)
+        keep[1:] = timestamps[1:] != timestamps[:-1]
+        if rows > 0:
+            last = np.memmap(partition / "timestamp.bin", dtype=COLUMNS[0][1], mode='r')[rows - 1]
+            keep &= timestamps > last
+
+        if not keep.any():
+            return 0
+
+        columns = {'timestamp': timestamps[keep]}
+        for name, dtype in COLUMNS[1:]:
+            columns[name] = df[name].to_numpy()[order][keep]
+
+        for name, dtype in COLUMNS:
+            with open(partition / f"{name}.bin", 'ab') as f:
+                f.write(np.ascontiguousarray(columns[name], dtype=dtype).tobytes())
+
+        added = int(keep.sum())
+        logger.debug(f"Appended {added} bars to {stock_code}/{timeframe}")
+        return added
+
+    def last_timestamp(self, stock_code: str, timeframe: str) -> Optional[datetime]:
+        """마지막으로 저장된 봉 시각"""
+        rows = self.count(stock_code, timeframe)
+        if rows == 0:
+            return None
+
+        path = self._partition(stock_code, timeframe) / "timestamp.bin"
+        last = np.memmap(path, dtype=COLUMNS[0][1], mode='r')[rows - 1]
+        return pd.Timestamp(int(last)).to_pydatetime()
+
+    def load_arrays(
+        self,
+        stock_code: str,
+        timeframe: str,
+        start: datetime = None,
+        end: datetime = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        컬럼별 메모리 맵 배열 조회 (복사 없음, 읽기 전용)
+
+        Args:
+            stock_code: 종목 코드
+            timeframe: 봉 단위
+            start: 시작 시각 (포함)
+            end: 종료 시각 (포함)
+
+        Returns:
+            {'timestamp': int64 ns, 'open': ..., 'volume': ...}. 데이터가 없으면 빈 딕셔너리
+        """
+        partition = self._partition(stock_code, timeframe)
+        rows = self.count(stock_code, timeframe)
+        if rows == 0:
+            return {}
+
+        arrays = {
+            name: np.memmap(partition / f"{name}.bin", dtype=dtype, mode='r', shape=(rows,))
+            for name, dtype in COLUMNS
+        }
+
+        # 시각 순으로 저장되므로 이진 탐색으로 구간 슬라이스
+        timestamps = arrays['timestamp']
+        lo = np.searchsorted(timestamps, pd.Timestamp(start).value, side='left') if start is not None else 0
+        hi = np.searchsorted(timestamps, pd.Timestamp(end).value, side='right') if end is not None else rows
+
+        return {name: array[lo:hi] for name, array in arrays.items()}
+
+    def load(
+        self,
+        stock_code: str,
+        timeframe: str,
+        start: datetime = None,
+        end: datetime = None
+    ) -> pd.DataFrame:
+        """
+        구간 OHLCV를 DataFrame으로 조회
+
+        Returns:
+            DataFrame with columns: ['date', 'open', 'high', 'low', 'close', 'volume']
+        """
+        arrays = self.load_arrays(stock_code, timeframe, start, end)
+        if not arrays:
+            return pd.DataFrame(columns=['date', 'open', 'high', 'low', 'close', 'volume'])
+
+        return pd.DataFrame({
+            'date': arrays['timestamp'].view('datetime64[ns]'),
+            'open': arrays['open'],
+            'high': arrays['high'],
+            'low': arrays['low'],
+            'close': arrays['close'],
+            'volume': arrays['volume']
+        }, copy=False)
+
+    def load_recent(self, stock_code: str, timeframe: str, days: int) -> pd.DataFrame:
+        """
+        마지막 저장 봉 기준 최근 days일 구간 조회
+
+        Args:
+            stock_code: 종목 코드
+            timeframe: 봉 단위
+            days: 조회 일수
+        """
+        end = self.last_timestamp(stock_code, timeframe)
+        if end is None:
+            return self.load(stock_code, timeframe)
+        return self.load(stock_code, timeframe, start=end - pd.Timedelta(days=days), end=end)
@@ -0,0 +1,145 @@
+"""실시간 10단계 호가창 (H0STASP0)
+
+종목마다 (4, 10) int64 배열 하나를 미리 할당해 두고 호가 메시지가 올 때마다
+제자리에서 덮어쓴다. 최우선 호가, 스프레드, 잔량 합계, 불균형 같은 지표를
+REST 조회 없이 바로 계산할 수 있다.
+"""
+from typing import Dict, Optional
+
+import numpy as np
+
+from ..api.kis_parser import QuoteUpdate
+
+# levels 배열의 행
+ASK_PRICE = 0
+BID_PRICE = 1
+ASK_QTY = 2
+BID_QTY = 3
+
+DEPTH = 10
+
+
+class OrderBook:
+    """종목 하나의 10단계 호가창"""
+
+    __slots__ = ('stock_code', 'time', 'levels', '_flat', 'total_ask_qty', 'total_bid_qty', 'updates')
+
+    def __init__(self, stock_code: str):
+        self.stock_code = stock_code
+        self.time = ''
+        # 행: 매도호가, 매수호가, 매도잔량, 매수잔량 / 열: 1~10단계 (KIS 필드 순서와 동일)
+        self.levels = np.zeros((4, DEPTH), dtype=np.int64)
+        self._flat = self.levels.reshape(-1)
+        self.total_ask_qty = 0
+        self.total_bid_qty = 0
+        self.updates = 0
+
+    def apply(self, update: QuoteUpdate):
+        """호가 메시지 반영 (배열 재할당 없음)"""
+        f, b = update.fields, update.base
+        self._flat[:] = f[b + QuoteUpdate.LEVELS_START:b + QuoteUpdate.LEVELS_END]
+        self.total_ask_qty = int(f[b + QuoteUpdate.TOTAL_ASK_QTY])
+        self.total_bid_qty = int(f[b + QuoteUpdate.TOTAL_BID_QTY])
+        self.time = update.time
+        self.updates += 1
+
+    @property
+    def ready(self) -> bool:
+        """양쪽 최우선 호가가 모두 있는지 여부"""
+        return self.updates > 0 and self.levels[ASK_PRICE, 0] > 0 and self.levels[BID_PRICE, 0] > 0
+
+    @property
+    def best_ask(self) -> int:
+        return int(self.levels[ASK_PRICE, 0])
+
+    @property
+    def best_bid(self) -> int:
+        return int(self.levels[BID_PRICE, 0])
+
+    @property
+    def spread(self) -> int:
+        return self.best_ask - self.best_bid
+
+    @property
+    def mid(self) -> float:
+        return (self.best_ask + self.best_bid) / 2
+
+    def depth(self, side: str, levels: int = DEPTH) -> int:
+        """
+        상위 levels단계 잔량 합계
+
+        Args:
+            side: 'ask' 또는 'bid'
+            levels: 합산할 단계 수
+        """
+        row = ASK_QTY if side == 'ask' else BID_QTY
+        return int(self.levels[row, :levels].sum())
+
+    def imbalance(self, levels: int = DEPTH) -> float:
+        """
+        잔량 불균형 (매수 - 매도) / (매수 + 매도), -1 ~ 1 (양수면 매수 우위)
+
+        Args:
+            levels: 합산할 단계 수
+        """
+        bid = self.depth('bid', levels)
+        ask = self.depth('ask', levels)
+        total = bid + ask
+        return (bid - ask) / total if total else 0.0
+
+    def marketable_price(self, order_type: str, quantity: int) -> Optional[int]:
+        """
+        quantity를 즉시 체결시킬 수 있는 지정가 (상대 호가를 잔량만큼 누적)
+
+        Args:
+            order_type: 'BUY' 또는 'SELL'
+            quantity: 주문 수량
+
+        Returns:
+            지정가. 호가가 없거나 10단계 잔량으로 부족하면 None
+        """
+        buy = order_type.upper() == 'BUY'
+        prices = self.levels[ASK_PRICE if buy else BID_PRICE]
+        sizes = self.levels[ASK_QTY if buy else BID_QTY]
+
+        remaining = quantity
+        for price, size in zip(prices.tolist(), sizes.tolist()):
+            if price <= 0:
+                break
+            remaining -= size
+            if remaining <= 0:
+                return price
+        return None
+
+    def features(self, levels: int = 5) -> dict:
+        """전략 market_data에 넣을 호가 지표"""
+        return {
+            'best_bid': self.best_bid,
+            'best_ask': self.best_ask,
+            'spread': self.spread,
+            'bid_depth': self.depth('bid', levels),
+            'ask_depth': self.depth('ask', levels),
+            'imbalance': self.imbalance(levels),
+        }
+
+
+class OrderBooks:
+    """종목별 호가창 모음"""
+
+    def __init__(self):
+        self.books: Dict[str, OrderBook] = {}
+
+    def apply(self, update: QuoteUpdate):
+        """호가 메시지를 해당 종목 호가창에 반영 (WebSocket 핸들러)"""
+        book = self.books.get(update.stock_code)
+        if book is None:
+            book = self.books[update.stock_code] = OrderBook(update.stock_code)
+        book.apply(update)
+
+    def get(self, stock_code: str) -> Optional[OrderBook]:
+        """호가가 준비된 종목의 호가창 (없으면 None)"""
+        book = self.books.get(stock_code)
+        return book if book is not None and book.ready else None
+
+    def discard(self, stock_code: str):
+        self.books.pop(stock_code, None)
@@ -0,0 +1,267 @@
+"""실시간 틱 기록기 및 재생기
+
+수신한 원본 프레임과 파싱된 틱을 일자별 세그먼트 파일에 append-only로 기록한다.
+
+    {root}/{YYYYMMDD}.ticks  파싱된 틱 (TICK_DTYPE 고정 폭 레코드, np.memmap으로 읽음)
+    {root}/{YYYYMMDD}.raw    원본 프레임 (수신 시각 int64 + 길이 uint32 + UTF-8 바이트)
+
+TickReplay는 기록된 세션을 KISWebSocketClient와 같은 핸들러 인터페이스(Tick 단위
+콜백)로 다시 흘려보내므로 시뮬레이션/회귀 테스트를 실제 체결 흐름으로 돌릴 수 있다.
+"""
+import asyncio
+import inspect
+import struct
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Awaitable, Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from ..api.kis_parser import Tick
+from ..config import get_config
+from ..logger import get_logger
+
+logger = get_logger(__name__)
+
+# 틱 레코드 스키마 (리틀 엔디언 고정 폭). recv_ns는 수신 시각(epoch 나노초)
+TICK_DTYPE = np.dtype([
+    ('recv_ns', '<i8'),
+    ('stock_code', 'S6'),
+    ('time', 'S6'),
+    ('price', '<i8'),
+    ('change', '<i8'),
+    ('change_rate', '<f8'),
+    ('open', '<i8'),
+    ('high', '<i8'),
+    ('low', '<i8'),
+    ('ask', '<i8'),
+    ('bid', '<i8'),
+    ('volume', '<i8'),
+    ('cum_volume', '<i8'),
+])
+
+RAW_HEADER = struct.Struct('<qI')  # (수신 시각 ns, 프레임 바이트 길이)
+
+
+class TickRecorder:
+    """일자별 세그먼트 파일에 틱을 기록하는 append-only 기록기"""
+
+    def __init__(self, root: str = None, flush_size: int = None):
+        """
+        Args:
+            root: 저장 디렉토리. None이면 설정값 data.tick_store.path 사용
+            flush_size: 메모리에 모았다가 한 번에 쓸 틱 수. None이면 data.tick_store.flush_size
+        """
+        config = get_config()
+        self.root = Path(root or config.get('data.tick_store.path', 'data/ticks'))
+        self.flush_size = flush_size or config.get('data.tick_store.flush_size', 4096)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        self._ticks: List[tuple] = []
+        self._raw: List[bytes] = []
+        self._day: Optional[str] = None
+        self._day_end_ns = 0
+        self.recorded = 0
+
+    def _segment(self, day: str, suffix: str) -> Path:
+        return self.root / f"{day}.{suffix}"
+
+    def _roll(self, recv_ns: int):
+        """수신 시각이 현재 세그먼트 일자를 벗어나면 버퍼를 비우고 새 일자로 전환"""
+        if recv_ns < self._day_end_ns and self._day is not None:
+            return
+        self.flush()
+        moment = datetime.fromtimestamp(recv_ns / 1e9)
+        self._day = moment.strftime('%Y%m%d')
+        next_day = datetime(moment.year, moment.month, moment.day) + timedelta(days=1)
+        self._day_end_ns = int(next_day.timestamp() * 1e9)
+
+    def record(self, tick: Tick, recv_ns: int = None):
+        """
+        파싱된 틱 기록
+
+        Args:
+            tick: 체결 틱
+            recv_ns: 수신 시각 (epoch 나노초). None이면 현재 시각
+        """
+        recv_ns = recv_ns or time.time_ns()
+        if recv_ns >= self._day_end_ns:
+            self._roll(recv_ns)
+
+        self._ticks.append((
+            recv_ns, tick.stock_code, tick.time, tick.price, tick.change, tick.change_rate,
+            tick.open, tick.high, tick.low, tick.ask, tick.bid, tick.volume, tick.cum_volume
+        ))
+        if len(self._ticks) >= self.flush_size:
+            self._flush_ticks()
+
+    def record_raw(self, raw: str, recv_ns: int = None):
+        """
+        원본 프레임 기록
+
+        Args:
+            raw: 수신한 원본 문자열
+            recv_ns: 수신 시각 (epoch 나노초). None이면 현재 시각
+        """
+        recv_ns = recv_ns or time.time_ns()
+        if recv_ns >= self._day_end_ns:
+            self._roll(recv_ns)
+
+        data = raw.encode('utf-8')
+        self._raw.append(RAW_HEADER.pack(recv_ns, len(data)) + data)
+        if len(self._raw) >= self.flush_size:
+            self._flush_raw()
+
+    def _flush_ticks(self):
+        if not self._ticks:
+            return
+        # 튜플 리스트를 한 번에 구조화 배열로 변환 (틱마다 numpy 스칼라를 만들지 않음)
+        batch = np.array(self._ticks, dtype=TICK_DTYPE)
+        with open(self._segment(self._day, 'ticks'), 'ab') as f:
+            f.write(batch.tobytes())
+        self.recorded += len(batch)
+        self._ticks.clear()
+
+    def _flush_raw(self):
+        if not self._raw:
+            return
+        with open(self._segment(self._day, 'raw'), 'ab') as f:
+            f.write(b''.join(self._raw))
+        self._raw.clear()
+
+    def flush(self):
+        """버퍼에 남은 틱/프레임을 파일에 기록"""
+        self._flush_ticks()
+        self._flush_raw()
+
+    close = flush
+
+    def days(self) -> List[str]:
+        """기록된 일자 목록 (YYYYMMDD, 오름차순)"""
+        return sorted(path.stem for path in self.root.glob('*.ticks'))
+
+    def load(self, day: str) -> np.ndarray:
+        """
+        일자별 틱을 메모리 맵 구조화 배열로 조회 (복사 없음, 읽기 전용)
+
+        Args:
+            day: 일자 (YYYYMMDD)
+        """
+        path = self._segment(day, 'ticks')
+        if not path.exists() or path.stat().st_size < TICK_DTYPE.itemsize:
+            return np.empty(0, dtype=TICK_DTYPE)
+        # 기록 중 중단된 마지막 레코드는 무시
+        rows = path.stat().st_size // TICK_DTYPE.itemsize
+        return np.memmap(path, dtype=TICK_DTYPE, mode='r', shape=(rows,))
+
+    def iter_raw(self, day: str) -> Iterator[Tuple[int, str]]:
+        """
+        일자별 원본 프레임 순회
+
+        Yields:
+            (수신 시각 ns, 원본 문자열)
+        """
+        path = self._segment(day, 'raw')
+        if not path.exists():
+            return
+        data = np.memmap(path, dtype=np.uint8, mode='r')
+        view = memoryview(data)
+        offset, size = 0, len(data)
+        while offset + RAW_HEADER.size <= size:
+            recv_ns, length = RAW_HEADER.unpack_from(view, offset)
+            offset += RAW_HEADER.size
+            if offset + length > size:
+                break
+            yield recv_ns, bytes(view[offset:offset + length]).decode('utf-8')
+            offset += length
+
+
+class TickReplay:
+    """기록된 틱을 핸들러로 다시 흘려보내는 재생 소스"""
+
+    def __init__(
+        self,
+        recorder: TickRecorder,
+        days: Iterable[str] = None,
+        speed: float = 0,
+        stock_codes: Iterable[str] = None
+    ):
+        """
+        Args:
+            recorder: 틱 기록기 (저장 위치)
+            days: 재생할 일자 목록. None이면 기록된 모든 일자
+            speed: 재생 배속 (1.0 = 실제 속도). 0이면 대기 없이 최대 속도
+            stock_codes: 재생할 종목. None이면 전 종목
+        """
+        self.recorder = recorder
+        self.days = list(days) if days is not None else recorder.days()
+        self.speed = speed
+        self.stock_codes = set(stock_codes) if stock_codes else None
+        self.message_handler: Optional[Callable[[Tick], Union[None, Awaitable[None]]]] = None
+        self.running = False
+        self.replayed = 0
+
+    def set_message_handler(self, handler: Callable[[Tick], Union[None, Awaitable[None]]]):
+        """메시지 핸들러 설정 (KISWebSocketClient와 동일한 인터페이스)"""
+        self.message_handler = handler
+
+    def iter_ticks(self, chunk_size: int = 65536) -> Iterator[Tuple[int, Tick]]:
+        """
+        기록된 틱 순회
+
+        Yields:
+            (수신 시각 ns, Tick)
+        """
+        codes = {code.encode() for code in self.stock_codes} if self.stock_codes else None
+
+        for day in self.days:
+            data = self.recorder.load(day)
+            for start in range(0, len(data), chunk_size):
+                chunk = data[start:start + chunk_size]
+                if codes is not None:
+                    chunk = chunk[np.isin(chunk['stock_code'], list(codes))]
+                # 청크 단위로 파이썬 값으로 변환해 틱 생성 비용을 줄임
+                for row in chunk.tolist():
+                    yield row[0], Tick(
+                        row[1].decode(), row[2].decode(), row[3], row[4], row[5],
+                        row[6], row[7], row[8], row[9], row[10], row[11], row[12]
+                    )
+
+    async def run(self):
+        """재생 시작 (모든 틱을 보내면 반환)"""
+        if not self.message_handler:
+            raise RuntimeError("Message handler not set")
+
+        self.running = True
+        start_wall = time.monotonic()
+        start_recv = None
+        logger.info(f"Replaying ticks for {self.days} (speed={self.speed or 'max'})")
+
+        try:
+            for recv_ns, tick in self.iter_ticks():
+                if not self.running:
+                    break
+
+                if self.speed > 0:
+                    if start_recv is None:
+                        start_recv = recv_ns
+                    delay = (recv_ns - start_recv) / 1e9 / self.speed - (time.monotonic() - start_wall)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                elif self.replayed % 1000 == 0:
+                    # 최대 속도에서도 다른 태스크가 돌 수 있도록 주기적으로 양보
+                    await asyncio.sleep(0)
+
+                result = self.message_handler(tick)
+                if inspect.isawaitable(result):
+                    await result
+                self.replayed += 1
+        finally:
+            self.running = False
+
+        logger.info(f"Replay finished: {self.replayed} ticks")
+
+    def stop(self):
+        """재생 중지"""
+        self.running = False
@@ -1,17 +1,47 @@
 """데이터베이스 연결 및 세션 관리"""
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session
 from contextlib import contextmanager
 from typing import Generator
 from pathlib import Path
 
-from .models import Base
+from .models import Base, MarketData
 from ..config import get_config
 from ..logger import get_logger
 
 logger = get_logger(__name__)
 
 
+def migrate_market_data_index(engine: Engine) -> bool:
+    """
+    market_data의 (stock_code, timeframe, timestamp) 인덱스를 유니크로 전환
+    
+    이전 버전에서 만든 비유니크 인덱스는 create_all()이 그대로 두므로 ON CONFLICT
+    업서트가 실패한다. 중복 행은 가장 최근에 저장된 행(id 최대)만 남기고 인덱스를 다시 만든다.
+    
+    Returns:
+        인덱스를 다시 만들었으면 True
+    """
+    index = next(i for i in MarketData.__table__.indexes if i.name == 'idx_stock_timeframe_timestamp')
+    existing = {i['name']: i for i in inspect(engine).get_indexes(MarketData.__tablename__)}
+    current = existing.get(index.name)
+    if current is not None and current['unique']:
+        return False
+    
+    with engine.begin() as conn:
+        deleted = conn.execute(text(
+            "DELETE FROM market_data WHERE id NOT IN ("
+            "SELECT MAX(id) FROM market_data GROUP BY stock_code, timeframe, timestamp)"
+        )).rowcount
+        if current is not None:
+            conn.execute(text(f"DROP INDEX {index.name}"))
+        index.create(bind=conn)
+    
+    logger.warning(f"Recreated {index.name} as unique index (removed {deleted} duplicate rows)")
+    return True
+
+
 class Database:
     """데이터베이스 관리 클래스"""
     
@@ -59,6 +89,7 @@ class Database:
     def create_tables(self):
         """테이블 생성"""
         Base.metadata.create_all(bind=self.engine)
+        migrate_market_data_index(self.engine)
         logger.info("Database tables created")
     
     def drop_tables(self):
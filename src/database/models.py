@@ -101,7 +101,8 @@ class MarketData(Base):
     timestamp = Column(DateTime, nullable=False, index=True)
     
     __table_args__ = (
-        Index('idx_stock_timeframe_timestamp', 'stock_code', 'timeframe', 'timestamp'),
+        # 벌크 업서트(ON CONFLICT)의 충돌 대상이므로 유니크 인덱스
+        Index('idx_stock_timeframe_timestamp', 'stock_code', 'timeframe', 'timestamp', unique=True),
     )
 
 
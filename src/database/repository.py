@@ -1,8 +1,11 @@
 """데이터베이스 레포지토리"""
+import io
 from datetime import datetime
 from typing import List, Optional
+import numpy as np
+import pandas as pd
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, select
 
 from .models import Trade, PositionHistory, Prediction, AccountSnapshot, MarketData
 from ..api.kis_models import OrderResponse, Position, AccountBalance
@@ -156,3 +159,148 @@ class MarketDataRepository:
             query = query.filter(MarketData.timestamp >= start_date)
         
         return query.order_by(desc(MarketData.timestamp)).limit(limit).all()
+    
+    # DataFrame 컬럼 → MarketData 컬럼
+    OHLCV_COLUMNS = {
+        'open': 'open_price',
+        'high': 'high_price',
+        'low': 'low_price',
+        'close': 'close_price',
+        'volume': 'volume',
+    }
+    
+    @staticmethod
+    def _to_frame(stock_code: str, timeframe: str, df: pd.DataFrame) -> pd.DataFrame:
+        """업서트용 정규화 (정수 변환, 배치 내 중복 시각은 마지막 값 사용)"""
+        time_column = 'timestamp' if 'timestamp' in df.columns else 'date'
+        frame = pd.DataFrame({
+            'stock_code': stock_code,
+            'timeframe': timeframe,
+            'timestamp': pd.to_datetime(df[time_column]).to_numpy()
+        })
+        for source, target in MarketDataRepository.OHLCV_COLUMNS.items():
+            frame[target] = np.rint(df[source].to_numpy(dtype=float)).astype(np.int64)
+        
+        return frame.drop_duplicates(subset='timestamp', keep='last')
+    
+    @staticmethod
+    def bulk_upsert(session: Session, stock_code: str, timeframe: str,
+                    df: pd.DataFrame) -> int:
+        """
+        OHLCV 일괄 저장 ((stock_code, timeframe, timestamp) 기준 업서트)
+        
+        PostgreSQL은 임시 테이블로 COPY 후 INSERT ... ON CONFLICT 한 번,
+        SQLite는 ON CONFLICT 업서트를 executemany 한 번으로 실행한다.
+        그 외 DB는 NotImplementedError.
+        
+        Args:
+            session: DB 세션
+            stock_code: 종목 코드
+            timeframe: 봉 단위 ('1m', '5m', '1h', '1d')
+            df: ['date' 또는 'timestamp', 'open', 'high', 'low', 'close', 'volume'] 컬럼
+        
+        Returns:
+            처리한 봉 개수
+        """
+        if df.empty:
+            return 0
+        
+        dialect = session.get_bind().dialect.name
+        if dialect not in ('postgresql', 'sqlite'):
+            raise NotImplementedError(f"bulk_upsert is not supported for database dialect '{dialect}'")
+        
+        frame = MarketDataRepository._to_frame(stock_code, timeframe, df)
+        
+        if dialect == 'postgresql':
+            MarketDataRepository._copy_upsert(session, frame)
+            return len(frame)
+        
+        rows = [
+            {**row, 'timestamp': ts}
+            for row, ts in zip(
+                frame.drop(columns='timestamp').to_dict('records'),
+                frame['timestamp'].dt.to_pydatetime()
+            )
+        ]
+        update_columns = list(MarketDataRepository.OHLCV_COLUMNS.values())
+        
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+        stmt = sqlite_insert(MarketData)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['stock_code', 'timeframe', 'timestamp'],
+            set_={column: stmt.excluded[column] for column in update_columns}
+        )
+        
+        session.execute(stmt, rows)
+        logger.debug(f"Upserted {len(rows)} {timeframe} bars for {stock_code}")
+        return len(rows)
+    
+    @staticmethod
+    def _copy_upsert(session: Session, frame: pd.DataFrame):
+        """PostgreSQL COPY 기반 업서트"""
+        columns = ['stock_code', 'timeframe', 'timestamp'] + list(MarketDataRepository.OHLCV_COLUMNS.values())
+        buffer = io.StringIO()
+        frame[columns].to_csv(buffer, index=False, header=False)
+        buffer.seek(0)
+        
+        column_list = ', '.join(columns)
+        updates = ', '.join(f"{c} = EXCLUDED.{c}" for c in MarketDataRepository.OHLCV_COLUMNS.values())
+        
+        cursor = session.connection().connection.cursor()
+        try:
+            cursor.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS market_data_staging ("
+                "stock_code VARCHAR(20), timeframe VARCHAR(10), timestamp TIMESTAMP, "
+                "open_price INTEGER, high_price INTEGER, low_price INTEGER, "
+                "close_price INTEGER, volume BIGINT) ON COMMIT DELETE ROWS"
+            )
+            cursor.copy_expert(f"COPY market_data_staging ({column_list}) FROM STDIN WITH (FORMAT csv)", buffer)
+            cursor.execute(
+                f"INSERT INTO {MarketData.__tablename__} ({column_list}) "
+                f"SELECT {column_list} FROM market_data_staging "
+                f"ON CONFLICT (stock_code, timeframe, timestamp) DO UPDATE SET {updates}"
+            )
+            cursor.execute("TRUNCATE market_data_staging")
+        finally:
+            cursor.close()
+        
+        logger.debug(f"COPY upserted {len(frame)} bars")
+    
+    @staticmethod
+    def get_ohlcv_frame(session: Session, stock_code: str, timeframe: str,
+                        start_date: datetime = None, end_date: datetime = None,
+                        limit: int = None) -> pd.DataFrame:
+        """
+        OHLCV 데이터를 DataFrame으로 조회 (ORM 객체 생성 없음, 시간 오름차순)
+        
+        Args:
+            limit: 지정 시 가장 최근 limit개 봉만 조회
+        
+        Returns:
+            DataFrame with columns: ['date', 'open', 'high', 'low', 'close', 'volume']
+        """
+        stmt = select(
+            MarketData.timestamp, MarketData.open_price, MarketData.high_price,
+            MarketData.low_price, MarketData.close_price, MarketData.volume
+        ).where(
+            MarketData.stock_code == stock_code,
+            MarketData.timeframe == timeframe
+        )
+        
+        if start_date:
+            stmt = stmt.where(MarketData.timestamp >= start_date)
+        if end_date:
+            stmt = stmt.where(MarketData.timestamp <= end_date)
+        
+        if limit:
+            stmt = stmt.order_by(desc(MarketData.timestamp)).limit(limit)
+        else:
+            stmt = stmt.order_by(MarketData.timestamp)
+        
+        rows = session.execute(stmt).all()
+        df = pd.DataFrame(rows, columns=['date', 'open', 'high', 'low', 'close', 'volume'])
+        df['date'] = pd.to_datetime(df['date'])
+        
+        if limit:
+            df = df.iloc[::-1].reset_index(drop=True)
+        return df
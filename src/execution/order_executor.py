@@ -1,7 +1,9 @@
 """주문 실행 엔진"""
 import asyncio
-from typing import Optional
-from ..api import KISAPIClient, OrderRequest, OrderResponse, AccountBalance, Position
+from datetime import date
+from typing import Callable, Dict, List, Optional
+from ..api import get_kis_client, OrderRequest, OrderResponse, AccountBalance, Position
+from ..api.kis_parser import Fill
 from .mock_executor import MockExecutor
 from ..config import get_config
 from ..logger import get_logger
@@ -21,11 +23,22 @@ class OrderExecutor:
         self.mode = mode or self.config.get_trading_mode()
         
         # KIS API 클라이언트 사용 (mock 또는 real)
-        self.executor = KISAPIClient(mode=self.mode)
+        self.executor = get_kis_client(self.mode)
         logger.info(f"OrderExecutor initialized in {self.mode.upper()} mode using KIS API")
         
         # 주문 제한 설정
         self.max_retries = self.config.get('api.max_retries', 3)
+        
+        # 체결통보로 갱신하는 주문/포지션 상태
+        # positions_synced는 체결통보 등록이 ACK된 뒤 잔고를 다시 맞췄을 때만 True이며,
+        # 그 전이나 통보가 끊긴 동안에는 get_positions()가 REST로 조회한다.
+        # 주문번호 -> 진행 중인 주문. 전량 체결/거부/취소되면 제거하고, 당일 주문이므로
+        # 날짜가 바뀌면 남은 미체결 주문도 비운다.
+        self.orders: Dict[str, OrderResponse] = {}
+        self.orders_date = date.today()
+        self.positions: Dict[str, Position] = {}
+        self.positions_synced = False
+        self.fill_handlers: List[Callable[[Fill], None]] = []
     
     def validate_order(self, order: OrderRequest) -> tuple[bool, str]:
         """주문 유효성 검사
@@ -83,6 +96,9 @@ class OrderExecutor:
         # 실행 (비동기 래핑)
         try:
             response = await asyncio.to_thread(self.executor.place_order, order)
+            self._expire_orders()
+            if response.order_id and response.status not in ("rejected", "error"):
+                self.orders[response.order_id.lstrip('0')] = response
             
             logger.info(f"Order {response.status}: {response.order_id} | Message: {response.message}")
             return response
@@ -104,5 +120,108 @@ class OrderExecutor:
         return await asyncio.to_thread(self.executor.get_account_balance)
     
     async def get_positions(self) -> list[Position]:
-        """보유 포지션 조회"""
-        return await asyncio.to_thread(self.executor.get_positions)
+        """보유 포지션 조회 (체결통보 수신 중에는 통보로 유지한 상태를 반환, 아니면 REST 조회)"""
+        if not self.positions_synced:
+            await self.sync_positions()
+        return list(self.positions.values())
+    
+    async def sync_positions(self):
+        """잔고 조회로 포지션 상태 초기화"""
+        positions = await asyncio.to_thread(self.executor.get_positions)
+        self.positions = {p.stock_code: p for p in positions}
+        logger.info(f"Positions synced: {len(self.positions)} holdings")
+    
+    async def on_notice_status(self, active: bool):
+        """체결통보 수신 상태 변경 (KISWebSocketClient 알림 핸들러)
+        
+        등록 ACK를 받으면 끊긴 동안의 체결을 반영하도록 잔고를 다시 조회한 뒤 통보 기반으로
+        전환하고, 재연결/NACK로 통보가 끊기면 다시 REST 조회로 돌아간다.
+        """
+        if not active:
+            if self.positions_synced:
+                logger.warning("Execution notices inactive; positions fall back to REST")
+            self.positions_synced = False
+            return
+        
+        try:
+            await self.sync_positions()
+        except Exception as e:
+            logger.error(f"Failed to sync positions after notice subscription: {e}")
+            return
+        self.positions_synced = True
+    
+    def add_fill_handler(self, handler: Callable[[Fill], None]):
+        """체결 콜백 등록"""
+        self.fill_handlers.append(handler)
+    
+    def on_fill(self, fill: Fill):
+        """실시간 체결통보 처리 (WebSocket 수신 루프에서 호출)
+        
+        접수/거부 통보는 주문 상태만 갱신하고, 체결 통보는 주문 체결수량과
+        포지션(수량, 평균단가)을 갱신한다. 거부/취소/전량 체결로 끝난 주문은 orders에서 제거한다.
+        """
+        self._expire_orders()
+        order_no = fill.order_no.lstrip('0')
+        order = self.orders.get(order_no)
+        
+        if fill.rejected:
+            if order is not None:
+                order.status = "rejected"
+                del self.orders[order_no]
+            logger.warning(f"Order rejected: {fill}")
+            return
+        if not fill.filled:
+            if fill.cancelled:
+                cancelled = self.orders.pop(fill.orig_order_no.lstrip('0'), None)
+                if cancelled is not None:
+                    cancelled.status = "cancelled"
+                    logger.info(f"Order cancelled: {cancelled.order_id}")
+            elif order is not None and order.status == "submitted":
+                order.status = "accepted"
+            return
+        
+        if order is not None:
+            order.filled_quantity += fill.quantity
+            order.status = "filled" if order.filled_quantity >= order.quantity else "partially_filled"
+            if order.status == "filled":
+                del self.orders[order_no]
+        
+        self._apply_fill(fill)
+        logger.info(f"Order filled: {fill.order_type} {fill.stock_code} {fill.quantity}주 @ {fill.price:,}원")
+        
+        for handler in self.fill_handlers:
+            try:
+                handler(fill)
+            except Exception as e:
+                logger.error(f"Error in fill handler: {e}")
+    
+    def _expire_orders(self):
+        """날짜가 바뀌면 전날 미체결 주문 제거 (당일 주문은 장 종료 시 소멸)"""
+        today = date.today()
+        if self.orders_date != today:
+            if self.orders:
+                logger.info(f"Expiring {len(self.orders)} unfilled orders from {self.orders_date}")
+                self.orders.clear()
+            self.orders_date = today
+    
+    def _apply_fill(self, fill: Fill):
+        pos = self.positions.get(fill.stock_code)
+        if fill.order_type == 'BUY':
+            if pos is None:
+                self.positions[fill.stock_code] = Position(
+                    stock_code=fill.stock_code,
+                    stock_name='',
+                    quantity=fill.quantity,
+                    avg_price=fill.price,
+                    current_price=fill.price
+                )
+                return
+            quantity = pos.quantity + fill.quantity
+            pos.avg_price = int((pos.avg_price * pos.quantity + fill.price * fill.quantity) / quantity)
+            pos.quantity = quantity
+            pos.current_price = fill.price
+        elif pos is not None:
+            pos.quantity -= fill.quantity
+            pos.current_price = fill.price
+            if pos.quantity <= 0:
+                del self.positions[fill.stock_code]
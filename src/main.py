@@ -2,13 +2,20 @@
 import asyncio
 import argparse
 import signal
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 
 from .logger import setup_logging, get_logger
 from .config import get_config
 from .database import get_database
-from .api import KISAPIClient
+from .api import get_kis_client, KISWebSocketPool, TickDispatcher, Tick, OrderRequest
+from .api.kis_websocket import TR_FILL
 from .execution import OrderExecutor
+from .data.tick_recorder import TickRecorder
+from .data.bar_aggregator import Bar, BarAggregator, write_bars
+from .data.ohlcv_store import OHLCVStore
+from .data.order_book import OrderBooks
+from .data.backfill import GapBackfiller
 from .strategy.rsi_strategy import RSIStrategy
 from .scheduler import Scheduler
 
@@ -35,7 +42,7 @@ class TradingSystem:
         
         # 컴포넌트 초기화
         self.db = get_database()
-        self.api_client = KISAPIClient(mode=self.mode)
+        self.api_client = get_kis_client(self.mode)
         self.order_executor = OrderExecutor(mode=self.mode)
         
         # 전략 초기화 (RSI 전략)
@@ -45,6 +52,50 @@ class TradingSystem:
             for code in self.target_codes
         }
         
+        # 실시간 체결 스트림 (연결 풀 수신 루프 → 샤드별 유한 큐 → 종목별 전략)
+        self.use_websocket = self.config.get('trading.use_websocket', True)
+        self.ws_pool = KISWebSocketPool(mode=self.mode)
+        self.dispatcher = TickDispatcher(self._on_tick)
+        self.ws_pool.set_message_handler(self._receive_tick)
+        
+        # 10단계 호가창 (H0STASP0 채널 구독 시 수신 루프에서 제자리 갱신)
+        self.order_books = OrderBooks()
+        self.ws_pool.set_message_handler(self.order_books.apply, tr_id='H0STASP0')
+        
+        # 실시간 체결통보 → 주문/포지션 상태 (잔고 조회 폴링 대체)
+        if self.config.get('websocket.fill_notices', True):
+            self.ws_pool.enable_fill_notices()
+            self.ws_pool.set_message_handler(self.order_executor.on_fill, tr_id=TR_FILL[self.mode])
+            self.ws_pool.set_notice_handler(self.order_executor.on_notice_status)
+        
+        # 틱 → 봉 집계. 전략은 signal_timeframe 봉이 완성될 때 실행 ('tick'이면 틱마다)
+        self.signal_timeframe = self.config.get('trading.signal_timeframe', '1m')
+        self.bar_aggregator = BarAggregator(
+            self.config.get('trading.bar_timeframes', ['1m', '5m', '30m', '1d']),
+            session_close=datetime.strptime(self.config.get('schedule.market_close', '15:30'), '%H:%M').time()
+        )
+        self.bar_aggregator.add_handler(self._on_bar)
+        self.ohlcv_store = OHLCVStore()
+        
+        # 재연결 시 끊긴 구간 분봉을 REST로 보충한 뒤 실시간 틱 재개
+        self.backfiller = None
+        if self.config.get('websocket.backfill.enabled', True):
+            self.backfiller = GapBackfiller(self.api_client, self.bar_aggregator, self._process_tick)
+            self.ws_pool.set_reconnect_handler(self.backfiller.on_reconnect)
+        
+        # 수신 틱/원본 프레임 기록 (시뮬레이션 재생용)
+        self.tick_recorder = TickRecorder() if self.config.get('data.tick_store.enabled', True) else None
+        if self.tick_recorder:
+            self.ws_pool.set_raw_handler(self.tick_recorder.record_raw)
+        self.last_tick_at = {}  # 종목별 마지막 스트림 수신 시각 (time.monotonic)
+        self.started_at = time.monotonic()
+        self._order_tasks = set()
+        
+        # 스트림이 stall_timeout 이상 멈춘 종목만 poll_interval마다 REST로 조회
+        # (요청 속도는 KISAPIClient의 공유 속도 제한기가 조절)
+        self.poll_interval = self.config.get('trading.poll_interval', 1.0)
+        self.stall_timeout = self.config.get('trading.stream_stall_timeout', 5.0)
+        
         # 시그널 핸들러 등록
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
@@ -62,6 +113,9 @@ class TradingSystem:
         self.db.create_tables()
         logger.info("Database tables ready")
         
+        # 접근 토큰 선제 갱신 (만료 전 백그라운드에서 재발급)
+        self.api_client.token_manager.start_auto_refresh()
+        
         # API 연결 테스트
         try:
             balance = await self.order_executor.get_account_balance()
@@ -71,6 +125,12 @@ class TradingSystem:
         except Exception as e:
             logger.error(f"Failed to get account balance: {e}")
         
+        # 초기 포지션 (체결통보 등록 ACK 후에는 통보로 갱신)
+        try:
+            await self.order_executor.sync_positions()
+        except Exception as e:
+            logger.error(f"Failed to sync positions: {e}")
+        
         logger.info("System initialized successfully")
     
     async def run(self):
@@ -89,76 +149,34 @@ class TradingSystem:
             # 스케줄러 시작 (백그라운드 태스크)
             scheduler_task = asyncio.create_task(self.scheduler.start())
             
+            # 실시간 시세 스트림 시작 (틱은 분배기를 거쳐 _on_tick으로 전달됨)
+            self.started_at = time.monotonic()
+            if self.use_websocket:
+                self.dispatcher.start()
+                await self.ws_pool.start(self.target_codes)
+            
             while self.running:
-                # 현재 시각
-                now = datetime.now()
-                
                 # Watchlist 업데이트 확인
-                try:
-                    import json
-                    import os
-                    watchlist_path = "config/watchlist.json"
-                    if os.path.exists(watchlist_path):
-                        with open(watchlist_path, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                            stocks_data = data.get('stocks', [])
-                            # 딕셔너리 리스트에서 종목코드만 추출
-                            new_codes = [stock['code'] if isinstance(stock, dict) else stock 
-                                        for stock in stocks_data]
-                            # 리스트가 변경되었으면 업데이트
-                            if set(new_codes) != set(self.target_codes):
-                                logger.info(f"Watchlist updated: {self.target_codes} -> {new_codes}")
-                                self.target_codes = new_codes
-                                # 새 종목에 대한 전략 인스턴스 생성 (기존 전략 유지/새 전략 추가)
-                                for code in self.target_codes:
-                                    if code not in self.strategies:
-                                        self.strategies[code] = RSIStrategy(config={'rsi_period': 14})
-                except Exception as e:
-                    logger.error(f"Failed to update watchlist: {e}")
-
-                for code in self.target_codes:
-                    try:
-                        # 1. 시장 데이터 수집 (현재가)
-                        current_price = 70000 # 기본값
-                        try:
-                            # 동기식 호출 (임시)
-                            if hasattr(self.api_client, 'get_stock_price'):
-                                quote = self.api_client.get_stock_price(code)
-                                current_price = quote.current_price
-                        except Exception as e:
-                            logger.warning(f"[{code}] Failed to fetch price: {e}. Using dummy data.")
-                            import random
-                            current_price = 70000 + random.randint(-1000, 1000)
-
-                        #logger.info(f"[{code}] Current Price: {current_price:,}원")
-
-                        # 2. 전략 분석
-                        market_data = {'current_price': current_price}
-                        strategy = self.strategies[code]
-                        signal = strategy.analyze(market_data)
-                        
-                        # 3. 신호에 따른 주문 실행
-                        if signal in ['BUY', 'SELL']:
-                            from .api import OrderRequest
-                            
-                            order = OrderRequest(
-                                stock_code=code,
-                                order_type=signal,
-                                price=0,  # 시장가
-                                quantity=1
-                            )
-                            
-                            logger.info(f"[{code}] >>> Sending {signal} Order")
-                            await self.order_executor.place_order(order)
-                            
-                    except Exception as e:
-                        logger.error(f"Error processing {code}: {e}")
-                    
-                    # API 호출 제한을 피하기 위한 딜레이
-                    await asyncio.sleep(1.0)
+                self._refresh_watchlist()
+                await self._sync_subscriptions()
+                
+                # 스트림이 멈춘 종목만 REST 폴링으로 보완
+                stalled = self._stalled_codes()
+                if stalled:
+                    await asyncio.gather(*(self._poll_symbol(code) for code in stalled))
                 
-                # 1초마다 루프
-                await asyncio.sleep(1)
+                # 구간이 끝난 봉 완성 처리 후 일괄 저장
+                self.bar_aggregator.roll(datetime.now() - timedelta(seconds=self.poll_interval))
+                await self._save_bars()
+                
+                # 다음 점검 주기까지 대기
+                await asyncio.sleep(self.poll_interval)
+            
+            if self.use_websocket:
+                logger.info(f"WebSocket pool stats: {self.ws_pool.stats()}")
+                await self.ws_pool.stop()
+                await self.dispatcher.stop()
+                logger.info(f"Tick dispatcher stats: {self.dispatcher.stats()}")
                 
             # 메인 루프 종료 시 스케줄러도 종료
             self.scheduler.stop()
@@ -174,17 +192,205 @@ class TradingSystem:
         finally:
             await self.shutdown()
     
+    def _refresh_watchlist(self):
+        """config/watchlist.json 변경 시 감시 종목 및 전략 갱신"""
+        try:
+            import json
+            import os
+            watchlist_path = "config/watchlist.json"
+            if os.path.exists(watchlist_path):
+                with open(watchlist_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                    stocks_data = data.get('stocks', [])
+                    # 딕셔너리 리스트에서 종목코드만 추출
+                    new_codes = [stock['code'] if isinstance(stock, dict) else stock 
+                                for stock in stocks_data]
+                    # 리스트가 변경되었으면 업데이트
+                    if set(new_codes) != set(self.target_codes):
+                        logger.info(f"Watchlist updated: {self.target_codes} -> {new_codes}")
+                        self.target_codes = new_codes
+                        # 새 종목에 대한 전략 인스턴스 생성 (기존 전략 유지/새 전략 추가)
+                        for code in self.target_codes:
+                            if code not in self.strategies:
+                                self.strategies[code] = RSIStrategy(config={'rsi_period': 14})
+        except Exception as e:
+            logger.error(f"Failed to update watchlist: {e}")
+    
+    async def _sync_subscriptions(self):
+        """감시 종목 변경을 연결 풀 구독에 반영"""
+        if not self.use_websocket:
+            return
+        
+        targets = set(self.target_codes)
+        for code in self.ws_pool.subscribed_stocks - targets:
+            self.last_tick_at.pop(code, None)
+            self.order_books.discard(code)
+            if self.backfiller:
+                self.backfiller.discard(code)
+        await self.ws_pool.update(self.target_codes)
+    
+    async def _receive_tick(self, tick: Tick):
+        """수신 루프에서 호출: 틱 기록/봉 집계 후 분배기로 전달
+        
+        봉 집계는 틱당 O(1)이고 분배기에서 틱이 유실(drop/conflate)되어도
+        거래량이 빠지지 않도록 수신 시점에 처리한다.
+        """
+        if self.tick_recorder:
+            self.tick_recorder.record(tick)
+        if self.backfiller and self.backfiller.hold(tick):
+            # 재연결 공백 보충 중: 보충 봉 뒤에 순서대로 _process_tick으로 재처리됨
+            return
+        await self._process_tick(tick)
+    
+    async def _process_tick(self, tick: Tick):
+        """봉 집계 후 분배기로 전달"""
+        if tick.stock_code in self.strategies:
+            self.bar_aggregator.update(tick)
+        await self.dispatcher.put(tick)
+    
+    def _stalled_codes(self) -> list:
+        """stall_timeout 동안 스트림 틱이 없는 종목 (스트림 미사용 시 전 종목)"""
+        if not self.use_websocket:
+            return list(self.target_codes)
+        
+        now = time.monotonic()
+        return [
+            code for code in self.target_codes
+            if now - self.last_tick_at.get(code, self.started_at) > self.stall_timeout
+        ]
+    
+    def _on_tick(self, tick: Tick):
+        """실시간 체결 틱 처리 (WebSocket 수신 루프에서 호출)"""
+        code = tick.stock_code
+        if code not in self.strategies:
+            return
+        
+        self.last_tick_at[code] = time.monotonic()
+        if self.signal_timeframe == 'tick':
+            self._analyze(code, {'current_price': tick.price})
+    
+    def _on_bar(self, bar: Bar):
+        """봉 완성 시 전략 실행 (signal_timeframe 봉만)"""
+        if bar.timeframe == self.signal_timeframe and bar.stock_code in self.strategies:
+            # 재연결 보충 봉은 지표 상태만 갱신하고 지나간 신호로 주문하지 않음
+            backfilled = self.backfiller is not None and self.backfiller.splicing
+            self._analyze(bar.stock_code, bar.as_market_data(), trade=not backfilled)
+    
+    async def _save_bars(self):
+        """완성 봉을 MarketData 및 OHLCV 저장소에 일괄 저장"""
+        frames = self.bar_aggregator.drain()
+        if frames:
+            await asyncio.to_thread(write_bars, frames, self.db, self.ohlcv_store)
+    
+    def _analyze(self, code: str, market_data: dict, trade: bool = True):
+        """전략 분석 후 신호가 나오면 주문 태스크 생성
+        
+        Args:
+            trade: False면 전략 상태만 갱신하고 주문하지 않음
+        """
+        book = self.order_books.get(code) if trade else None
+        if book is not None:
+            market_data.update(book.features())
+        
+        try:
+            signal = self.strategies[code].analyze(market_data)
+        except Exception as e:
+            logger.error(f"Error processing {code}: {e}")
+            return
+        
+        if trade and signal in ['BUY', 'SELL']:
+            # 주문 대기로 수신 루프가 막히지 않도록 별도 태스크로 실행
+            task = asyncio.get_running_loop().create_task(self._send_order(code, signal))
+            self._order_tasks.add(task)
+            task.add_done_callback(self._order_tasks.discard)
+    
+    async def _send_order(self, code: str, signal: str):
+        """신호에 따른 주문 실행
+        
+        호가창이 있으면 수량을 즉시 체결시킬 수 있는 상대 호가로 지정가 주문하고,
+        없거나 10단계 잔량이 부족하면 시장가로 주문한다.
+        """
+        try:
+            quantity = 1
+            book = self.order_books.get(code)
+            price = book.marketable_price(signal, quantity) if book is not None else None
+            order = OrderRequest(
+                stock_code=code,
+                order_type=signal,
+                price=price or 0,  # 0: 시장가
+                quantity=quantity
+            )
+            
+            logger.info(f"[{code}] >>> Sending {signal} Order")
+            await self.order_executor.place_order(order)
+        except Exception as e:
+            logger.error(f"[{code}] Order failed: {e}")
+    
+    async def _fetch_price(self, code: str) -> int:
+        """
+        현재가 조회 (동기 REST 호출을 스레드로 오프로딩)
+        
+        요청 간격은 KISAPIClient._request의 토큰 버킷이 맞추므로 별도 대기 없음
+        """
+        quote = await asyncio.to_thread(self.api_client.get_stock_price, code)
+        return quote.current_price
+    
+    async def _poll_symbol(self, code: str):
+        """REST 폴백: 현재가 조회 → 전략 분석 → 주문"""
+        try:
+            current_price = await self._fetch_price(code)
+        except Exception as e:
+            logger.warning(f"[{code}] Failed to fetch price: {e}")
+            return
+        
+        if self.signal_timeframe == 'tick':
+            self._analyze(code, {'current_price': current_price})
+        elif self.backfiller and self.backfiller.tracking(code):
+            # 스트림으로 받던 종목의 끊긴 구간 봉은 재연결 후 분봉 보충으로 채움
+            return
+        else:
+            # 스트림 대신 REST 시세로 봉을 이어 감 (체결량 정보가 없으므로 저장하지 않음)
+            now = datetime.now().strftime('%H%M%S')
+            self.bar_aggregator.update(Tick(
+                code, now, current_price, 0, 0.0, current_price, current_price, current_price,
+                0, 0, 0, 0
+            ), synthetic=True)
+    
     async def shutdown(self):
         """시스템 종료"""
         logger.info("Shutting down trading system...")
         
+        await self.ws_pool.stop()
+        if self.backfiller:
+            await self.backfiller.stop()
+        # 구간이 끝난 봉만 저장 (전략 핸들러는 호출하지 않으므로 새 주문이 생기지 않음)
+        self.bar_aggregator.flush()
+        await self._save_bars()
+        await self._drain_orders()
+        if self.tick_recorder:
+            self.tick_recorder.close()
+        self.api_client.token_manager.stop_auto_refresh()
+        self.api_client.close()
+        
         # TODO: 리소스 정리
-        # - WebSocket 연결 종료
         # - Kafka 연결 종료
         # - Redis 연결 종료
         # - 실행 중인 작업 취소
         
         logger.info("Trading system shut down complete")
+    
+    async def _drain_orders(self, timeout: float = 5.0):
+        """API 클라이언트를 닫기 전에 진행 중인 주문 태스크를 기다리고 남은 태스크는 취소"""
+        if not self._order_tasks:
+            return
+        
+        tasks = list(self._order_tasks)
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            logger.warning(f"Cancelled {len(pending)} order task(s) on shutdown")
 
 
 async def main():
@@ -1,5 +1,6 @@
 """베이지안 최적화 모듈"""
 from .optimizer import BayesianOptimizer
 from .backtester import Backtester
+from .grid import GridOptimizer
 
-__all__ = ['BayesianOptimizer', 'Backtester']
+__all__ = ['BayesianOptimizer', 'Backtester', 'GridOptimizer']
@@ -1,11 +1,16 @@
 """백테스팅 프레임워크"""
+import math
+import zlib
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Tuple, Union
 from datetime import datetime, timedelta
+from ..config import get_config
 from ..logger import get_logger
-from ..api import KISAPIClient
-from ..strategy.base import BaseStrategy
+from ..api import KISAPIClient, get_kis_client
+from ..data.ohlcv_store import OHLCVStore
+from ..strategy.base import BaseStrategy, SIGNAL_BUY, SIGNAL_SELL
+from .jit import NUMBA_AVAILABLE, backtest_kernel, signal_spec
 
 logger = get_logger(__name__)
 
@@ -16,9 +21,37 @@ class Backtester:
     과거 데이터로 전략을 시뮬레이션하여 성과를 측정
     """
     
-    def __init__(self, api_client: KISAPIClient = None):
-        self.api_client = api_client or KISAPIClient(mode='mock')
+    # get_historical_data()의 interval → 저장소 봉 단위
+    INTERVAL_TIMEFRAMES = {'D': '1d', '1': '1m', '5': '5m', '30': '30m', '60': '1h'}
+    
+    # 정규장 길이 (09:00~15:30, 분)와 달력 일수 대비 거래일 비율 (주 5일)
+    SESSION_MINUTES = 390
+    TRADING_DAY_RATIO = 5 / 7
+    
+    def __init__(self, api_client: KISAPIClient = None, vectorized: bool = False, store: OHLCVStore = None,
+                 jit: bool = False):
+        """
+        Args:
+            api_client: KIS API 클라이언트
+            vectorized: True면 run_backtest()가 벡터화 엔진(run_vectorized_backtest)을 사용
+            store: 과거 OHLCV 저장소. None이면 설정 경로의 기본 저장소 사용
+            jit: True면 JIT 신호 함수가 등록된 전략은 run_backtest()가 컴파일 커널(run_jit_backtest)을 사용
+        """
+        self.api_client = api_client or get_kis_client('mock')
+        self.vectorized = vectorized
+        self.jit = jit
+        self.store = store or OHLCVStore()
+        # 저장소 데이터가 예상 봉 수의 이 비율 이상일 때만 사용
+        self.min_store_coverage = get_config().get('data.ohlcv_store.min_coverage', 0.8)
         
+    def expected_bars(self, timeframe: str, days: int) -> int:
+        """days일 동안의 예상 봉 수 (주말 제외, 공휴일은 고려하지 않음)"""
+        trading_days = days * self.TRADING_DAY_RATIO
+        if timeframe == '1d':
+            return int(trading_days)
+        minutes = 60 if timeframe == '1h' else int(timeframe.rstrip('m'))
+        return int(trading_days * math.ceil(self.SESSION_MINUTES / minutes))
+    
     def get_historical_data(
         self, 
         stock_code: str, 
@@ -28,6 +61,11 @@ class Backtester:
         """
         과거 시장 데이터 조회
         
+        로컬 OHLCV 저장소에 해당 종목/봉 단위 데이터가 있으면 마지막 봉 기준
+        최근 days일을 메모리 맵으로 읽는다. 저장소에는 실시간 봉도 쌓이므로 예상 봉 수의
+        min_store_coverage에 못 미치면(며칠치 실시간 봉뿐인 경우 등) 사용하지 않고
+        Mock 데이터를 생성한다.
+        
         Args:
             stock_code: 종목 코드
             days: 조회 일수
@@ -37,6 +75,16 @@ class Backtester:
             DataFrame with columns: ['date', 'open', 'high', 'low', 'close', 'volume']
         """
         try:
+            timeframe = self.INTERVAL_TIMEFRAMES.get(interval, f"{interval}m")
+            df = self.store.load_recent(stock_code, timeframe, days)
+            if not df.empty:
+                expected = self.expected_bars(timeframe, days)
+                if len(df) >= expected * self.min_store_coverage:
+                    logger.info(f"Loaded {len(df)} {timeframe} bars for {stock_code} from local store")
+                    return df
+                logger.warning(f"Local store has only {len(df)}/{expected} {timeframe} bars for "
+                               f"{stock_code} ({days} days), falling back")
+            
             # KIS API를 통해 과거 데이터 조회
             # 실제 구현 시 API 호출 필요
             # 여기서는 Mock 데이터 생성
@@ -49,7 +97,8 @@ class Backtester:
             dates = pd.date_range(start=start_date, end=end_date, freq='D')
             
             # 랜덤 워크 기반 가격 생성 (실제 시장 데이터와 유사하게)
-            np.random.seed(hash(stock_code) % (2**32))
+            # hash()는 프로세스마다 달라지므로 워커 간 동일한 데이터를 위해 crc32 사용
+            np.random.seed(zlib.crc32(stock_code.encode()))
             base_price = 50000
             returns = np.random.normal(0.001, 0.02, len(dates))
             prices = base_price * np.exp(np.cumsum(returns))
@@ -75,7 +124,10 @@ class Backtester:
         stock_code: str,
         initial_capital: float = 10000000,  # 1000만원
         days: int = 90,
-        commission_rate: float = 0.00015  # 0.015% (편도)
+        commission_rate: float = 0.00015,  # 0.015% (편도)
+        data: pd.DataFrame = None,
+        start: int = 0,
+        end: int = None
     ) -> Dict[str, Any]:
         """
         백테스트 실행
@@ -86,16 +138,44 @@ class Backtester:
             initial_capital: 초기 자본
             days: 백테스트 기간 (일)
             commission_rate: 거래 수수료율
+            data: 미리 조회한 OHLCV (주어지면 days는 무시하고 다시 조회하지 않음)
+            start: 거래를 시작할 봉 위치. 그 이전 봉은 지표 준비에만 사용
+            end: 거래를 끝낼 봉 위치 (미포함, None이면 끝까지)
             
         Returns:
             백테스트 결과 딕셔너리
         """
+        if self.jit and signal_spec(strategy) is not None:
+            return self.run_jit_backtest(
+                strategy=strategy,
+                stock_code=stock_code,
+                initial_capital=initial_capital,
+                days=days,
+                commission_rate=commission_rate,
+                data=data,
+                start=start,
+                end=end
+            )
+        
+        if self.vectorized:
+            return self.run_vectorized_backtest(
+                strategy=strategy,
+                stock_code=stock_code,
+                initial_capital=initial_capital,
+                days=days,
+                commission_rate=commission_rate,
+                data=data,
+                start=start,
+                end=end
+            )
+        
         logger.info(f"Starting backtest for {stock_code} with {strategy.__class__.__name__}")
         
         # 과거 데이터 조회
-        df = self.get_historical_data(stock_code, days)
+        df = self.get_historical_data(stock_code, days) if data is None else data
+        df = df.iloc[:end]
         
-        if df.empty:
+        if len(df) <= start:
             logger.error("No historical data available")
             return self._empty_result()
         
@@ -107,7 +187,7 @@ class Backtester:
         equity_curve = []
         
         # 각 시점마다 전략 실행
-        for idx, row in df.iterrows():
+        for i, (idx, row) in enumerate(df.iterrows()):
             market_data = {
                 'current_price': row['close'],
                 'open': row['open'],
@@ -116,8 +196,10 @@ class Backtester:
                 'volume': row['volume']
             }
             
-            # 전략 신호 생성
+            # 전략 신호 생성 (거래 구간 이전은 지표 준비만)
             signal = strategy.analyze(market_data)
+            if i < start:
+                continue
             current_price = row['close']
             
             # 신호에 따라 거래 실행
@@ -205,8 +287,451 @@ class Backtester:
             
             position = 0
         
-        # 성과 지표 계산
-        final_equity = cash
+        equity = np.array([e['equity'] for e in equity_curve], dtype=float)
+        return self._build_result(initial_capital, cash, trades, equity, equity_curve)
+    
+    def run_vectorized_backtest(
+        self,
+        strategy: BaseStrategy,
+        stock_code: str,
+        initial_capital: float = 10000000,
+        days: int = 90,
+        commission_rate: float = 0.00015,
+        data: pd.DataFrame = None,
+        start: int = 0,
+        end: int = None
+    ) -> Dict[str, Any]:
+        """
+        벡터화 백테스트 실행
+        
+        strategy.generate_signals()로 전체 구간 신호를 한 번에 계산한 뒤,
+        신호가 발생한 봉에서만 현금/포지션 상태를 갱신하고 자산 곡선은
+        NumPy 배열 연산으로 채운다. run_backtest()와 동일한 결과 딕셔너리를 반환한다.
+        
+        Args:
+            strategy: 테스트할 전략 인스턴스
+            stock_code: 종목 코드
+            initial_capital: 초기 자본
+            days: 백테스트 기간 (일)
+            commission_rate: 거래 수수료율
+            data: 미리 조회한 OHLCV (주어지면 days는 무시하고 다시 조회하지 않음)
+            start: 거래를 시작할 봉 위치. 그 이전 봉은 지표 준비에만 사용
+            end: 거래를 끝낼 봉 위치 (미포함, None이면 끝까지)
+            
+        Returns:
+            백테스트 결과 딕셔너리
+        """
+        logger.info(f"Starting vectorized backtest for {stock_code} with {strategy.__class__.__name__}")
+        
+        df = self.get_historical_data(stock_code, days) if data is None else data
+        
+        if len(df.iloc[start:end]) == 0:
+            logger.error("No historical data available")
+            return self._empty_result()
+        
+        # 지표는 과거만 참조하므로 전체 data로 신호를 만든 뒤 구간을 잘라도 같다.
+        # 구간이 달라도 입력이 같아 지표 캐시를 공유한다 (워크포워드 폴드 등).
+        signals = np.asarray(strategy.generate_signals(df))[start:end]
+        df = df.iloc[start:end]
+        dates = df['date']
+        close = df['close'].to_numpy(dtype=float)
+        
+        n = len(close)
+        cash = initial_capital
+        position = 0
+        avg_buy_price = 0
+        trades = []
+        
+        # 상태가 바뀐 봉의 (현금, 보유수량)을 기록해 두었다가 forward-fill
+        cash_at = np.full(n, np.nan)
+        position_at = np.full(n, -1, dtype=np.int64)
+        cash_at[0] = cash
+        position_at[0] = position
+        
+        for i in np.flatnonzero(signals):
+            signal = signals[i]
+            current_price = float(close[i])
+            
+            if signal == SIGNAL_BUY and position == 0 and cash > 0:
+                quantity = int(cash * 0.95 / current_price)
+                
+                if quantity > 0:
+                    cost = quantity * current_price
+                    commission = cost * commission_rate
+                    total_cost = cost + commission
+                    
+                    if total_cost <= cash:
+                        cash -= total_cost
+                        position = quantity
+                        avg_buy_price = current_price
+                        
+                        trades.append({
+                            'date': dates.iat[i],
+                            'type': 'BUY',
+                            'price': current_price,
+                            'quantity': quantity,
+                            'commission': commission
+                        })
+            
+            elif signal == SIGNAL_SELL and position > 0:
+                revenue = position * current_price
+                commission = revenue * commission_rate
+                net_revenue = revenue - commission
+                
+                profit = net_revenue - (position * avg_buy_price)
+                profit_rate = (profit / (position * avg_buy_price)) * 100
+                
+                cash += net_revenue
+                
+                trades.append({
+                    'date': dates.iat[i],
+                    'type': 'SELL',
+                    'price': current_price,
+                    'quantity': position,
+                    'commission': commission,
+                    'profit': profit,
+                    'profit_rate': profit_rate
+                })
+                
+                position = 0
+                avg_buy_price = 0
+            
+            cash_at[i] = cash
+            position_at[i] = position
+        
+        # 마지막 상태 변경 시점의 값을 이후 봉으로 전파
+        last_change = np.maximum.accumulate(np.where(position_at >= 0, np.arange(n), 0))
+        cash_series = cash_at[last_change]
+        position_series = position_at[last_change]
+        position_value = position_series * close
+        equity = cash_series + position_value
+        
+        # 마지막에 포지션이 남아있으면 청산
+        if position > 0:
+            final_price = float(close[-1])
+            revenue = position * final_price
+            commission = revenue * commission_rate
+            net_revenue = revenue - commission
+            
+            profit = net_revenue - (position * avg_buy_price)
+            profit_rate = (profit / (position * avg_buy_price)) * 100
+            
+            cash += net_revenue
+            
+            trades.append({
+                'date': dates.iat[-1],
+                'type': 'SELL',
+                'price': final_price,
+                'quantity': position,
+                'commission': commission,
+                'profit': profit,
+                'profit_rate': profit_rate
+            })
+        
+        equity_curve = [
+            {'date': d, 'equity': e, 'cash': c, 'position_value': v}
+            for d, e, c, v in zip(dates, equity.tolist(), cash_series.tolist(), position_value.tolist())
+        ]
+        
+        return self._build_result(initial_capital, cash, trades, equity, equity_curve)
+    
+    def run_jit_backtest(
+        self,
+        strategy: BaseStrategy,
+        stock_code: str,
+        initial_capital: float = 10000000,
+        days: int = 90,
+        commission_rate: float = 0.00015,
+        data: pd.DataFrame = None,
+        start: int = 0,
+        end: int = None
+    ) -> Dict[str, Any]:
+        """
+        JIT 커널 백테스트 실행
+        
+        상태를 가진 전략의 봉 단위 루프를 jit.backtest_kernel()로 실행한다.
+        Numba가 없으면 같은 커널을 Python으로 실행하며, 결과는 run_backtest()와 같다.
+        
+        Args:
+            strategy: 테스트할 전략 인스턴스 (jit.JIT_SIGNALS에 등록된 전략)
+            stock_code: 종목 코드
+            initial_capital: 초기 자본
+            days: 백테스트 기간 (일)
+            commission_rate: 거래 수수료율
+            data: 미리 조회한 OHLCV (주어지면 days는 무시하고 다시 조회하지 않음)
+            start: 거래를 시작할 봉 위치. 그 이전 봉은 지표 준비에만 사용
+            end: 거래를 끝낼 봉 위치 (미포함, None이면 끝까지)
+            
+        Returns:
+            백테스트 결과 딕셔너리
+        """
+        spec = signal_spec(strategy)
+        if spec is None:
+            raise ValueError(f"No JIT signal function for {strategy.__class__.__name__}")
+        signal_fn, params, state = spec
+        
+        logger.info(f"Starting JIT backtest for {stock_code} with {strategy.__class__.__name__} "
+                    f"({'numba' if NUMBA_AVAILABLE else 'python'})")
+        
+        df = self.get_historical_data(stock_code, days) if data is None else data
+        df = df.iloc[:end]
+        
+        if len(df) <= start:
+            logger.error("No historical data available")
+            return self._empty_result()
+        
+        columns = [np.ascontiguousarray(df[c].to_numpy(dtype=float)) for c in ('open', 'high', 'low', 'close', 'volume')]
+        (cash_at, position_at, trade_index, trade_side, trade_price, trade_quantity,
+         trade_commission, trade_profit, trade_profit_rate, n_trades, cash) = backtest_kernel(
+            *columns, signal_fn, params, state, start, float(initial_capital), float(commission_rate)
+        )
+        
+        dates = df['date']
+        trades = []
+        for k in range(n_trades):
+            trade = {
+                'date': dates.iat[int(trade_index[k])],
+                'type': 'BUY' if trade_side[k] == SIGNAL_BUY else 'SELL',
+                'price': float(trade_price[k]),
+                'quantity': int(trade_quantity[k]),
+                'commission': float(trade_commission[k])
+            }
+            if trade_side[k] == SIGNAL_SELL:
+                trade['profit'] = float(trade_profit[k])
+                trade['profit_rate'] = float(trade_profit_rate[k])
+            trades.append(trade)
+        
+        close = columns[3][start:]
+        cash_series = cash_at[start:]
+        position_value = position_at[start:] * close
+        equity = cash_series + position_value
+        
+        equity_curve = [
+            {'date': d, 'equity': e, 'cash': c, 'position_value': v}
+            for d, e, c, v in zip(dates.iloc[start:], equity.tolist(), cash_series.tolist(), position_value.tolist())
+        ]
+        
+        return self._build_result(initial_capital, float(cash), trades, equity, equity_curve)
+    
+    def get_price_panel(
+        self,
+        stock_codes: List[str],
+        days: int = 90,
+        interval: str = 'D'
+    ) -> Tuple[pd.DatetimeIndex, np.ndarray, Dict[str, pd.DataFrame]]:
+        """
+        여러 종목의 과거 데이터를 공통 시간축으로 정렬
+        
+        Args:
+            stock_codes: 종목 코드 목록
+            days: 조회 일수
+            interval: 봉 간격
+            
+        Returns:
+            (공통 시간축, 종가 배열 (시간 x 종목, 상장 전/결측은 직전 값 또는 NaN), 종목별 원본 DataFrame)
+        """
+        frames = {}
+        for code in stock_codes:
+            df = self.get_historical_data(code, days, interval)
+            if not df.empty:
+                df = df.reset_index(drop=True)
+                if interval == 'D':
+                    # 일봉은 날짜 단위로 맞춤 (데이터 소스마다 시각 부분이 다를 수 있음)
+                    df['date'] = pd.to_datetime(df['date']).dt.normalize()
+                frames[code] = df
+        
+        if not frames:
+            return pd.DatetimeIndex([]), np.empty((0, 0)), {}
+        
+        close = pd.concat(
+            {code: df.set_index('date')['close'] for code, df in frames.items()}, axis=1
+        ).sort_index().ffill()
+        return close.index, close.to_numpy(dtype=float), frames
+    
+    def run_portfolio_backtest(
+        self,
+        strategy: Union[BaseStrategy, Dict[str, BaseStrategy]],
+        stock_codes: List[str],
+        initial_capital: float = 10000000,
+        days: int = 90,
+        commission_rate: float = 0.00015,
+        max_positions: int = None,
+        max_position_percent: float = None
+    ) -> Dict[str, Any]:
+        """
+        포트폴리오 백테스트 (여러 종목, 공유 현금)
+        
+        모든 종목을 공통 시간축의 (시간 x 종목) 종가/신호 배열로 정렬한 뒤 한 번에
+        시뮬레이션한다. 같은 봉에서는 매도를 먼저 처리해 현금을 확보하고, 매수는
+        종목당 총자산의 max_position_percent 이내, 보유 종목 수 max_positions 이내로
+        제한한다 (실거래 risk_management 설정과 동일한 기준).
+        
+        Args:
+            strategy: 전 종목 공통 전략 또는 {종목코드: 전략}
+            stock_codes: 종목 코드 목록
+            initial_capital: 초기 자본 (전 종목 공유)
+            days: 백테스트 기간 (일)
+            commission_rate: 거래 수수료율
+            max_positions: 최대 보유 종목 수. None이면 risk_management.max_total_positions
+            max_position_percent: 종목당 최대 비중 (%). None이면 risk_management.max_position_size_percent
+            
+        Returns:
+            백테스트 결과 딕셔너리 (run_backtest()와 같은 키 + 'stock_codes', 'symbol_returns')
+        """
+        config = get_config()
+        max_positions = max_positions or config.get('risk_management.max_total_positions', 10)
+        max_position_percent = max_position_percent or config.get('risk_management.max_position_size_percent', 10.0)
+        
+        logger.info(f"Starting portfolio backtest for {len(stock_codes)} symbols "
+                    f"(max {max_positions} positions, {max_position_percent}% each)")
+        
+        dates, close, frames = self.get_price_panel(stock_codes, days)
+        if not frames:
+            logger.error("No historical data available")
+            return self._empty_result()
+        
+        codes = list(frames)
+        n_bars, n_symbols = close.shape
+        
+        # 종목별 신호를 공통 시간축으로 정렬 (거래가 없는 봉은 HOLD)
+        signals = np.zeros((n_bars, n_symbols), dtype=np.int8)
+        for j, code in enumerate(codes):
+            df = frames[code]
+            symbol_strategy = strategy[code] if isinstance(strategy, dict) else strategy
+            rows = dates.get_indexer(df['date'])
+            signals[rows, j] = symbol_strategy.generate_signals(df)
+        
+        prices = np.nan_to_num(close)
+        cash = initial_capital
+        position = np.zeros(n_symbols, dtype=np.int64)
+        avg_buy_price = np.zeros(n_symbols)
+        trades = []
+        
+        # 상태가 바뀐 봉의 (현금, 보유수량)만 기록했다가 forward-fill
+        cash_at = np.full(n_bars, np.nan)
+        position_at = np.zeros((n_bars, n_symbols), dtype=np.int64)
+        changed = np.zeros(n_bars, dtype=bool)
+        cash_at[0] = cash
+        changed[0] = True
+        
+        for i in np.flatnonzero(signals.any(axis=1)):
+            row = signals[i]
+            
+            # 매도 먼저 (현금 확보)
+            for j in np.flatnonzero((row == SIGNAL_SELL) & (position > 0)):
+                current_price = prices[i, j]
+                revenue = position[j] * current_price
+                commission = revenue * commission_rate
+                net_revenue = revenue - commission
+                
+                profit = net_revenue - (position[j] * avg_buy_price[j])
+                profit_rate = (profit / (position[j] * avg_buy_price[j])) * 100
+                
+                cash += net_revenue
+                trades.append({
+                    'date': dates[i],
+                    'stock_code': codes[j],
+                    'type': 'SELL',
+                    'price': current_price,
+                    'quantity': int(position[j]),
+                    'commission': commission,
+                    'profit': profit,
+                    'profit_rate': profit_rate
+                })
+                position[j] = 0
+                avg_buy_price[j] = 0
+            
+            buys = np.flatnonzero((row == SIGNAL_BUY) & (position == 0) & (prices[i] > 0))
+            if len(buys):
+                equity = cash + float(position @ prices[i])
+                budget = equity * max_position_percent / 100
+                
+                for j in buys:
+                    if np.count_nonzero(position) >= max_positions:
+                        break
+                    current_price = prices[i, j]
+                    quantity = int(min(budget, cash) / (current_price * (1 + commission_rate)))
+                    if quantity <= 0:
+                        continue
+                    
+                    cost = quantity * current_price
+                    commission = cost * commission_rate
+                    cash -= cost + commission
+                    position[j] = quantity
+                    avg_buy_price[j] = current_price
+                    trades.append({
+                        'date': dates[i],
+                        'stock_code': codes[j],
+                        'type': 'BUY',
+                        'price': current_price,
+                        'quantity': quantity,
+                        'commission': commission
+                    })
+            
+            cash_at[i] = cash
+            position_at[i] = position
+            changed[i] = True
+        
+        # 마지막 상태 변경 시점의 값을 이후 봉으로 전파
+        last_change = np.maximum.accumulate(np.where(changed, np.arange(n_bars), 0))
+        cash_series = cash_at[last_change]
+        position_value = (position_at[last_change] * prices).sum(axis=1)
+        equity = cash_series + position_value
+        
+        # 마지막에 남은 포지션 청산
+        for j in np.flatnonzero(position > 0):
+            final_price = prices[-1, j]
+            revenue = position[j] * final_price
+            commission = revenue * commission_rate
+            net_revenue = revenue - commission
+            
+            profit = net_revenue - (position[j] * avg_buy_price[j])
+            profit_rate = (profit / (position[j] * avg_buy_price[j])) * 100
+            
+            cash += net_revenue
+            trades.append({
+                'date': dates[-1],
+                'stock_code': codes[j],
+                'type': 'SELL',
+                'price': final_price,
+                'quantity': int(position[j]),
+                'commission': commission,
+                'profit': profit,
+                'profit_rate': profit_rate
+            })
+        
+        equity_curve = [
+            {'date': d, 'equity': e, 'cash': c, 'position_value': v}
+            for d, e, c, v in zip(dates, equity.tolist(), cash_series.tolist(), position_value.tolist())
+        ]
+        
+        result = self._build_result(initial_capital, cash, trades, equity, equity_curve)
+        result['stock_codes'] = codes
+        result['symbol_returns'] = {
+            code: sum(t.get('profit', 0) for t in trades if t['stock_code'] == code)
+            for code in codes
+        }
+        return result
+    
+    def _build_result(
+        self,
+        initial_capital: float,
+        final_cash: float,
+        trades: List[Dict[str, Any]],
+        equity: np.ndarray,
+        equity_curve: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        성과 지표 계산 및 결과 딕셔너리 생성
+        
+        Args:
+            initial_capital: 초기 자본
+            final_cash: 청산 후 최종 현금
+            trades: 거래 내역
+            equity: 봉별 자산 가치 배열
+            equity_curve: 봉별 자산 곡선 레코드
+        """
+        final_equity = final_cash
         total_return = ((final_equity - initial_capital) / initial_capital) * 100
         
         # 승률 계산
@@ -215,14 +740,14 @@ class Backtester:
         win_rate = (len(win_trades) / len(sell_trades) * 100) if sell_trades else 0
         
         # MDD (Maximum Drawdown) 계산
-        equity_series = pd.Series([e['equity'] for e in equity_curve])
-        running_max = equity_series.expanding().max()
-        drawdown = (equity_series - running_max) / running_max * 100
+        running_max = np.maximum.accumulate(equity)
+        drawdown = (equity - running_max) / running_max * 100
         max_drawdown = drawdown.min()
         
         # 샤프 비율 계산 (간단 버전)
-        returns = equity_series.pct_change().dropna()
-        sharpe_ratio = (returns.mean() / returns.std() * np.sqrt(252)) if len(returns) > 0 and returns.std() > 0 else 0
+        returns = equity[1:] / equity[:-1] - 1
+        returns_std = returns.std(ddof=1) if len(returns) > 1 else 0
+        sharpe_ratio = (returns.mean() / returns_std * np.sqrt(252)) if len(returns) > 0 and returns_std > 0 else 0
         
         result = {
             'initial_capital': initial_capital,
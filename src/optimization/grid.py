@@ -0,0 +1,327 @@
+"""파라미터 그리드 일괄 평가
+
+파라미터 조합 P개에 대한 신호를 (P x 시간) 행렬로 한 번에 만들고, 백테스트도
+시간축 한 번 순회로 P개 조합을 동시에 시뮬레이션한다.
+
+- SMA/볼린저는 누적합 한 번으로 모든 윈도우의 이동평균/표준편차를 계산
+- 그 외 전략은 조합마다 generate_signals()로 신호만 만들고 시뮬레이션은 일괄 처리
+
+결과는 점수순 표(DataFrame)와 그리드 축 모양의 지표 배열(히트맵용)로 돌려주며,
+상위 셀을 BayesianOptimizer.optimize_strategy(warm_start=...)에 넘겨 탐색을 이어갈 수 있다.
+"""
+import itertools
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..logger import get_logger
+from ..strategy.base import SIGNAL_BUY, SIGNAL_SELL, SIGNAL_HOLD
+from ..strategy.bollinger_strategy import BollingerStrategy
+from ..strategy.sma_strategy import SMAStrategy
+from .backtester import Backtester
+from .optimizer import objective_score
+
+logger = get_logger(__name__)
+
+
+def _rolling_sums(values: np.ndarray, windows: np.ndarray) -> np.ndarray:
+    """
+    누적합으로 여러 윈도우의 이동합을 한 번에 계산
+
+    Returns:
+        (윈도우 수 x 시간) 배열. 윈도우가 채워지기 전은 NaN
+    """
+    n = len(values)
+    csum = np.concatenate(([0.0], np.cumsum(values)))
+    t = np.arange(n)
+    start = t[None, :] + 1 - windows[:, None]
+    sums = csum[t + 1][None, :] - csum[np.clip(start, 0, None)]
+    return np.where(start >= 0, sums, np.nan)
+
+
+def _warmup_mask(warmup: np.ndarray, n: int) -> np.ndarray:
+    """조합별로 신호를 내지 않는 초기 구간 마스크 (P x 시간)"""
+    return np.arange(n)[None, :] < warmup[:, None]
+
+
+def _threshold_matrix(buy_mask: np.ndarray, sell_mask: np.ndarray, warmup: np.ndarray) -> np.ndarray:
+    """threshold_signals()의 (P x 시간) 버전"""
+    signals = np.where(buy_mask, SIGNAL_BUY, np.where(sell_mask, SIGNAL_SELL, SIGNAL_HOLD)).astype(np.int8)
+    signals[_warmup_mask(warmup, signals.shape[1])] = SIGNAL_HOLD
+    return signals
+
+
+def sma_grid_signals(close: np.ndarray, short_windows: Sequence[int],
+                     long_windows: Sequence[int]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    SMA 크로스 신호 일괄 생성 (SMAStrategy.generate_signals와 동일한 규칙)
+
+    Returns:
+        (신호 (S x L x 시간), 유효 조합 마스크 (S x L), short < long)
+    """
+    close = np.asarray(close, dtype=float)
+    short_windows = np.asarray(short_windows, dtype=np.int64)
+    long_windows = np.asarray(long_windows, dtype=np.int64)
+    windows = np.union1d(short_windows, long_windows)
+
+    sma = _rolling_sums(close, windows) / windows[:, None]
+    index = {w: i for i, w in enumerate(windows.tolist())}
+    short = sma[[index[w] for w in short_windows.tolist()]]
+    long = sma[[index[w] for w in long_windows.tolist()]]
+
+    diff = (short[:, None, :] - long[None, :, :]).reshape(-1, len(close))
+    prev = np.full_like(diff, np.nan)
+    prev[:, 1:] = diff[:, :-1]
+
+    # cross_signals: warmup = min_periods - 1 = long_window, 직전 봉까지 warmup 이후여야 함
+    warmup = np.repeat(long_windows[None, :] + 1, len(short_windows), axis=0).reshape(-1)
+    signals = _threshold_matrix((prev < 0) & (diff > 0), (prev > 0) & (diff < 0), warmup)
+
+    valid = short_windows[:, None] < long_windows[None, :]
+    return signals.reshape(len(short_windows), len(long_windows), -1), valid
+
+
+def bollinger_grid_signals(close: np.ndarray, windows: Sequence[int],
+                           window_devs: Sequence[float]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    볼린저 밴드 신호 일괄 생성 (BollingerStrategy.generate_signals와 동일한 규칙)
+
+    Returns:
+        (신호 (W x D x 시간), 유효 조합 마스크 (W x D))
+    """
+    close = np.asarray(close, dtype=float)
+    windows = np.asarray(windows, dtype=np.int64)
+    devs = np.asarray(window_devs, dtype=float)
+
+    # 분산 계산의 자릿수 손실을 줄이기 위해 평균을 빼고 누적
+    centered = close - close.mean()
+    mean = _rolling_sums(centered, windows) / windows[:, None]
+    var = _rolling_sums(centered ** 2, windows) / windows[:, None] - mean ** 2
+    std = np.sqrt(np.clip(var, 0, None))
+    mean += close.mean()
+
+    high = mean[:, None, :] + devs[None, :, None] * std[:, None, :]
+    low = mean[:, None, :] - devs[None, :, None] * std[:, None, :]
+
+    n = len(close)
+    warmup = np.repeat(windows, len(devs))
+    signals = _threshold_matrix(
+        (close <= low).reshape(-1, n), (close >= high).reshape(-1, n), warmup
+    )
+    return signals.reshape(len(windows), len(devs), n), np.ones((len(windows), len(devs)), dtype=bool)
+
+
+# 전략 클래스 -> (그리드 축 파라미터 이름, 일괄 신호 함수)
+GRID_SIGNALS = {
+    SMAStrategy: (('short_window', 'long_window'), sma_grid_signals),
+    BollingerStrategy: (('window', 'window_dev'), bollinger_grid_signals),
+}
+
+
+def simulate_signals(
+    close: np.ndarray,
+    signals: np.ndarray,
+    initial_capital: float = 10000000,
+    commission_rate: float = 0.00015
+) -> Dict[str, np.ndarray]:
+    """
+    (P x 시간) 신호 행렬을 P개 계좌로 동시에 시뮬레이션
+
+    Backtester.run_vectorized_backtest()와 같은 체결 규칙(현금 95% 매수, 전량 매도,
+    종료 시 청산)과 같은 성과 지표 계산을 조합 축으로 벡터화했다.
+
+    Returns:
+        {'total_return', 'sharpe_ratio', 'win_rate', 'max_drawdown', 'total_trades',
+         'final_equity'}: 각각 (P,) 배열
+    """
+    close = np.asarray(close, dtype=float)
+    n_params, n_bars = signals.shape
+
+    cash = np.full(n_params, float(initial_capital))
+    position = np.zeros(n_params, dtype=np.int64)
+    avg_buy_price = np.zeros(n_params)
+    trades = np.zeros(n_params, dtype=np.int64)
+    sells = np.zeros(n_params, dtype=np.int64)
+    wins = np.zeros(n_params, dtype=np.int64)
+    equity = np.empty((n_params, n_bars))
+
+    # 신호가 있는 봉에서만 상태를 갱신하고, 그 사이 자산은 보유수량 x 종가로 채움
+    active = np.flatnonzero(signals.any(axis=0))
+    state_cash = np.empty((n_params, n_bars))
+    state_position = np.empty((n_params, n_bars), dtype=np.int64)
+    last = 0
+    state_cash[:, 0], state_position[:, 0] = cash, position
+
+    for t in active:
+        if t > last:
+            state_cash[:, last + 1:t] = cash[:, None]
+            state_position[:, last + 1:t] = position[:, None]
+        price = close[t]
+        signal = signals[:, t]
+
+        buy = (signal == SIGNAL_BUY) & (position == 0) & (cash > 0)
+        if buy.any():
+            quantity = np.floor(cash * 0.95 / price).astype(np.int64)
+            cost = quantity * price
+            total_cost = cost + cost * commission_rate
+            filled = buy & (quantity > 0) & (total_cost <= cash)
+            cash = np.where(filled, cash - total_cost, cash)
+            position = np.where(filled, quantity, position)
+            avg_buy_price = np.where(filled, price, avg_buy_price)
+            trades += filled
+
+        sell = (signal == SIGNAL_SELL) & (position > 0)
+        if sell.any():
+            revenue = position * price
+            net_revenue = revenue - revenue * commission_rate
+            profit = net_revenue - position * avg_buy_price
+            cash = np.where(sell, cash + net_revenue, cash)
+            wins += sell & (profit > 0)
+            sells += sell
+            trades += sell
+            position = np.where(sell, 0, position)
+            avg_buy_price = np.where(sell, 0.0, avg_buy_price)
+
+        state_cash[:, t], state_position[:, t] = cash, position
+        last = t
+
+    if last < n_bars - 1:
+        state_cash[:, last + 1:] = cash[:, None]
+        state_position[:, last + 1:] = position[:, None]
+    equity = state_cash + state_position * close[None, :]
+
+    # 종료 시 남은 포지션 청산
+    holding = position > 0
+    revenue = position * close[-1]
+    net_revenue = revenue - revenue * commission_rate
+    profit = net_revenue - position * avg_buy_price
+    cash = np.where(holding, cash + net_revenue, cash)
+    wins += holding & (profit > 0)
+    sells += holding
+    trades += holding
+
+    running_max = np.maximum.accumulate(equity, axis=1)
+    max_drawdown = ((equity - running_max) / running_max * 100).min(axis=1)
+
+    returns = equity[:, 1:] / equity[:, :-1] - 1
+    if returns.shape[1] > 1:
+        returns_std = returns.std(axis=1, ddof=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sharpe = np.where(returns_std > 0, returns.mean(axis=1) / returns_std * np.sqrt(252), 0.0)
+    else:
+        sharpe = np.zeros(n_params)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        win_rate = np.where(sells > 0, wins / sells * 100, 0.0)
+
+    return {
+        'final_equity': cash,
+        'total_return': (cash - initial_capital) / initial_capital * 100,
+        'total_trades': trades,
+        'win_rate': win_rate,
+        'max_drawdown': max_drawdown,
+        'sharpe_ratio': sharpe,
+    }
+
+
+class GridOptimizer:
+    """전략 파라미터 그리드 전수 평가기"""
+
+    def __init__(self, backtester: Backtester = None):
+        self.backtester = backtester or Backtester()
+
+    def grid_signals(self, strategy_class, df: pd.DataFrame,
+                     grid: Dict[str, Sequence]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        그리드 전체 신호 생성
+
+        Returns:
+            (신호 (축1 x 축2 x ... x 시간), 유효 조합 마스크 (축1 x 축2 x ...))
+        """
+        names = tuple(grid)
+        fast = GRID_SIGNALS.get(strategy_class)
+        if fast is not None and fast[0] == names:
+            return fast[1](df['close'].to_numpy(dtype=float), *(grid[name] for name in names))
+
+        # 일괄 계산이 없는 전략: 조합별 generate_signals (시뮬레이션은 일괄)
+        shape = tuple(len(values) for values in grid.values())
+        signals = np.zeros(shape + (len(df),), dtype=np.int8)
+        for index in itertools.product(*(range(n) for n in shape)):
+            config = {name: grid[name][i] for name, i in zip(names, index)}
+            signals[index] = strategy_class(config=config).generate_signals(df)
+        return signals, np.ones(shape, dtype=bool)
+
+    def evaluate(
+        self,
+        strategy_class,
+        stock_code: str,
+        grid: Dict[str, Sequence],
+        days: int = 90,
+        objective: str = 'sharpe_ratio',
+        initial_capital: float = 10000000,
+        commission_rate: float = 0.00015
+    ) -> Dict[str, Any]:
+        """
+        파라미터 그리드 전수 평가
+
+        Args:
+            strategy_class: 전략 클래스
+            stock_code: 종목 코드
+            grid: 파라미터별 후보 값 {'param_name': [v1, v2, ...], ...}
+            days: 백테스트 기간 (일)
+            objective: 점수 기준 (BayesianOptimizer와 동일)
+
+        Returns:
+            {
+                'table': 점수 내림차순 DataFrame (파라미터 + 지표 + score),
+                'axes': {파라미터: 후보 값 배열},
+                'surface': {지표/score: 그리드 모양 배열 (무효 조합은 NaN)},
+            }
+        """
+        df = self.backtester.get_historical_data(stock_code, days)
+        if df.empty:
+            logger.error("No historical data available")
+            return {'table': pd.DataFrame(), 'axes': {}, 'surface': {}}
+
+        axes = {name: np.asarray(values) for name, values in grid.items()}
+        signals, valid = self.grid_signals(strategy_class, df, grid)
+        shape = valid.shape
+        flat_valid = valid.reshape(-1)
+
+        metrics = simulate_signals(
+            df['close'].to_numpy(dtype=float), signals.reshape(-1, len(df))[flat_valid],
+            initial_capital, commission_rate
+        )
+        metrics['score'] = objective_score(metrics, objective)
+
+        surface = {}
+        for key, values in metrics.items():
+            cells = np.full(flat_valid.shape, np.nan)
+            cells[flat_valid] = values
+            surface[key] = cells.reshape(shape)
+
+        mesh = np.meshgrid(*axes.values(), indexing='ij')
+        table = pd.DataFrame({name: m.reshape(-1)[flat_valid] for name, m in zip(axes, mesh)})
+        for key, values in metrics.items():
+            table[key] = values
+        table = table.sort_values('score', ascending=False, kind='stable').reset_index(drop=True)
+
+        logger.info(f"Grid evaluated for {strategy_class.__name__} on {stock_code}: "
+                    f"{len(table)} combinations, best score {table['score'].iloc[0]:.4f}")
+
+        return {'table': table, 'axes': axes, 'surface': surface}
+
+    @staticmethod
+    def best_cells(result: Dict[str, Any], k: int = 5) -> List[Dict[str, Any]]:
+        """
+        상위 k개 셀 (BayesianOptimizer.optimize_strategy(warm_start=...) 입력 형식)
+
+        Returns:
+            [{'params': {...}, 'score': float}, ...]
+        """
+        names = list(result['axes'])
+        return [
+            {'params': {name: record[name] for name in names}, 'score': float(record['score'])}
+            for record in result['table'].head(k).to_dict('records')
+        ]
@@ -0,0 +1,255 @@
+"""JIT 컴파일 백테스트 커널
+
+상태를 가진 전략(이전 봉 차이로 크로스를 판정하는 SMA/MACD, 포지션에 따라 달라지는
+청산 규칙 등)은 generate_signals()로 미리 신호를 만들 수 없다. 이런 전략을 위해
+Backtester.run_backtest()의 현금/포지션/수수료 루프를 NumPy 배열 위에서 돌리는 커널을 둔다.
+
+신호 함수는 봉마다 호출되며 다음 시그니처를 따른다:
+
+    signal_fn(i, open_, high, low, close, volume, params, state, position, avg_buy_price) -> int
+
+- params: 전략 파라미터 (float64 배열, 읽기 전용)
+- state: 전략 내부 상태 (float64 배열, 신호 함수가 직접 갱신)
+- 반환값: SIGNAL_BUY / SIGNAL_SELL / SIGNAL_HOLD
+
+Numba가 설치되어 있으면 커널과 신호 함수를 네이티브 코드로 컴파일하고,
+없으면 같은 코드를 순수 Python으로 실행한다.
+"""
+import math
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+from ..logger import get_logger
+from ..strategy.base import BaseStrategy, SIGNAL_BUY, SIGNAL_SELL, SIGNAL_HOLD
+from ..strategy.macd_strategy import MACDStrategy
+from ..strategy.sma_strategy import SMAStrategy
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba 미설치 시 같은 코드를 Python으로 실행
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+logger = get_logger(__name__)
+
+
+@njit
+def backtest_kernel(open_, high, low, close, volume, signal_fn, params, state,
+                    start, initial_capital, commission_rate):
+    """
+    봉 단위 백테스트 루프 (run_backtest()와 같은 체결 규칙)
+
+    start 이전 봉은 신호 함수의 상태 갱신(지표 준비)에만 사용한다.
+
+    Returns:
+        (봉별 현금, 봉별 보유수량, 거래 봉 위치, 거래 방향, 거래 가격, 거래 수량,
+         수수료, 손익, 손익률, 거래 수, 청산 후 최종 현금)
+    """
+    n = len(close)
+    cash_at = np.zeros(n)
+    position_at = np.zeros(n, dtype=np.int64)
+
+    # 매수/매도가 번갈아 일어나므로 거래 수는 봉 수 + 청산 1회를 넘지 않음
+    trade_index = np.zeros(n + 1, dtype=np.int64)
+    trade_side = np.zeros(n + 1, dtype=np.int8)
+    trade_price = np.zeros(n + 1)
+    trade_quantity = np.zeros(n + 1, dtype=np.int64)
+    trade_commission = np.zeros(n + 1)
+    trade_profit = np.zeros(n + 1)
+    trade_profit_rate = np.zeros(n + 1)
+    n_trades = 0
+
+    cash = initial_capital
+    position = 0
+    avg_buy_price = 0.0
+
+    for i in range(n):
+        signal = signal_fn(i, open_, high, low, close, volume, params, state, position, avg_buy_price)
+        if i < start:
+            continue
+        current_price = close[i]
+
+        if signal == SIGNAL_BUY and position == 0 and cash > 0:
+            # 매수: 가용 현금의 95% 사용
+            quantity = int(cash * 0.95 / current_price)
+            if quantity > 0:
+                cost = quantity * current_price
+                commission = cost * commission_rate
+                total_cost = cost + commission
+                if total_cost <= cash:
+                    cash -= total_cost
+                    position = quantity
+                    avg_buy_price = current_price
+
+                    trade_index[n_trades] = i
+                    trade_side[n_trades] = SIGNAL_BUY
+                    trade_price[n_trades] = current_price
+                    trade_quantity[n_trades] = quantity
+                    trade_commission[n_trades] = commission
+                    n_trades += 1
+
+        elif signal == SIGNAL_SELL and position > 0:
+            revenue = position * current_price
+            commission = revenue * commission_rate
+            net_revenue = revenue - commission
+            profit = net_revenue - (position * avg_buy_price)
+
+            cash += net_revenue
+
+            trade_index[n_trades] = i
+            trade_side[n_trades] = SIGNAL_SELL
+            trade_price[n_trades] = current_price
+            trade_quantity[n_trades] = position
+            trade_commission[n_trades] = commission
+            trade_profit[n_trades] = profit
+            trade_profit_rate[n_trades] = (profit / (position * avg_buy_price)) * 100
+            n_trades += 1
+
+            position = 0
+            avg_buy_price = 0.0
+
+        cash_at[i] = cash
+        position_at[i] = position
+
+    # 마지막에 포지션이 남아있으면 청산
+    if position > 0:
+        final_price = close[n - 1]
+        revenue = position * final_price
+        commission = revenue * commission_rate
+        net_revenue = revenue - commission
+        profit = net_revenue - (position * avg_buy_price)
+
+        cash += net_revenue
+
+        trade_index[n_trades] = n - 1
+        trade_side[n_trades] = SIGNAL_SELL
+        trade_price[n_trades] = final_price
+        trade_quantity[n_trades] = position
+        trade_commission[n_trades] = commission
+        trade_profit[n_trades] = profit
+        trade_profit_rate[n_trades] = (profit / (position * avg_buy_price)) * 100
+        n_trades += 1
+
+    return (cash_at, position_at, trade_index, trade_side, trade_price, trade_quantity,
+            trade_commission, trade_profit, trade_profit_rate, n_trades, cash)
+
+
+@njit
+def sma_cross_signal(i, open_, high, low, close, volume, params, state, position, avg_buy_price):
+    """
+    SMAStrategy.analyze()와 같은 골든/데드 크로스 신호
+
+    params: [short_window, long_window]
+    state: [단기 누적합, 장기 누적합, 이전 차이(NaN: 없음)]
+    """
+    short_window = int(params[0])
+    long_window = int(params[1])
+    price = close[i]
+
+    # indicators.SMA와 같은 순서로 누적합 갱신 (더한 뒤 윈도우 밖 값을 뺌)
+    state[0] += price
+    if i + 1 > short_window:
+        state[0] -= close[i - short_window]
+    state[1] += price
+    if i + 1 > long_window:
+        state[1] -= close[i - long_window]
+
+    if i + 1 < long_window + 1:
+        return SIGNAL_HOLD
+
+    sma_short = state[0] / short_window if i + 1 >= short_window else math.nan
+    sma_long = state[1] / long_window
+    current_diff = sma_short - sma_long
+
+    signal = SIGNAL_HOLD
+    prev_diff = state[2]
+    if prev_diff < 0 and current_diff > 0:
+        signal = SIGNAL_BUY
+    elif prev_diff > 0 and current_diff < 0:
+        signal = SIGNAL_SELL
+
+    state[2] = current_diff
+    return signal
+
+
+@njit
+def _ema_update(state, offset, x, alpha, min_periods):
+    """indicators.EMA.update() (state[offset]: 평균, state[offset + 1]: 개수)"""
+    if math.isnan(x):
+        mean = state[offset]
+        return mean if state[offset + 1] >= min_periods else math.nan
+    state[offset + 1] += 1
+    if state[offset + 1] == 1:
+        state[offset] = x
+    else:
+        state[offset] += alpha * (x - state[offset])
+    return state[offset] if state[offset + 1] >= min_periods else math.nan
+
+
+@njit
+def macd_cross_signal(i, open_, high, low, close, volume, params, state, position, avg_buy_price):
+    """
+    MACDStrategy.analyze()와 같은 MACD/시그널 크로스 신호
+
+    params: [window_fast, window_slow, window_sign]
+    state: [빠른 EMA, 개수, 느린 EMA, 개수, 시그널 EMA, 개수, 이전 차이(NaN: 없음)]
+    """
+    window_fast = params[0]
+    window_slow = params[1]
+    window_sign = params[2]
+    price = close[i]
+
+    fast = _ema_update(state, 0, price, 2.0 / (window_fast + 1.0), window_fast)
+    slow = _ema_update(state, 2, price, 2.0 / (window_slow + 1.0), window_slow)
+    macd_line = fast - slow
+    signal_line = _ema_update(state, 4, macd_line, 2.0 / (window_sign + 1.0), window_sign)
+
+    if i + 1 < window_slow + window_sign + 1:
+        return SIGNAL_HOLD
+
+    current_diff = macd_line - signal_line
+
+    signal = SIGNAL_HOLD
+    prev_diff = state[6]
+    if prev_diff < 0 and current_diff > 0:
+        signal = SIGNAL_BUY
+    elif prev_diff > 0 and current_diff < 0:
+        signal = SIGNAL_SELL
+
+    state[6] = current_diff
+    return signal
+
+
+def _sma_spec(strategy: SMAStrategy):
+    return (sma_cross_signal,
+            np.array([strategy.short_window, strategy.long_window], dtype=float),
+            np.array([0.0, 0.0, np.nan]))
+
+
+def _macd_spec(strategy: MACDStrategy):
+    return (macd_cross_signal,
+            np.array([strategy.window_fast, strategy.window_slow, strategy.window_sign], dtype=float),
+            np.array([np.nan, 0.0, np.nan, 0.0, np.nan, 0.0, np.nan]))
+
+
+# 전략 클래스 -> (신호 함수, params, 초기 state) 생성기
+JIT_SIGNALS = {
+    SMAStrategy: _sma_spec,
+    MACDStrategy: _macd_spec,
+}
+
+
+def signal_spec(strategy: BaseStrategy) -> Optional[Tuple[Callable, np.ndarray, np.ndarray]]:
+    """
+    전략 인스턴스의 JIT 신호 함수와 params/state 배열 (등록되지 않은 전략은 None)
+
+    호출할 때마다 새 state 배열을 만들므로 백테스트 간에 상태가 공유되지 않는다.
+    """
+    builder = JIT_SIGNALS.get(type(strategy))
+    return builder(strategy) if builder is not None else None
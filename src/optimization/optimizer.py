@@ -1,17 +1,163 @@
 """베이지안 최적화 엔진"""
 import numpy as np
+import pandas as pd
 from typing import Dict, List, Any, Callable, Tuple
-from bayes_opt import BayesianOptimization
+from bayes_opt import BayesianOptimization, UtilityFunction
 from bayes_opt.logger import JSONLogger
 from bayes_opt.event import Events
+from bayes_opt.util import NotUniqueError
+import copy
 import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from ..config import get_config
 from ..logger import get_logger
+from ..strategy.indicator_cache import get_indicator_cache
 from .backtester import Backtester
 
 logger = get_logger(__name__)
 
 
+def _process_params(params: Dict[str, float]) -> Dict[str, Any]:
+    """정수형 파라미터 처리 (예: RSI period는 정수여야 함)"""
+    processed_params = {}
+    for key, value in params.items():
+        if 'period' in key or 'window' in key:
+            processed_params[key] = int(round(value))
+        else:
+            processed_params[key] = value
+    return processed_params
+
+
+def objective_score(metrics: Dict[str, Any], objective: str):
+    """
+    목적 함수 값 계산 (스칼라 결과와 GridOptimizer의 조합별 배열 결과 모두 지원)
+    
+    Args:
+        metrics: 백테스트 결과 딕셔너리 (값이 스칼라 또는 배열)
+        objective: 'total_return', 'sharpe_ratio', 'win_rate' 또는 그 외(복합 점수)
+    """
+    if objective in ('total_return', 'sharpe_ratio', 'win_rate'):
+        score = np.asarray(metrics[objective], dtype=float)
+    else:
+        # 복합 점수: 수익률 + 샤프비율 + 승률
+        score = (
+            np.asarray(metrics['total_return'], dtype=float) * 0.4 +
+            np.asarray(metrics['sharpe_ratio'], dtype=float) * 10 * 0.3 +  # 스케일 조정
+            np.asarray(metrics['win_rate'], dtype=float) * 0.3
+        )
+    
+    # 거래 횟수가 너무 적으면 패널티
+    score = np.where(np.asarray(metrics['total_trades']) < 5, score * 0.5, score)
+    
+    # MDD가 너무 크면 패널티 (-30% 이상 손실)
+    score = np.where(np.asarray(metrics['max_drawdown']) < -30, score * 0.7, score)
+    
+    return score
+
+
+def _evaluate_params(
+    backtester: Backtester,
+    strategy_class,
+    stock_code: str,
+    params: Dict[str, float],
+    objective: str,
+    backtest_kwargs: Dict[str, Any] = None
+) -> float:
+    """
+    베이지안 최적화가 최대화할 목적 함수 값 계산
+    
+    프로세스 풀 워커에서도 호출되므로 모듈 수준 함수로 둔다.
+    backtest_kwargs는 run_backtest()에 그대로 전달한다 (기본: 최근 90일).
+    Backtester(vectorized=True)면 generate_signals() 기반으로 평가하므로, 같은 기간
+    파라미터를 공유하는 시도끼리는 지표 캐시(get_indicator_cache)를 재사용한다.
+    """
+    processed_params = _process_params(params)
+    
+    # 전략 인스턴스 생성
+    strategy = strategy_class(config=processed_params)
+    
+    # 백테스트 실행
+    result = backtester.run_backtest(
+        strategy=strategy,
+        stock_code=stock_code,
+        **(backtest_kwargs or {'days': 90})  # 기본 3개월 데이터로 테스트
+    )
+    
+    # 목적 함수 값 계산
+    score = float(objective_score(result, objective))
+    
+    logger.info(f"Params: {processed_params} -> Score: {score:.4f} "
+               f"(Return: {result['total_return']:.2f}%, "
+               f"Sharpe: {result['sharpe_ratio']:.2f}, "
+               f"Win Rate: {result['win_rate']:.2f}%)")
+    
+    return score
+
+
+def _run_study(
+    backtester: Backtester,
+    strategy_class,
+    stock_code: str,
+    param_bounds: Dict[str, Tuple[float, float]],
+    n_iterations: int,
+    save_path: str
+) -> Dict[str, Any]:
+    """프로세스 풀 워커: (전략, 종목) 조합 하나를 독립적으로 최적화"""
+    optimizer = BayesianOptimizer(backtester)
+    return optimizer.optimize_strategy(
+        strategy_class=strategy_class,
+        stock_code=stock_code,
+        param_bounds=param_bounds,
+        n_iterations=n_iterations,
+        save_path=save_path
+    )
+
+
+def _run_fold(
+    backtester: Backtester,
+    strategy_class,
+    stock_code: str,
+    param_bounds: Dict[str, Tuple[float, float]],
+    data: pd.DataFrame,
+    train: Tuple[int, int],
+    test: Tuple[int, int],
+    n_iterations: int,
+    init_points: int,
+    objective: str
+) -> Dict[str, Any]:
+    """프로세스 풀 워커: 워크포워드 폴드 하나를 학습 구간에서 최적화하고 검증 구간에서 평가"""
+    optimizer = BayesianOptimizer(backtester)
+    study = optimizer.optimize_strategy(
+        strategy_class=strategy_class,
+        stock_code=stock_code,
+        param_bounds=param_bounds,
+        n_iterations=n_iterations,
+        init_points=init_points,
+        objective=objective,
+        data=data,
+        start=train[0],
+        end=train[1]
+    )
+    
+    test_result = backtester.run_backtest(
+        strategy=strategy_class(config=study['best_params']),
+        stock_code=stock_code,
+        data=data,
+        start=test[0],
+        end=test[1]
+    )
+    
+    return {
+        'best_params': study['best_params'],
+        'train_score': study['best_score'],
+        'train_result': study['backtest_result'],
+        'test_result': test_result
+    }
+
+
 class BayesianOptimizer:
     """
     베이지안 최적화를 사용한 전략 파라미터 튜닝
@@ -29,11 +175,23 @@ class BayesianOptimizer:
         n_iterations: int = 50,
         init_points: int = 10,
         objective: str = 'sharpe_ratio',  # 'total_return', 'sharpe_ratio', 'win_rate'
-        save_path: str = None
+        save_path: str = None,
+        batch_size: int = 1,
+        n_workers: int = None,
+        liar: str = 'min',
+        warm_start: List[Dict[str, Any]] = None,
+        days: int = 90,
+        data: pd.DataFrame = None,
+        start: int = 0,
+        end: int = None
     ) -> Dict[str, Any]:
         """
         전략 파라미터 최적화
         
+        batch_size가 2 이상이면 ask/tell 배치 모드로 동작한다. 매 라운드마다
+        constant liar(또는 kriging believer)로 batch_size개 후보를 제안하고,
+        프로세스 풀에서 동시에 백테스트한 뒤 결과를 한꺼번에 등록한다.
+        
         Args:
             strategy_class: 최적화할 전략 클래스
             stock_code: 종목 코드
@@ -42,6 +200,15 @@ class BayesianOptimizer:
             init_points: 초기 랜덤 탐색 포인트 수
             objective: 최적화 목표 ('total_return', 'sharpe_ratio', 'win_rate')
             save_path: 결과 저장 경로
+            batch_size: 라운드당 동시 평가할 후보 수 (1이면 기존 순차 maximize)
+            n_workers: 배치 평가 워커 프로세스 수 (None: 설정값 optimization.n_workers)
+            liar: 가짜 관측값 전략 ('min', 'mean', 'max': constant liar, 'kriging': GP 예측값)
+            warm_start: 미리 평가한 관측값 [{'params': {...}, 'score': float}, ...]
+                (예: GridOptimizer.best_cells()). 탐색 전에 GP에 등록한다.
+            days: 백테스트 기간 (일)
+            data: 미리 조회한 OHLCV (주어지면 days 대신 사용, 워크포워드 폴드용)
+            start: data 중 학습(평가) 구간 시작 봉 위치
+            end: data 중 학습(평가) 구간 끝 봉 위치 (미포함)
             
         Returns:
             최적화 결과 딕셔너리
@@ -50,58 +217,14 @@ class BayesianOptimizer:
         logger.info(f"Parameter bounds: {param_bounds}")
         logger.info(f"Iterations: {n_iterations}, Init points: {init_points}, Objective: {objective}")
         
+        backtest_kwargs = {'days': days, 'data': data, 'start': start, 'end': end}
+        
         # 목적 함수 정의
         def objective_function(**params):
             """
             베이지안 최적화가 최대화할 목적 함수
             """
-            # 정수형 파라미터 처리 (예: RSI period는 정수여야 함)
-            processed_params = {}
-            for key, value in params.items():
-                if 'period' in key or 'window' in key:
-                    processed_params[key] = int(round(value))
-                else:
-                    processed_params[key] = value
-            
-            # 전략 인스턴스 생성
-            strategy = strategy_class(config=processed_params)
-            
-            # 백테스트 실행
-            result = self.backtester.run_backtest(
-                strategy=strategy,
-                stock_code=stock_code,
-                days=90  # 3개월 데이터로 테스트
-            )
-            
-            # 목적 함수 값 계산
-            if objective == 'total_return':
-                score = result['total_return']
-            elif objective == 'sharpe_ratio':
-                score = result['sharpe_ratio']
-            elif objective == 'win_rate':
-                score = result['win_rate']
-            else:
-                # 복합 점수: 수익률 + 샤프비율 + 승률
-                score = (
-                    result['total_return'] * 0.4 +
-                    result['sharpe_ratio'] * 10 * 0.3 +  # 스케일 조정
-                    result['win_rate'] * 0.3
-                )
-            
-            # 거래 횟수가 너무 적으면 패널티
-            if result['total_trades'] < 5:
-                score *= 0.5
-            
-            # MDD가 너무 크면 패널티
-            if result['max_drawdown'] < -30:  # -30% 이상 손실
-                score *= 0.7
-            
-            logger.info(f"Params: {processed_params} -> Score: {score:.4f} "
-                       f"(Return: {result['total_return']:.2f}%, "
-                       f"Sharpe: {result['sharpe_ratio']:.2f}, "
-                       f"Win Rate: {result['win_rate']:.2f}%)")
-            
-            return score
+            return _evaluate_params(self.backtester, strategy_class, stock_code, params, objective, backtest_kwargs)
         
         # 베이지안 최적화 실행
         optimizer = BayesianOptimization(
@@ -118,11 +241,25 @@ class BayesianOptimizer:
             logger_obj = JSONLogger(path=str(log_path))
             optimizer.subscribe(Events.OPTIMIZATION_STEP, logger_obj)
         
+        if warm_start:
+            self._register_warm_start(optimizer, param_bounds, warm_start)
+        
         # 최적화 실행
-        optimizer.maximize(
-            init_points=init_points,
-            n_iter=n_iterations
-        )
+        if batch_size > 1:
+            self._maximize_batch(
+                optimizer, strategy_class, stock_code, param_bounds, objective,
+                backtest_kwargs=backtest_kwargs,
+                init_points=init_points,
+                n_iterations=n_iterations,
+                batch_size=batch_size,
+                n_workers=n_workers,
+                liar=liar
+            )
+        else:
+            optimizer.maximize(
+                init_points=init_points,
+                n_iter=n_iterations
+            )
         
         # 최적 파라미터 추출
         best_params = optimizer.max['params']
@@ -137,7 +274,7 @@ class BayesianOptimizer:
         final_result = self.backtester.run_backtest(
             strategy=best_strategy,
             stock_code=stock_code,
-            days=90
+            **backtest_kwargs
         )
         
         optimization_result = {
@@ -158,6 +295,7 @@ class BayesianOptimizer:
         logger.info(f"Optimization completed!")
         logger.info(f"Best parameters: {best_params}")
         logger.info(f"Best score: {optimizer.max['target']:.4f}")
+        logger.info(f"Indicator cache: {get_indicator_cache().stats()}")
         logger.info(f"Final backtest - Return: {final_result['total_return']:.2f}%, "
                    f"Win Rate: {final_result['win_rate']:.2f}%, "
                    f"Sharpe: {final_result['sharpe_ratio']:.2f}")
@@ -173,35 +311,181 @@ class BayesianOptimizer:
         
         return optimization_result
     
+    def _register_warm_start(
+        self,
+        optimizer: BayesianOptimization,
+        param_bounds: Dict[str, Tuple[float, float]],
+        observations: List[Dict[str, Any]]
+    ) -> int:
+        """범위 안의 기존 관측값을 옵티마이저에 등록하고 등록 개수를 반환"""
+        registered = 0
+        for observation in observations:
+            params = observation['params']
+            if set(params) != set(param_bounds):
+                continue
+            if not all(low <= params[key] <= high for key, (low, high) in param_bounds.items()):
+                continue
+            try:
+                optimizer.register(params={k: float(v) for k, v in params.items()},
+                                   target=float(observation['score']))
+                registered += 1
+            except NotUniqueError:
+                continue
+        
+        logger.info(f"Warm start: registered {registered}/{len(observations)} observations")
+        return registered
+    
+    def _maximize_batch(
+        self,
+        optimizer: BayesianOptimization,
+        strategy_class,
+        stock_code: str,
+        param_bounds: Dict[str, Tuple[float, float]],
+        objective: str,
+        init_points: int,
+        n_iterations: int,
+        batch_size: int,
+        n_workers: int = None,
+        liar: str = 'min',
+        backtest_kwargs: Dict[str, Any] = None
+    ):
+        """
+        ask/tell 배치 최적화 (maximize()의 병렬 버전)
+        
+        초기 랜덤 포인트와 이후 라운드별 후보를 워커 풀에서 동시에 평가하고
+        optimizer.register()로 등록한다. 총 평가 횟수는 maximize()와 같다.
+        워커가 1개로 정해지면 풀을 만들지 않고 현재 프로세스에서 평가한다.
+        """
+        n_workers = min(self._resolve_workers(n_workers), batch_size)
+        utility = UtilityFunction(kind='ucb', kappa=2.576, xi=0.0)
+        
+        logger.info(f"Batch mode: {batch_size} candidates per round, {n_workers} workers, liar={liar}")
+        
+        # 워커가 1개면 프로세스 풀 없이 순차 경로처럼 바로 평가
+        pool = None
+        if n_workers > 1:
+            pool = ProcessPoolExecutor(
+                max_workers=n_workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        
+        def evaluate(batch: List[Dict[str, float]]):
+            args = [(self.backtester, strategy_class, stock_code, params, objective, backtest_kwargs)
+                    for params in batch]
+            if pool is None:
+                targets = [_evaluate_params(*evaluate_args) for evaluate_args in args]
+            else:
+                futures = [pool.submit(_evaluate_params, *evaluate_args) for evaluate_args in args]
+                targets = [future.result() for future in futures]
+            for params, target in zip(batch, targets):
+                try:
+                    optimizer.register(params=params, target=target)
+                except NotUniqueError:
+                    # 이미 관측한 포인트
+                    logger.debug(f"Skipping duplicate point: {params}")
+        
+        try:
+            # 초기 랜덤 탐색
+            initial = [
+                optimizer.space.array_to_params(optimizer.space.random_sample())
+                for _ in range(max(init_points, 1))
+            ]
+            for start in range(0, len(initial), batch_size):
+                evaluate(initial[start:start + batch_size])
+            
+            # 베이지안 탐색 라운드
+            remaining = n_iterations
+            while remaining > 0:
+                utility.update_params()
+                batch = self._suggest_batch(optimizer, utility, param_bounds, min(batch_size, remaining), liar)
+                evaluate(batch)
+                remaining -= len(batch)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+    
+    def _suggest_batch(
+        self,
+        optimizer: BayesianOptimization,
+        utility: UtilityFunction,
+        param_bounds: Dict[str, Tuple[float, float]],
+        batch_size: int,
+        liar: str
+    ) -> List[Dict[str, float]]:
+        """
+        가짜 관측값(lie)을 임시 공간에 등록해 가며 후보를 batch_size개 제안
+        
+        실제 optimizer에는 아무것도 등록하지 않으므로 기록(res)은 오염되지 않는다.
+        """
+        space = optimizer.space
+        scratch = BayesianOptimization(
+            f=None,
+            pbounds=param_bounds,
+            random_state=optimizer._random_state,
+            verbose=0,
+            allow_duplicate_points=True
+        )
+        for params, target in zip(space.params, space.target):
+            scratch.register(params=params, target=target)
+        
+        if liar == 'mean':
+            lie = float(np.mean(space.target))
+        elif liar == 'max':
+            lie = float(np.max(space.target))
+        else:
+            lie = float(np.min(space.target))
+        
+        batch = []
+        for _ in range(batch_size):
+            params = scratch.suggest(utility)
+            batch.append(params)
+            
+            if liar == 'kriging':
+                # kriging believer: 방금 학습한 GP의 예측 평균을 관측값으로 가정
+                x = scratch.space.params_to_array(params).reshape(1, -1)
+                lie = float(scratch._gp.predict(x)[0])
+            scratch.register(params=params, target=lie)
+        
+        return batch
+    
     def optimize_multiple_strategies(
         self,
         strategy_configs: List[Dict[str, Any]],
         stock_codes: List[str],
         n_iterations: int = 50,
-        save_path: str = None
+        save_path: str = None,
+        n_workers: int = None
     ) -> Dict[str, Dict[str, Any]]:
         """
         여러 전략과 종목에 대해 일괄 최적화
         
+        n_workers가 2 이상이면 (전략, 종목) 조합을 프로세스 풀에 나눠 실행한다.
+        각 조합은 고정된 random_state와 독립된 JSONLogger 파일을 사용하고,
+        결과는 제출 순서대로 모으므로 실행 방식과 무관하게 출력이 동일하다.
+        
         Args:
             strategy_configs: [{'class': StrategyClass, 'param_bounds': {...}}, ...]
             stock_codes: 종목 코드 리스트
             n_iterations: 각 최적화당 반복 횟수
-            save_path: 결과 저장 경로
+            save_path: 결과 저장 경로 (지정 시 optimization_summary.json도 저장)
+            n_workers: 워커 프로세스 수 (None: 설정값 optimization.n_workers, 0: CPU 코어 수)
             
         Returns:
             전략별, 종목별 최적화 결과
         """
-        results = {}
+        n_workers = self._resolve_workers(n_workers)
         
+        studies = []
+        results = {}
         for config in strategy_configs:
-            strategy_class = config['class']
-            param_bounds = config['param_bounds']
-            strategy_name = strategy_class.__name__
-            
+            strategy_name = config['class'].__name__
             results[strategy_name] = {}
-            
             for stock_code in stock_codes:
+                studies.append((config['class'], config['param_bounds'], stock_code))
+        
+        if n_workers <= 1:
+            for strategy_class, param_bounds, stock_code in studies:
+                strategy_name = strategy_class.__name__
                 logger.info(f"\n{'='*60}")
                 logger.info(f"Optimizing {strategy_name} for {stock_code}")
                 logger.info(f"{'='*60}\n")
@@ -219,14 +503,242 @@ class BayesianOptimizer:
                 except Exception as e:
                     logger.error(f"Optimization failed for {strategy_name} on {stock_code}: {e}")
                     results[strategy_name][stock_code] = None
+        else:
+            logger.info(f"Running {len(studies)} optimization studies on {n_workers} worker processes")
+            
+            # 스레드에서 호출될 수 있으므로 fork 대신 spawn 사용
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                mp_context=multiprocessing.get_context('spawn')
+            ) as pool:
+                futures = [
+                    pool.submit(
+                        _run_study, self.backtester, strategy_class, stock_code,
+                        param_bounds, n_iterations, save_path
+                    )
+                    for strategy_class, param_bounds, stock_code in studies
+                ]
+                
+                for (strategy_class, _, stock_code), future in zip(studies, futures):
+                    strategy_name = strategy_class.__name__
+                    try:
+                        results[strategy_name][stock_code] = future.result()
+                        logger.info(f"Optimization finished for {strategy_name} on {stock_code}")
+                    except Exception as e:
+                        logger.error(f"Optimization failed for {strategy_name} on {stock_code}: {e}")
+                        results[strategy_name][stock_code] = None
+        
+        if save_path:
+            self.save_summary(results, save_path)
         
         return results
     
+    def walk_forward(
+        self,
+        strategy_class,
+        stock_code: str,
+        param_bounds: Dict[str, Tuple[float, float]],
+        days: int = 365,
+        train_bars: int = 120,
+        test_bars: int = 30,
+        step: int = None,
+        n_iterations: int = 30,
+        init_points: int = 5,
+        objective: str = 'sharpe_ratio',
+        n_workers: int = None,
+        save_path: str = None,
+        vectorized: bool = True
+    ) -> Dict[str, Any]:
+        """
+        워크포워드 최적화
+        
+        전체 기간을 한 번만 조회한 뒤 (학습 train_bars, 검증 test_bars) 폴드로 굴려 가며
+        학습 구간에서 최적화하고 바로 다음 검증 구간에서 표본 외(OOS) 성과를 측정한다.
+        폴드는 프로세스 풀에서 동시에 실행된다. 기본적으로 벡터화 엔진으로 평가하므로
+        generate_signals()가 지표 캐시(get_indicator_cache)를 거친다. 캐시는 워커 프로세스마다
+        따로 있으므로, 같은 워커가 이어서 처리한 폴드끼리만 지표 배열을 재사용하고 워커 간에는
+        같은 지표가 최대 n_workers번 계산된다 (n_workers=1이면 한 번).
+        
+        Args:
+            strategy_class: 최적화할 전략 클래스
+            stock_code: 종목 코드
+            param_bounds: 파라미터 범위 {'param_name': (min, max), ...}
+            days: 전체 조회 기간 (일)
+            train_bars: 폴드별 학습 구간 봉 수
+            test_bars: 폴드별 검증 구간 봉 수
+            step: 폴드 간 이동 봉 수 (None: test_bars, 검증 구간이 겹치지 않음)
+            n_iterations: 폴드별 최적화 반복 횟수
+            init_points: 폴드별 초기 랜덤 탐색 포인트 수
+            objective: 최적화 목표
+            n_workers: 워커 프로세스 수 (None: 설정값 optimization.n_workers, 0: CPU 코어 수)
+            save_path: 결과 저장 경로
+            vectorized: True면 self.backtester가 벡터화 엔진이 아니어도 벡터화 엔진으로 평가
+            
+        Returns:
+            {
+                'best_params': 가장 최근 폴드의 최적 파라미터 (실거래 적용 후보),
+                'folds': 폴드별 학습/검증 결과,
+                'backtest_result': 검증 구간 성과 집계 (save_summary() 호환),
+            }
+        """
+        step = step or test_bars
+        backtester = self.backtester
+        if vectorized and not backtester.vectorized:
+            backtester = copy.copy(backtester)
+            backtester.vectorized = True
+        data = backtester.get_historical_data(stock_code, days)
+        
+        folds = []
+        start = 0
+        while start + train_bars + test_bars <= len(data):
+            folds.append(((start, start + train_bars), (start + train_bars, start + train_bars + test_bars)))
+            start += step
+        
+        if not folds:
+            raise ValueError(f"Not enough data for walk-forward: {len(data)} bars < "
+                             f"train {train_bars} + test {test_bars}")
+        
+        n_workers = min(self._resolve_workers(n_workers), len(folds))
+        logger.info(f"Walk-forward {strategy_class.__name__} on {stock_code}: {len(folds)} folds "
+                    f"(train {train_bars}, test {test_bars}, step {step}), {n_workers} workers")
+        
+        args = [
+            (backtester, strategy_class, stock_code, param_bounds, data, train, test,
+             n_iterations, init_points, objective)
+            for train, test in folds
+        ]
+        if n_workers <= 1:
+            fold_results = [_run_fold(*fold_args) for fold_args in args]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                mp_context=multiprocessing.get_context('spawn')
+            ) as pool:
+                futures = [pool.submit(_run_fold, *fold_args) for fold_args in args]
+                fold_results = [future.result() for future in futures]
+        
+        dates = data['date']
+        fold_summaries = []
+        for i, ((train, test), fold) in enumerate(zip(folds, fold_results)):
+            train_result, test_result = fold['train_result'], fold['test_result']
+            fold_summaries.append({
+                'fold': i,
+                'train_period': (dates.iat[train[0]], dates.iat[train[1] - 1]),
+                'test_period': (dates.iat[test[0]], dates.iat[test[1] - 1]),
+                'best_params': fold['best_params'],
+                'train_score': fold['train_score'],
+                'train_return': train_result['total_return'],
+                'test_return': test_result['total_return'],
+                'test_sharpe': test_result['sharpe_ratio'],
+                'test_win_rate': test_result['win_rate'],
+                'test_max_drawdown': test_result['max_drawdown'],
+                'test_trades': test_result['total_trades'],
+            })
+            logger.info(f"Fold {i}: params={fold['best_params']} "
+                        f"train={train_result['total_return']:.2f}% test={test_result['total_return']:.2f}%")
+        
+        oos = self._summarize_folds(fold_results, train_bars, test_bars)
+        
+        result = {
+            'strategy_name': strategy_class.__name__,
+            'stock_code': stock_code,
+            'best_params': fold_results[-1]['best_params'],
+            'folds': fold_summaries,
+            'backtest_result': oos
+        }
+        
+        logger.info(f"Walk-forward completed: OOS Return={oos['total_return']:.2f}%, "
+                    f"Sharpe={oos['sharpe_ratio']:.2f}, "
+                    f"Profitable folds={oos['profitable_folds']:.0%}, "
+                    f"Efficiency={oos['efficiency']}")
+        
+        if save_path:
+            result_path = Path(save_path) / f"{strategy_class.__name__}_{stock_code}_walk_forward.json"
+            result_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(result_path, 'w', encoding='utf-8') as f:
+                json.dump(self._make_serializable(result), f, indent=2, ensure_ascii=False)
+            logger.info(f"Walk-forward results saved to {result_path}")
+        
+        return result
+    
+    def _summarize_folds(
+        self,
+        fold_results: List[Dict[str, Any]],
+        train_bars: int,
+        test_bars: int
+    ) -> Dict[str, Any]:
+        """
+        폴드별 검증(OOS) 결과 집계
+        
+        efficiency는 봉당 수익률 기준 (검증 평균 / 학습 평균)으로, 1에 가까울수록
+        학습 구간 성과가 표본 밖에서도 유지된다는 뜻이다. 학습 평균이 0 이하면 None.
+        """
+        tests = [fold['test_result'] for fold in fold_results]
+        test_returns = np.array([r['total_return'] for r in tests], dtype=float)
+        train_returns = np.array([fold['train_result']['total_return'] for fold in fold_results], dtype=float)
+        
+        win_trades = sum(r['win_trades'] for r in tests)
+        sell_trades = win_trades + sum(r['lose_trades'] for r in tests)
+        
+        train_rate = train_returns.mean() / train_bars
+        efficiency = float(test_returns.mean() / test_bars / train_rate) if train_rate > 0 else None
+        
+        return {
+            'total_return': float((np.prod(1 + test_returns / 100) - 1) * 100),  # 검증 구간 연속 복리
+            'mean_return': float(test_returns.mean()),
+            'sharpe_ratio': float(np.mean([r['sharpe_ratio'] for r in tests])),
+            'win_rate': win_trades / sell_trades * 100 if sell_trades else 0,
+            'max_drawdown': float(min(r['max_drawdown'] for r in tests)),
+            'total_trades': int(sum(r['total_trades'] for r in tests)),
+            'profitable_folds': float((test_returns > 0).mean()),
+            'efficiency': efficiency
+        }
+    
+    def save_summary(self, results: Dict[str, Dict[str, Any]], save_path: str) -> Path:
+        """
+        전략별, 종목별 최적 파라미터와 성과 요약을 optimization_summary.json으로 저장
+        
+        Args:
+            results: optimize_multiple_strategies() 결과
+            save_path: 결과 저장 경로
+            
+        Returns:
+            저장된 파일 경로
+        """
+        summary = {}
+        for strategy_name, stock_results in results.items():
+            summary[strategy_name] = {}
+            for stock_code, result in stock_results.items():
+                if result:
+                    summary[strategy_name][stock_code] = {
+                        'best_params': result['best_params'],
+                        'total_return': result['backtest_result']['total_return'],
+                        'win_rate': result['backtest_result']['win_rate'],
+                        'sharpe_ratio': result['backtest_result']['sharpe_ratio'],
+                        'max_drawdown': result['backtest_result']['max_drawdown']
+                    }
+        
+        summary_path = Path(save_path) / "optimization_summary.json"
+        summary_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(summary_path, 'w', encoding='utf-8') as f:
+            json.dump(self._make_serializable(summary), f, indent=2, ensure_ascii=False)
+        logger.info(f"Summary saved to {summary_path}")
+        
+        return summary_path
+    
+    def _resolve_workers(self, n_workers: int = None) -> int:
+        """워커 프로세스 수 결정"""
+        if n_workers is None:
+            n_workers = get_config().get('optimization.n_workers', 1)
+        if n_workers == 0:
+            n_workers = os.cpu_count() or 1
+        return max(1, int(n_workers))
+    
     def _make_serializable(self, obj):
         """JSON 직렬화 가능하도록 변환"""
         if isinstance(obj, dict):
             return {k: self._make_serializable(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
+        elif isinstance(obj, (list, tuple)):
             return [self._make_serializable(item) for item in obj]
         elif hasattr(obj, 'isoformat'):  # datetime 객체
             return obj.isoformat()
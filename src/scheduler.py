@@ -72,9 +72,18 @@ class Scheduler:
         return False
     
     async def _run_optimization(self):
-        """파라미터 최적화 실행"""
+        """
+        파라미터 최적화 실행
+        
+        최적화는 CPU 집약적인 동기 작업이므로 별도 스레드에서 실행해
+        이벤트 루프(실시간 매매 루프)를 막지 않는다.
+        """
+        await asyncio.to_thread(self._run_optimization_sync)
+    
+    def _run_optimization_sync(self):
+        """파라미터 최적화 실행 (동기, 워커 스레드에서 호출)"""
         try:
-            from .optimization import BayesianOptimizer
+            from .optimization import BayesianOptimizer, Backtester
             from .strategy.rsi_strategy import RSIStrategy
             from .strategy.sma_strategy import SMAStrategy
             from .strategy.bollinger_strategy import BollingerStrategy
@@ -142,7 +151,7 @@ class Scheduler:
             save_path = Path(__file__).parent.parent / "data" / "optimization_results"
             save_path.mkdir(parents=True, exist_ok=True)
             
-            optimizer = BayesianOptimizer()
+            optimizer = BayesianOptimizer(Backtester(vectorized=True))
             results = optimizer.optimize_multiple_strategies(
                 strategy_configs=strategy_configs,
                 stock_codes=stock_codes,
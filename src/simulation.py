@@ -13,6 +13,8 @@ from .strategy.sma_strategy import SMAStrategy
 from .strategy.bollinger_strategy import BollingerStrategy
 from .strategy.macd_strategy import MACDStrategy
 from .strategy.stochastic_strategy import StochasticStrategy
+from .data.tick_recorder import TickRecorder, TickReplay
+from .api.kis_parser import Tick
 
 logger = get_logger(__name__)
 
@@ -82,8 +84,13 @@ class VirtualExecutor:
 
 class SimulationRunner:
     """시뮬레이션 실행기"""
-    def __init__(self):
+    def __init__(self, replay: TickReplay = None):
+        """
+        Args:
+            replay: 기록된 틱 재생 소스. None이면 랜덤 워크 가격으로 실행
+        """
         self.executor = VirtualExecutor()
+        self.replay = replay
         self.target_codes = ["005930", "000660", "035420"]
         
         # 5가지 전략 초기화
@@ -106,6 +113,13 @@ class SimulationRunner:
         db = get_database()
         db.create_tables()
         
+        if self.replay:
+            # 기록된 실제 체결 흐름으로 전략 실행
+            self.replay.set_message_handler(self._on_tick)
+            await self.replay.run()
+            self.running = False
+            return
+        
         try:
             while self.running:
                 for code in self.target_codes:
@@ -113,29 +127,48 @@ class SimulationRunner:
                     # 실제로는 API에서 가져와야 함
                     current_price = 70000 + random.randint(-500, 500)
                     
-                    market_data = {'current_price': current_price}
-                    
-                    # 모든 전략에 동일한 가격 데이터 주입
-                    for name, strategy in self.strategies.items():
-                        try:
-                            signal = strategy.analyze(market_data)
-                            
-                            if signal == 'BUY':
-                                self.executor.execute(name, code, 'BUY', current_price, 1)
-                            elif signal == 'SELL':
-                                self.executor.execute(name, code, 'SELL', current_price, 1)
-                                
-                        except Exception as e:
-                            logger.error(f"Error in strategy {name}: {e}")
+                    self._on_price(code, current_price)
                             
                 await asyncio.sleep(1) # 1초 단위 시뮬레이션
                 
         except KeyboardInterrupt:
             logger.info("Simulation stopped.")
+    
+    def _on_tick(self, tick: Tick):
+        """재생 틱 처리"""
+        self._on_price(tick.stock_code, tick.price)
+    
+    def _on_price(self, code: str, current_price: int):
+        """모든 전략에 동일한 가격 데이터 주입 후 신호에 따라 가상 주문"""
+        market_data = {'current_price': current_price}
+        
+        for name, strategy in self.strategies.items():
+            try:
+                signal = strategy.analyze(market_data)
+                
+                if signal == 'BUY':
+                    self.executor.execute(name, code, 'BUY', current_price, 1)
+                elif signal == 'SELL':
+                    self.executor.execute(name, code, 'SELL', current_price, 1)
+                    
+            except Exception as e:
+                logger.error(f"Error in strategy {name}: {e}")
 
 if __name__ == "__main__":
+    import argparse
     from .logger import setup_logging
     setup_logging()
     
-    runner = SimulationRunner()
+    parser = argparse.ArgumentParser(description='Multi-Strategy Simulation')
+    parser.add_argument('--replay', nargs='*', metavar='YYYYMMDD',
+                        help='기록된 틱 재생 (일자 생략 시 전체 기록)')
+    parser.add_argument('--speed', type=float, default=0,
+                        help='재생 배속 (1.0 = 실제 속도, 0 = 최대 속도)')
+    args = parser.parse_args()
+    
+    replay = None
+    if args.replay is not None:
+        replay = TickReplay(TickRecorder(), days=args.replay or None, speed=args.speed)
+    
+    runner = SimulationRunner(replay=replay)
     asyncio.run(runner.run())
@@ -2,6 +2,17 @@
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 
+import numpy as np
+import pandas as pd
+
+# generate_signals() 반환 배열의 신호 코드
+SIGNAL_BUY = 1
+SIGNAL_SELL = -1
+SIGNAL_HOLD = 0
+
+_SIGNAL_CODES = {'BUY': SIGNAL_BUY, 'SELL': SIGNAL_SELL, 'HOLD': SIGNAL_HOLD}
+
+
 class BaseStrategy(ABC):
     """모든 전략의 기본이 되는 추상 클래스"""
     
@@ -20,3 +31,66 @@ class BaseStrategy(ABC):
             str: 'BUY', 'SELL', 'HOLD' 중 하나
         """
         pass
+    
+    def generate_signals(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        전체 OHLCV 시계열에 대한 매매 신호를 한 번에 생성 (벡터화 백테스트용)
+        
+        기본 구현은 새 인스턴스로 analyze()를 봉마다 호출하므로 느리다.
+        하위 클래스는 지표를 전체 시계열로 계산하도록 오버라이드해야 한다.
+        
+        Args:
+            df: ['open', 'high', 'low', 'close', 'volume'] 컬럼을 가진 DataFrame
+            
+        Returns:
+            np.ndarray: 봉별 신호 (SIGNAL_BUY=1, SIGNAL_SELL=-1, SIGNAL_HOLD=0), dtype int8
+        """
+        strategy = self.__class__(config=dict(self.config))
+        signals = np.zeros(len(df), dtype=np.int8)
+        
+        columns = [df[c].to_numpy() for c in ('close', 'open', 'high', 'low', 'volume')]
+        for i, (close, open_, high, low, volume) in enumerate(zip(*columns)):
+            signal = strategy.analyze({
+                'current_price': close,
+                'open': open_,
+                'high': high,
+                'low': low,
+                'volume': volume
+            })
+            signals[i] = _SIGNAL_CODES.get(signal, SIGNAL_HOLD)
+        
+        return signals
+
+
+def threshold_signals(buy_mask: np.ndarray, sell_mask: np.ndarray, warmup: int) -> np.ndarray:
+    """
+    매수/매도 조건 마스크를 신호 배열로 변환 (매수 조건 우선)
+    
+    Args:
+        buy_mask: 봉별 매수 조건
+        sell_mask: 봉별 매도 조건
+        warmup: 신호를 내지 않는 초기 봉 수 (analyze()의 데이터 수집 구간)
+    """
+    signals = np.where(buy_mask, SIGNAL_BUY, np.where(sell_mask, SIGNAL_SELL, SIGNAL_HOLD)).astype(np.int8)
+    signals[:warmup] = SIGNAL_HOLD
+    return signals
+
+
+def cross_signals(diff: np.ndarray, warmup: int) -> np.ndarray:
+    """
+    (빠른선 - 느린선) 차이의 부호 변화를 골든/데드 크로스 신호로 변환
+    
+    analyze()는 warmup 번째 봉부터 차이를 기억하므로, 크로스 판정에는
+    직전 봉도 warmup 이후여야 한다.
+    
+    Args:
+        diff: 봉별 (빠른선 - 느린선) 값
+        warmup: analyze()가 차이를 계산하지 않는 초기 봉 수
+    """
+    diff = np.asarray(diff, dtype=float)
+    prev = np.empty_like(diff)
+    prev[0] = np.nan
+    prev[1:] = diff[:-1]
+    
+    signals = threshold_signals((prev < 0) & (diff > 0), (prev > 0) & (diff < 0), warmup + 1)
+    return signals
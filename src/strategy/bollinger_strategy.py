@@ -1,7 +1,9 @@
 """볼린저 밴드 전략"""
+import numpy as np
 import pandas as pd
-import ta
-from .base import BaseStrategy
+from .base import BaseStrategy, threshold_signals
+from .indicator_cache import get_indicator_cache
+from .indicators import BollingerBands
 from ..logger import get_logger
 
 logger = get_logger(__name__)
@@ -18,7 +20,7 @@ class BollingerStrategy(BaseStrategy):
         self.window = self.config.get('window', 20)
         self.window_dev = self.config.get('window_dev', 2.0)
         
-        self.price_buffer = []
+        self.bands = BollingerBands(self.window, self.window_dev)
         self.min_periods = self.window + 1
         
     def analyze(self, market_data: dict) -> str:
@@ -26,20 +28,11 @@ class BollingerStrategy(BaseStrategy):
         if current_price is None:
             return 'HOLD'
             
-        self.price_buffer.append(current_price)
-        if len(self.price_buffer) > 100:
-            self.price_buffer.pop(0)
-            
-        if len(self.price_buffer) < self.min_periods:
-            return 'HOLD'
-            
-        df = pd.DataFrame(self.price_buffer, columns=['close'])
+        # 볼린저 밴드 갱신
+        _, bb_high, bb_low = self.bands.update(current_price)
         
-        # 볼린저 밴드 계산
-        indicator = ta.volatility.BollingerBands(close=df['close'], window=self.window, window_dev=self.window_dev)
-        
-        bb_high = indicator.bollinger_hband().iloc[-1]
-        bb_low = indicator.bollinger_lband().iloc[-1]
+        if self.bands.count < self.min_periods:
+            return 'HOLD'
         
         if current_price <= bb_low:
             logger.info(f"Price hit Lower Band! ({current_price} <= {bb_low:.2f})")
@@ -49,3 +42,17 @@ class BollingerStrategy(BaseStrategy):
             return 'SELL'
             
         return 'HOLD'
+    
+    def generate_signals(self, df: pd.DataFrame) -> np.ndarray:
+        """전체 시계열 볼린저 밴드로 신호 일괄 생성"""
+        # 중심선/표준편차만 캐시해 window_dev가 다른 시도끼리 공유 (ta.volatility.BollingerBands와 같은 계산)
+        series = df['close']
+        mavg, mstd = get_indicator_cache().get(
+            'bollinger', (self.window,), (series,),
+            lambda: (series.rolling(self.window, min_periods=self.window).mean(),
+                     series.rolling(self.window, min_periods=self.window).std(ddof=0))
+        )
+        close = series.to_numpy()
+        bb_high = mavg + self.window_dev * mstd
+        bb_low = mavg - self.window_dev * mstd
+        return threshold_signals(close <= bb_low, close >= bb_high, self.min_periods - 1)
@@ -0,0 +1,131 @@
+"""지표 계산 결과 캐시 (LRU, 메모리 상한)
+
+최적화 반복에서는 같은 종목 데이터에 같은 정수 기간의 지표를 반복 계산하게 된다.
+(데이터 지문, 지표 이름, 파라미터)를 키로 전체 시계열 지표 배열을 보관해 두고,
+generate_signals()는 캐시된 배열에 임계값 비교만 수행한다.
+
+캐시된 배열은 읽기 전용이므로 호출 측에서 수정하지 않는다.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..config import get_config
+from ..logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def fingerprint(*arrays: np.ndarray) -> str:
+    """입력 시계열 내용으로 만든 지문 (길이/dtype/값이 같으면 같은 지문)"""
+    digest = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        digest.update(f"{array.dtype.str}{array.shape}".encode())
+        digest.update(array.view(np.uint8))
+    return digest.hexdigest()
+
+
+class IndicatorCache:
+    """
+    지표 배열 LRU 캐시
+
+    보관 중인 배열의 총 바이트가 max_bytes를 넘으면 가장 오래 쓰지 않은 항목부터 제거한다.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.entries: 'OrderedDict[Hashable, Tuple[Tuple[np.ndarray, ...], int]]' = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        name: str,
+        params: Tuple,
+        inputs: Tuple[pd.Series, ...],
+        compute: Callable[[], Any]
+    ) -> Tuple[np.ndarray, ...]:
+        """
+        캐시된 지표 배열 조회 (없으면 compute()로 계산 후 보관)
+
+        Args:
+            name: 지표 이름
+            params: 지표 파라미터 (해시 가능)
+            inputs: 지표 계산에 쓰이는 입력 시계열
+            compute: 지표 계산 함수 (Series/배열 하나 또는 튜플 반환)
+
+        Returns:
+            지표 배열 튜플 (읽기 전용 float 배열)
+        """
+        key = (fingerprint(*(np.asarray(s, dtype=float) for s in inputs)), name, params)
+
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        values = compute()
+        if not isinstance(values, tuple):
+            values = (values,)
+        arrays = []
+        for value in values:
+            array = np.array(value, dtype=float)
+            array.setflags(write=False)
+            arrays.append(array)
+        arrays = tuple(arrays)
+        size = sum(array.nbytes for array in arrays)
+
+        with self._lock:
+            if size > self.max_bytes:
+                return arrays
+            if key not in self.entries:
+                self.entries[key] = (arrays, size)
+                self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                _, (_, evicted) = self.entries.popitem(last=False)
+                self.nbytes -= evicted
+                self.evictions += 1
+        return arrays
+
+    def clear(self):
+        """캐시 비우기"""
+        with self._lock:
+            self.entries.clear()
+            self.nbytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 사용 통계"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self.entries),
+                'nbytes': self.nbytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+
+# 전역 지표 캐시 (최적화 워커 프로세스마다 하나)
+_cache_instance = None
+
+
+def get_indicator_cache() -> IndicatorCache:
+    """지표 캐시 가져오기 (싱글톤)"""
+    global _cache_instance
+    if _cache_instance is None:
+        max_mb = get_config().get('optimization.indicator_cache_mb', 64)
+        _cache_instance = IndicatorCache(max_bytes=int(max_mb * 1024 * 1024))
+    return _cache_instance
@@ -0,0 +1,243 @@
+"""스트리밍 기술지표 (틱당 O(1) 갱신)
+
+각 지표는 update()로 값을 하나씩 받아 최신 지표 값을 반환한다.
+계산식은 ta 라이브러리(fillna=False)와 동일하며, 값이 준비되기 전에는
+ta와 마찬가지로 NaN을 반환하므로 비교 연산은 항상 False가 된다.
+"""
+import math
+from collections import deque
+from typing import Deque, Tuple
+
+NAN = float('nan')
+
+
+class SMA:
+    """
+    단순 이동평균 (누적합 기반)
+
+    NaN/inf 입력은 합계에서 제외하고 개수만 추적한다. 윈도우 안에 그런 값이
+    하나라도 있으면 pandas rolling(min_periods=window)처럼 NaN을 반환.
+    """
+
+    def __init__(self, window: int):
+        self.window = window
+        self.values: Deque[float] = deque()
+        self.total = 0.0
+        self.nan_count = 0
+        self.count = 0
+        self.value = NAN
+
+    def update(self, x: float) -> float:
+        self.count += 1
+        self.values.append(x)
+        if not math.isfinite(x):
+            self.nan_count += 1
+        else:
+            self.total += x
+
+        if len(self.values) > self.window:
+            old = self.values.popleft()
+            if not math.isfinite(old):
+                self.nan_count -= 1
+            else:
+                self.total -= old
+
+        if len(self.values) < self.window or self.nan_count:
+            self.value = NAN
+        else:
+            self.value = self.total / self.window
+        return self.value
+
+
+class EMA:
+    """
+    지수 이동평균 (pandas ewm(adjust=False)와 동일한 재귀식)
+
+    첫 유효값으로 초기화하며, NaN 입력은 무시한다.
+    """
+
+    def __init__(self, span: float = None, alpha: float = None, min_periods: int = None):
+        if alpha is None:
+            alpha = 2.0 / (span + 1.0)
+        self.alpha = alpha
+        self.min_periods = min_periods if min_periods is not None else int(span or 1)
+        self.count = 0
+        self.mean = NAN
+        self.value = NAN
+
+    def update(self, x: float) -> float:
+        if math.isnan(x):
+            return self.value
+
+        self.count += 1
+        if self.count == 1:
+            self.mean = x
+        else:
+            self.mean += self.alpha * (x - self.mean)
+
+        self.value = self.mean if self.count >= self.min_periods else NAN
+        return self.value
+
+
+class WilderRSI:
+    """
+    Wilder RSI (alpha = 1/window 지수평활)
+
+    ta.momentum.RSIIndicator와 동일하게 첫 가격의 변화량을 0으로 두고
+    상승/하락 평균을 평활한다.
+    """
+
+    def __init__(self, window: int = 14):
+        self.window = window
+        self.avg_up = EMA(alpha=1.0 / window, min_periods=window)
+        self.avg_down = EMA(alpha=1.0 / window, min_periods=window)
+        self.prev_price = None
+        self.count = 0
+        self.value = NAN
+
+    def update(self, price: float) -> float:
+        self.count += 1
+        diff = 0.0 if self.prev_price is None else price - self.prev_price
+        self.prev_price = price
+
+        up = self.avg_up.update(diff if diff > 0 else 0.0)
+        down = self.avg_down.update(-diff if diff < 0 else 0.0)
+
+        if math.isnan(down):
+            self.value = NAN
+        elif down == 0:
+            self.value = 100.0
+        else:
+            self.value = 100.0 - (100.0 / (1.0 + up / down))
+        return self.value
+
+
+class MACD:
+    """MACD 선과 시그널 선 (ta.trend.MACD와 동일)"""
+
+    def __init__(self, window_fast: int = 12, window_slow: int = 26, window_sign: int = 9):
+        self.ema_fast = EMA(span=window_fast, min_periods=window_fast)
+        self.ema_slow = EMA(span=window_slow, min_periods=window_slow)
+        self.ema_signal = EMA(span=window_sign, min_periods=window_sign)
+        self.count = 0
+        self.macd = NAN
+        self.signal = NAN
+
+    def update(self, price: float) -> Tuple[float, float]:
+        """
+        Returns:
+            (MACD 선, 시그널 선)
+        """
+        self.count += 1
+        self.macd = self.ema_fast.update(price) - self.ema_slow.update(price)
+        self.signal = self.ema_signal.update(self.macd)
+        return self.macd, self.signal
+
+
+class BollingerBands:
+    """
+    볼린저 밴드 (슬라이딩 윈도우 Welford 분산, 모표준편차 ddof=0)
+    """
+
+    def __init__(self, window: int = 20, window_dev: float = 2.0):
+        self.window = window
+        self.window_dev = window_dev
+        self.values: Deque[float] = deque()
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.count = 0
+        self.mavg = NAN
+        self.hband = NAN
+        self.lband = NAN
+
+    def update(self, price: float) -> Tuple[float, float, float]:
+        """
+        Returns:
+            (중심선, 상단 밴드, 하단 밴드)
+        """
+        self.count += 1
+        self.values.append(price)
+        n = len(self.values)
+        delta = price - self.mean
+        self.mean += delta / n
+        self.m2 += delta * (price - self.mean)
+
+        if n > self.window:
+            old = self.values.popleft()
+            n -= 1
+            delta = old - self.mean
+            self.mean -= delta / n
+            self.m2 -= delta * (old - self.mean)
+
+        if n < self.window:
+            self.mavg = self.hband = self.lband = NAN
+        else:
+            std = math.sqrt(max(self.m2, 0.0) / n)
+            self.mavg = self.mean
+            self.hband = self.mean + self.window_dev * std
+            self.lband = self.mean - self.window_dev * std
+        return self.mavg, self.hband, self.lband
+
+
+class RollingExtreme:
+    """
+    슬라이딩 윈도우 최댓값/최솟값 (단조 덱, 분할 상환 O(1))
+    """
+
+    def __init__(self, window: int, mode: str = 'max'):
+        self.window = window
+        self.is_max = mode == 'max'
+        self.items: Deque[Tuple[int, float]] = deque()  # (인덱스, 값) 단조 수열
+        self.count = 0
+        self.value = NAN
+
+    def update(self, x: float) -> float:
+        index = self.count
+        self.count += 1
+
+        items = self.items
+        if self.is_max:
+            while items and items[-1][1] <= x:
+                items.pop()
+        else:
+            while items and items[-1][1] >= x:
+                items.pop()
+        items.append((index, x))
+
+        if items[0][0] <= index - self.window:
+            items.popleft()
+
+        self.value = items[0][1] if self.count >= self.window else NAN
+        return self.value
+
+
+class Stochastic:
+    """스토캐스틱 %K, %D (ta.momentum.StochasticOscillator와 동일)"""
+
+    def __init__(self, window: int = 14, smooth_window: int = 3):
+        self.highest = RollingExtreme(window, 'max')
+        self.lowest = RollingExtreme(window, 'min')
+        self.d_line = SMA(smooth_window)
+        self.count = 0
+        self.k = NAN
+        self.d = NAN
+
+    def update(self, high: float, low: float, close: float) -> Tuple[float, float]:
+        """
+        Returns:
+            (%K, %D)
+        """
+        self.count += 1
+        smax = self.highest.update(high)
+        smin = self.lowest.update(low)
+
+        span = smax - smin
+        if span != 0:
+            self.k = 100.0 * (close - smin) / span
+        else:
+            # pandas와 동일하게 0/0은 NaN, x/0은 ±inf
+            numerator = close - smin
+            self.k = NAN if numerator == 0 else math.copysign(math.inf, numerator)
+
+        self.d = self.d_line.update(self.k)
+        return self.k, self.d
@@ -1,7 +1,10 @@
 """MACD 전략"""
+import numpy as np
 import pandas as pd
 import ta
-from .base import BaseStrategy
+from .base import BaseStrategy, cross_signals
+from .indicator_cache import get_indicator_cache
+from .indicators import MACD
 from ..logger import get_logger
 
 logger = get_logger(__name__)
@@ -19,7 +22,7 @@ class MACDStrategy(BaseStrategy):
         self.window_fast = self.config.get('window_fast', 12)
         self.window_sign = self.config.get('window_sign', 9)
         
-        self.price_buffer = []
+        self.macd = MACD(self.window_fast, self.window_slow, self.window_sign)
         self.min_periods = self.window_slow + self.window_sign + 1
         self.prev_diff = None
         
@@ -28,25 +31,11 @@ class MACDStrategy(BaseStrategy):
         if current_price is None:
             return 'HOLD'
             
-        self.price_buffer.append(current_price)
-        if len(self.price_buffer) > 100:
-            self.price_buffer.pop(0)
-            
-        if len(self.price_buffer) < self.min_periods:
-            return 'HOLD'
-            
-        df = pd.DataFrame(self.price_buffer, columns=['close'])
-        
-        # MACD 계산
-        macd = ta.trend.MACD(
-            close=df['close'], 
-            window_slow=self.window_slow, 
-            window_fast=self.window_fast, 
-            window_sign=self.window_sign
-        )
+        # MACD 갱신
+        macd_line, signal_line = self.macd.update(current_price)
         
-        macd_line = macd.macd().iloc[-1]
-        signal_line = macd.macd_signal().iloc[-1]
+        if self.macd.count < self.min_periods:
+            return 'HOLD'
         
         current_diff = macd_line - signal_line
         
@@ -62,3 +51,21 @@ class MACDStrategy(BaseStrategy):
                 
         self.prev_diff = current_diff
         return signal
+    
+    def generate_signals(self, df: pd.DataFrame) -> np.ndarray:
+        """전체 시계열 MACD/시그널 차이로 크로스 신호 일괄 생성"""
+        close = df['close']
+        
+        def compute():
+            macd = ta.trend.MACD(
+                close=close,
+                window_slow=self.window_slow,
+                window_fast=self.window_fast,
+                window_sign=self.window_sign
+            )
+            return macd.macd(), macd.macd_signal()
+        
+        macd_line, signal_line = get_indicator_cache().get(
+            'macd', (self.window_fast, self.window_slow, self.window_sign), (close,), compute
+        )
+        return cross_signals(macd_line - signal_line, self.min_periods - 1)
@@ -1,7 +1,10 @@
 """RSI 기반 매매 전략"""
+import numpy as np
 import pandas as pd
 import ta
-from .base import BaseStrategy
+from .base import BaseStrategy, threshold_signals
+from .indicator_cache import get_indicator_cache
+from .indicators import WilderRSI
 from ..logger import get_logger
 
 logger = get_logger(__name__)
@@ -19,8 +22,8 @@ class RSIStrategy(BaseStrategy):
         self.buy_threshold = self.config.get('buy_threshold', 30)
         self.sell_threshold = self.config.get('sell_threshold', 70)
         
-        # 가격 데이터를 저장할 버퍼 (최소 RSI 계산에 필요한 만큼)
-        self.price_buffer = []
+        # 스트리밍 RSI (틱당 O(1) 갱신)
+        self.rsi = WilderRSI(self.rsi_period)
         self.min_periods = self.rsi_period + 1
         
     def analyze(self, market_data: dict) -> str:
@@ -34,22 +37,13 @@ class RSIStrategy(BaseStrategy):
         if current_price is None:
             return 'HOLD'
             
-        # 데이터 버퍼에 추가
-        self.price_buffer.append(current_price)
+        # RSI 갱신
+        current_rsi = self.rsi.update(current_price)
         
-        # 버퍼 크기 관리 (너무 커지지 않게 유지)
-        if len(self.price_buffer) > 100:
-            self.price_buffer.pop(0)
-            
         # 데이터가 충분하지 않으면 대기
-        if len(self.price_buffer) < self.min_periods:
-            logger.debug(f"Collecting data... ({len(self.price_buffer)}/{self.min_periods})")
+        if self.rsi.count < self.min_periods:
+            logger.debug(f"Collecting data... ({self.rsi.count}/{self.min_periods})")
             return 'HOLD'
-            
-        # RSI 계산
-        df = pd.DataFrame(self.price_buffer, columns=['close'])
-        rsi_indicator = ta.momentum.RSIIndicator(close=df['close'], window=self.rsi_period)
-        current_rsi = rsi_indicator.rsi().iloc[-1]
         
         logger.info(f"RSI Calculated: {current_rsi:.2f}")
         
@@ -63,3 +57,12 @@ class RSIStrategy(BaseStrategy):
             return 'SELL'
             
         return 'HOLD'
+    
+    def generate_signals(self, df: pd.DataFrame) -> np.ndarray:
+        """전체 시계열 RSI로 신호 일괄 생성"""
+        close = df['close']
+        (rsi,) = get_indicator_cache().get(
+            'rsi', (self.rsi_period,), (close,),
+            lambda: ta.momentum.RSIIndicator(close=close, window=self.rsi_period).rsi()
+        )
+        return threshold_signals(rsi <= self.buy_threshold, rsi >= self.sell_threshold, self.min_periods - 1)
@@ -1,7 +1,10 @@
 """SMA (Simple Moving Average) 크로스 전략"""
+import numpy as np
 import pandas as pd
 import ta
-from .base import BaseStrategy
+from .base import BaseStrategy, cross_signals
+from .indicator_cache import get_indicator_cache
+from .indicators import SMA
 from ..logger import get_logger
 
 logger = get_logger(__name__)
@@ -18,7 +21,8 @@ class SMAStrategy(BaseStrategy):
         self.short_window = self.config.get('short_window', 5)
         self.long_window = self.config.get('long_window', 20)
         
-        self.price_buffer = []
+        self.sma_short = SMA(self.short_window)
+        self.sma_long = SMA(self.long_window)
         self.min_periods = self.long_window + 1
         self.prev_diff = None  # 이전 (단기 - 장기) 차이
         
@@ -27,18 +31,12 @@ class SMAStrategy(BaseStrategy):
         if current_price is None:
             return 'HOLD'
             
-        self.price_buffer.append(current_price)
-        if len(self.price_buffer) > 100:
-            self.price_buffer.pop(0)
-            
-        if len(self.price_buffer) < self.min_periods:
-            return 'HOLD'
-            
-        df = pd.DataFrame(self.price_buffer, columns=['close'])
+        # SMA 갱신
+        sma_short = self.sma_short.update(current_price)
+        sma_long = self.sma_long.update(current_price)
         
-        # SMA 계산
-        sma_short = ta.trend.SMAIndicator(close=df['close'], window=self.short_window).sma_indicator().iloc[-1]
-        sma_long = ta.trend.SMAIndicator(close=df['close'], window=self.long_window).sma_indicator().iloc[-1]
+        if self.sma_long.count < self.min_periods:
+            return 'HOLD'
         
         current_diff = sma_short - sma_long
         
@@ -55,3 +53,13 @@ class SMAStrategy(BaseStrategy):
                 
         self.prev_diff = current_diff
         return signal
+    
+    def generate_signals(self, df: pd.DataFrame) -> np.ndarray:
+        """전체 시계열 이동평균 차이로 크로스 신호 일괄 생성"""
+        close = df['close']
+        cache = get_indicator_cache()
+        (sma_short,) = cache.get('sma', (self.short_window,), (close,),
+                                 lambda: ta.trend.SMAIndicator(close=close, window=self.short_window).sma_indicator())
+        (sma_long,) = cache.get('sma', (self.long_window,), (close,),
+                                lambda: ta.trend.SMAIndicator(close=close, window=self.long_window).sma_indicator())
+        return cross_signals(sma_short - sma_long, self.min_periods - 1)
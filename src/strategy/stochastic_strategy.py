@@ -1,7 +1,10 @@
 """스토캐스틱 전략"""
+import numpy as np
 import pandas as pd
 import ta
-from .base import BaseStrategy
+from .base import BaseStrategy, threshold_signals
+from .indicator_cache import get_indicator_cache
+from .indicators import Stochastic
 from ..logger import get_logger
 
 logger = get_logger(__name__)
@@ -18,9 +21,7 @@ class StochasticStrategy(BaseStrategy):
         self.window = self.config.get('window', 14)
         self.smooth_window = self.config.get('smooth_window', 3)
         
-        self.price_buffer = [] # (high, low, close) 튜플 저장 필요하지만, 간단히 close만으로 가정하거나 더미 데이터 생성
-        # 실제로는 OHLC 데이터가 필요함. 현재 구조상 close만 들어오므로, 
-        # 약식으로 high=low=close로 가정하고 계산 (정확도는 떨어짐)
+        self.stoch = Stochastic(self.window, self.smooth_window)
         
         self.min_periods = self.window + self.smooth_window + 1
         
@@ -29,31 +30,15 @@ class StochasticStrategy(BaseStrategy):
         if current_price is None:
             return 'HOLD'
             
-        # 약식 구현: High/Low 정보가 없으므로 Close 가격만 사용
-        # 실제 환경에서는 market_data에 high, low가 포함되어야 함
-        self.price_buffer.append(current_price)
-        
-        if len(self.price_buffer) > 100:
-            self.price_buffer.pop(0)
-            
-        if len(self.price_buffer) < self.min_periods:
-            return 'HOLD'
-            
-        df = pd.DataFrame(self.price_buffer, columns=['close'])
-        df['high'] = df['close'] # 임시
-        df['low'] = df['close']  # 임시
-        
-        # 스토캐스틱 계산
-        stoch = ta.momentum.StochasticOscillator(
-            high=df['high'],
-            low=df['low'],
-            close=df['close'],
-            window=self.window,
-            smooth_window=self.smooth_window
+        # 봉 데이터면 고가/저가 사용, 틱 가격만 있으면 종가로 대체
+        k, d = self.stoch.update(
+            market_data.get('high', current_price),
+            market_data.get('low', current_price),
+            current_price
         )
         
-        k = stoch.stoch().iloc[-1]
-        d = stoch.stoch_signal().iloc[-1]
+        if self.stoch.count < self.min_periods:
+            return 'HOLD'
         
         if k < 20 and d < 20:
             logger.info(f"Stochastic Oversold! (K:{k:.2f}, D:{d:.2f})")
@@ -63,3 +48,24 @@ class StochasticStrategy(BaseStrategy):
             return 'SELL'
             
         return 'HOLD'
+    
+    def generate_signals(self, df: pd.DataFrame) -> np.ndarray:
+        """전체 시계열 스토캐스틱으로 신호 일괄 생성"""
+        high = df['high'].reset_index(drop=True)
+        low = df['low'].reset_index(drop=True)
+        close = df['close'].reset_index(drop=True)
+        
+        def compute():
+            stoch = ta.momentum.StochasticOscillator(
+                high=high,
+                low=low,
+                close=close,
+                window=self.window,
+                smooth_window=self.smooth_window
+            )
+            return stoch.stoch(), stoch.stoch_signal()
+        
+        k, d = get_indicator_cache().get(
+            'stochastic', (self.window, self.smooth_window), (high, low, close), compute
+        )
+        return threshold_signals((k < 20) & (d < 20), (k > 80) & (d > 80), self.min_periods - 1)
@@ -0,0 +1,93 @@
+"""재연결 공백 분봉 보충 테스트"""
+import asyncio
+from datetime import datetime
+
+from src.api.kis_models import MinuteBar
+from src.api.kis_parser import Tick
+from src.data.backfill import GapBackfiller
+from src.data.bar_aggregator import BarAggregator
+
+
+def _tick(code: str, hhmmss: str, price: int, volume: int, cum_volume: int) -> Tick:
+    return Tick(code, hhmmss, price, 0, 0.0, 0, 0, 0, 0, 0, volume, cum_volume)
+
+
+def _bar(code: str, hhmm: str, close: int, volume: int) -> MinuteBar:
+    return MinuteBar(stock_code=code, date='20240102', time=f'{hhmm}00',
+                     open=close - 1, high=close + 1, low=close - 2, close=close, volume=volume)
+
+
+class FakeClient:
+    def __init__(self, bars=None, fail=False):
+        self.bars = bars or {}
+        self.fail = fail
+        self.calls = []
+
+    def get_minute_bars(self, stock_code, start, end):
+        self.calls.append((stock_code, start, end))
+        if self.fail:
+            raise RuntimeError("boom")
+        return [b for b in self.bars.get(stock_code, []) if start < b.time <= end]
+
+
+def _setup(client):
+    aggregator = BarAggregator(['1m'])
+    completed, released = [], []
+    aggregator.add_handler(lambda bar: completed.append((bar, backfiller.splicing)))
+
+    async def release(tick):
+        released.append(tick)
+        aggregator.update(tick)
+
+    backfiller = GapBackfiller(client, aggregator, release, concurrency=2)
+    return backfiller, aggregator, completed, released
+
+
+def test_gap_bars_spliced_before_held_ticks():
+    client = FakeClient({'005930': [_bar('005930', h, 100 + i, 10) for i, h in enumerate(['0901', '0902', '0903', '0904'])]})
+    backfiller, aggregator, completed, released = _setup(client)
+    aggregator.trade_date = datetime(2024, 1, 2).date()
+
+    async def main():
+        assert not backfiller.hold(_tick('005930', '090030', 99, 5, 1000))
+        aggregator.update(_tick('005930', '090030', 99, 5, 1000))
+
+        task = asyncio.create_task(backfiller.backfill(['005930', '000660'], now=datetime(2024, 1, 2, 9, 4, 20)))
+        await asyncio.sleep(0)
+        # 보충 중 도착한 실시간 틱은 보류
+        assert backfiller.hold(_tick('005930', '090421', 105, 3, 1043))
+        await task
+
+    asyncio.run(main())
+
+    # 09:00 다음 분부터 현재 분(09:04) 직전까지만 조회 (틱 없던 종목은 제외)
+    assert client.calls == [('005930', '090059', '090300')]
+    assert [(bar.start.strftime('%H%M'), bar.close, bar.volume) for bar, _ in completed] == [
+        ('0900', 99, 5), ('0901', 100, 10), ('0902', 101, 10), ('0903', 102, 10),
+    ]
+    # 보충 중 완성된 봉은 splicing 상태에서 콜백 (마지막 보충 봉은 보류했던 실시간 틱이 완성)
+    assert [splicing for _, splicing in completed] == [True, True, True, False]
+    assert [t.time for t in released] == ['090421']
+    assert aggregator.bars[('005930', '1m')].start.strftime('%H%M') == '0904'
+    assert backfiller.held == {} and backfiller.stats()['bars_spliced'] == 3
+
+
+def test_short_outage_and_failure_release_ticks():
+    backfiller, aggregator, completed, released = _setup(FakeClient(fail=True))
+
+    async def main():
+        backfiller.hold(_tick('005930', '090030', 99, 5, 1000))
+        # 다음 분 안에 재연결: 빠진 분봉 없음
+        await backfiller.backfill(['005930'], now=datetime(2024, 1, 2, 9, 1, 10))
+        assert backfiller.client.calls == []
+
+        task = asyncio.create_task(backfiller.backfill(['005930'], now=datetime(2024, 1, 2, 9, 5, 0)))
+        await asyncio.sleep(0)
+        backfiller.hold(_tick('005930', '090501', 101, 1, 1100))
+        await task
+
+    asyncio.run(main())
+
+    assert backfiller.stats()['failures'] == 1
+    assert [t.time for t in released] == ['090501']
+    assert not backfiller.held
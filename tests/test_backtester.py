@@ -0,0 +1,148 @@
+"""백테스터 테스트"""
+import pytest
+from src.optimization import Backtester
+from src.strategy.rsi_strategy import RSIStrategy
+from src.strategy.sma_strategy import SMAStrategy
+from src.strategy.bollinger_strategy import BollingerStrategy
+from src.strategy.macd_strategy import MACDStrategy
+from src.strategy.stochastic_strategy import StochasticStrategy
+
+
+STRATEGY_CASES = [
+    (RSIStrategy, {'rsi_period': 5}),
+    (SMAStrategy, {'short_window': 3, 'long_window': 10}),
+    (BollingerStrategy, {'window': 10, 'window_dev': 1.5}),
+    (MACDStrategy, {'window_fast': 5, 'window_slow': 12, 'window_sign': 4}),
+    (StochasticStrategy, {'window': 5}),
+]
+
+
+def _strip_dates(records):
+    return [{k: v for k, v in r.items() if k != 'date'} for r in records]
+
+
+@pytest.mark.parametrize("strategy_class,config", STRATEGY_CASES)
+def test_vectorized_backtest_matches_event_loop(strategy_class, config):
+    """벡터화 백테스트가 기존 봉 단위 백테스트와 동일한 결과를 내는지 확인"""
+    backtester = Backtester()
+    
+    expected = backtester.run_backtest(strategy_class(config=config), "005930", days=90)
+    actual = backtester.run_vectorized_backtest(strategy_class(config=config), "005930", days=90)
+    
+    assert expected['total_trades'] > 0
+    for key in ('final_equity', 'total_return', 'total_trades', 'win_trades',
+                'lose_trades', 'win_rate', 'max_drawdown', 'sharpe_ratio'):
+        assert actual[key] == pytest.approx(expected[key]), key
+    
+    assert _strip_dates(actual['trades']) == _strip_dates(expected['trades'])
+    assert _strip_dates(actual['equity_curve']) == _strip_dates(expected['equity_curve'])
+
+
+def test_vectorized_flag_routes_run_backtest():
+    """vectorized=True면 run_backtest가 벡터화 엔진을 사용"""
+    backtester = Backtester(vectorized=True)
+    result = backtester.run_backtest(SMAStrategy(config={'short_window': 3, 'long_window': 10}), "000660", days=90)
+    
+    assert result['total_trades'] > 0
+    assert len(result['equity_curve']) == 91
+
+
+def test_portfolio_backtest_shares_cash_and_caps_positions():
+    """포트폴리오 백테스트: 공유 현금, 보유 종목 수/종목 비중 제한"""
+    backtester = Backtester()
+    codes = [f"{i:06d}" for i in range(8)]
+    result = backtester.run_portfolio_backtest(
+        RSIStrategy(config={'rsi_period': 5}), codes, days=180,
+        max_positions=3, max_position_percent=30.0
+    )
+    
+    assert result['stock_codes'] == codes
+    assert len(result['equity_curve']) == 181
+    assert result['total_trades'] > 0
+    
+    held = set()
+    for trade in result['trades']:
+        if trade['type'] == 'BUY':
+            held.add(trade['stock_code'])
+            assert len(held) <= 3
+        else:
+            held.discard(trade['stock_code'])
+    
+    curve = result['equity_curve']
+    equity_at = {point['date']: point['equity'] for point in curve}
+    for trade in result['trades']:
+        if trade['type'] == 'BUY':
+            # 매수 직전 총자산 ≈ 매수 후 총자산 + 수수료
+            assert trade['price'] * trade['quantity'] <= 0.3 * (equity_at[trade['date']] + trade['commission']) + 1
+    assert min(point['cash'] for point in curve) >= 0
+    
+    # 최종 자산 = 초기 자본 + 실현 손익 - 매수 수수료
+    buy_commission = sum(t['commission'] for t in result['trades'] if t['type'] == 'BUY')
+    realized = sum(t.get('profit', 0) for t in result['trades'])
+    assert result['final_equity'] == pytest.approx(10000000 + realized - buy_commission)
+    assert sum(result['symbol_returns'].values()) == pytest.approx(realized)
+
+
+@pytest.mark.parametrize("strategy_class,config", STRATEGY_CASES)
+def test_window_backtest_matches_event_loop(strategy_class, config):
+    """data/start/end 구간 백테스트도 두 엔진 결과가 같고, 이전 봉은 지표 준비에만 쓰임"""
+    backtester = Backtester()
+    data = backtester.get_historical_data("005930", 180)
+    
+    expected = backtester.run_backtest(strategy_class(config=config), "005930", data=data, start=60, end=150)
+    actual = backtester.run_vectorized_backtest(strategy_class(config=config), "005930", data=data, start=60, end=150)
+    
+    assert len(expected['equity_curve']) == 90
+    assert expected['equity_curve'][0]['date'] == data['date'].iat[60]
+    for key in ('final_equity', 'total_trades', 'win_rate', 'max_drawdown', 'sharpe_ratio'):
+        assert actual[key] == pytest.approx(expected[key]), key
+    assert _strip_dates(actual['trades']) == _strip_dates(expected['trades'])
+
+
+def test_walk_forward_reports_out_of_sample_folds(monkeypatch):
+    from src.optimization import BayesianOptimizer
+    import src.strategy.indicator_cache as indicator_cache
+    
+    monkeypatch.setattr(indicator_cache, '_cache_instance', indicator_cache.IndicatorCache())
+    optimizer = BayesianOptimizer()  # 벡터화 엔진이 아니어도 폴드는 벡터화 엔진으로 평가
+    result = optimizer.walk_forward(
+        RSIStrategy, "005930", {'rsi_period': (5, 20), 'buy_threshold': (20, 40), 'sell_threshold': (60, 80)},
+        days=120, train_bars=60, test_bars=20, n_iterations=2, init_points=2, n_workers=1
+    )
+    
+    folds = result['folds']
+    assert len(folds) == 3
+    assert [f['test_period'][0] > f['train_period'][1] for f in folds] == [True] * 3
+    assert folds[1]['train_period'][0] > folds[0]['train_period'][0]
+    assert result['best_params'] == folds[-1]['best_params']
+    
+    oos = result['backtest_result']
+    returns = [f['test_return'] for f in folds]
+    assert oos['mean_return'] == pytest.approx(sum(returns) / 3)
+    assert oos['total_trades'] == sum(f['test_trades'] for f in folds)
+    # 폴드 간 같은 data의 지표 배열 재사용
+    assert indicator_cache._cache_instance.stats()['hits'] > 0
+    assert not optimizer.backtester.vectorized
+
+
+@pytest.mark.parametrize("strategy_class,config", [
+    (SMAStrategy, {'short_window': 3, 'long_window': 10}),
+    (MACDStrategy, {'window_fast': 5, 'window_slow': 12, 'window_sign': 4}),
+])
+def test_jit_backtest_matches_event_loop(strategy_class, config):
+    """JIT 커널(numba 미설치 시 Python 실행)이 봉 단위 백테스트와 같은 결과를 내는지 확인"""
+    backtester = Backtester(jit=True)
+    data = backtester.get_historical_data("005930", 180)
+    
+    expected = Backtester().run_backtest(strategy_class(config=config), "005930", data=data, start=30)
+    actual = backtester.run_backtest(strategy_class(config=config), "005930", data=data, start=30)
+    
+    assert expected['total_trades'] > 0
+    for key in ('final_equity', 'total_trades', 'win_rate', 'max_drawdown', 'sharpe_ratio'):
+        assert actual[key] == pytest.approx(expected[key]), key
+    assert actual['trades'] == expected['trades']
+    assert actual['equity_curve'] == expected['equity_curve']
+    
+    # JIT 신호 함수가 없는 전략은 기존 경로로 실행
+    rsi = backtester.run_backtest(RSIStrategy(config={'rsi_period': 5}), "005930", data=data)
+    assert rsi['total_trades'] > 0
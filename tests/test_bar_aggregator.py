@@ -0,0 +1,130 @@
+"""틱 → 봉 집계기 테스트"""
+from datetime import date, datetime, time
+
+from src.api.kis_parser import Tick
+from src.data.bar_aggregator import BarAggregator, write_bars
+
+DAY = date(2024, 1, 2)
+
+
+def _tick(code: str, hhmmss: str, price: int, volume: int) -> Tick:
+    return Tick(code, hhmmss, price, 0, 0.0, 0, 0, 0, 0, 0, volume, 0)
+
+
+def test_ticks_build_bars_per_symbol_and_timeframe():
+    aggregator = BarAggregator(['1m', '5m'])
+    completed = []
+    aggregator.add_handler(completed.append)
+
+    for tick in [
+        _tick('005930', '090001', 100, 1),
+        _tick('000660', '090002', 500, 7),
+        _tick('005930', '090030', 105, 2),
+        _tick('005930', '090059', 98, 3),
+        _tick('005930', '090100', 101, 4),  # 다음 1분봉 시작
+        _tick('005930', '090500', 102, 5),  # 다음 5분봉 시작
+    ]:
+        aggregator.update(tick, DAY)
+
+    one_minute = [b for b in completed if b.timeframe == '1m' and b.stock_code == '005930']
+    assert [(b.start, b.open, b.high, b.low, b.close, b.volume) for b in one_minute] == [
+        (datetime(2024, 1, 2, 9, 0), 100, 105, 98, 98, 6),
+        (datetime(2024, 1, 2, 9, 1), 101, 101, 101, 101, 4),
+    ]
+
+    five_minute = [b for b in completed if b.timeframe == '5m']
+    assert [(b.stock_code, b.open, b.high, b.low, b.close, b.volume) for b in five_minute] == [
+        ('005930', 100, 105, 98, 101, 10)
+    ]
+    # 다른 종목의 봉은 아직 진행 중
+    assert ('000660', '1m') in aggregator.bars
+
+
+def test_roll_and_drain():
+    aggregator = BarAggregator(['1m', '1d'])
+    aggregator.update(_tick('005930', '090001', 100, 1), DAY)
+    aggregator.update(_tick('005930', '090010', 110, 2), DAY)
+
+    # 구간이 끝나면 다음 틱 없이도 완성 (일봉은 유지)
+    closed = aggregator.roll(datetime(2024, 1, 2, 9, 1, 0))
+    assert [(b.timeframe, b.close, b.volume) for b in closed] == [('1m', 110, 3)]
+
+    aggregator.flush()
+    frames = aggregator.drain()
+    assert set(frames) == {('005930', '1m'), ('005930', '1d')}
+    assert frames[('005930', '1d')][['open', 'high', 'low', 'close', 'volume']].values.tolist() == [[100, 110, 100, 110, 3]]
+    assert aggregator.drain() == {}
+
+
+def test_late_tick_after_roll_does_not_reopen_bar():
+    aggregator = BarAggregator(['1m'])
+    completed = []
+    aggregator.add_handler(completed.append)
+
+    aggregator.update(_tick('005930', '090010', 100, 4), DAY)
+    aggregator.update(_tick('005930', '090050', 110, 6), DAY)
+    aggregator.roll(datetime(2024, 1, 2, 9, 1, 0, 500000))
+    # 완성된 09:00 구간의 지연 틱은 버림
+    aggregator.update(_tick('005930', '090059', 90, 1), DAY)
+    aggregator.update(_tick('005930', '090101', 111, 2), DAY)
+    aggregator.roll(datetime(2024, 1, 2, 9, 2, 0))
+
+    assert [(b.start.strftime('%H%M'), b.open, b.high, b.low, b.close, b.volume) for b in completed] == [
+        ('0900', 100, 110, 100, 110, 10),
+        ('0901', 111, 111, 111, 111, 2),
+    ]
+
+
+def test_flush_keeps_only_finished_bars_without_handlers():
+    aggregator = BarAggregator(['1m', '1d'], session_close=time(15, 30))
+    completed = []
+    aggregator.add_handler(completed.append)
+
+    aggregator.update(_tick('005930', '090010', 100, 4), DAY)
+    aggregator.update(_tick('005930', '090110', 101, 1), DAY)
+    completed.clear()
+    aggregator.drain()
+
+    # 09:01 분봉/일봉은 아직 진행 중이므로 버림
+    assert aggregator.flush(datetime(2024, 1, 2, 9, 1, 30)) == []
+    assert aggregator.bars == {} and aggregator.drain() == {}
+
+    aggregator.update(_tick('005930', '152900', 102, 2), DAY)
+    closed = aggregator.flush(datetime(2024, 1, 2, 15, 31))
+    assert sorted(b.timeframe for b in closed) == ['1d', '1m']
+    assert completed == []
+
+
+def test_synthetic_bars_reach_handlers_but_are_not_saved():
+    aggregator = BarAggregator(['1m'])
+    completed = []
+    aggregator.add_handler(completed.append)
+
+    aggregator.update(_tick('005930', '090010', 100, 4), DAY)
+    aggregator.update(_tick('005930', '090030', 101, 0), DAY, synthetic=True)
+    aggregator.update(_tick('005930', '090110', 102, 1), DAY)
+    aggregator.roll(datetime(2024, 1, 2, 9, 2, 0))
+
+    assert [b.synthetic for b in completed] == [True, False]
+    assert aggregator.drain()[('005930', '1m')]['close'].tolist() == [102]
+
+
+def test_write_bars_keeps_store_when_db_fails():
+    class FailingDB:
+        def get_session(self):
+            raise RuntimeError("db down")
+
+    class Store:
+        def __init__(self):
+            self.appended = []
+
+        def append(self, stock_code, timeframe, df):
+            self.appended.append((stock_code, timeframe, len(df)))
+
+    aggregator = BarAggregator(['1m'])
+    aggregator.update(_tick('005930', '090010', 100, 4), DAY)
+    aggregator.flush()
+    store = Store()
+
+    assert write_bars(aggregator.drain(), FailingDB(), store) == 0
+    assert store.appended == [('005930', '1m', 1)]
@@ -0,0 +1,71 @@
+"""틱 분배기 테스트"""
+import asyncio
+
+from src.api.dispatcher import TickDispatcher
+from src.api.kis_parser import Tick
+
+
+def _tick(code: str, price: int) -> Tick:
+    return Tick(code, '090000', price, 0, 0.0, price, price, price, price, price, 1, 1)
+
+
+def _run(policy: str, queue_size: int, ticks: list):
+    """핸들러를 멈춘 채 틱을 모두 넣은 뒤 풀어 처리 결과 확인"""
+    async def main():
+        gate = asyncio.Event()
+        seen = []
+
+        async def handler(tick):
+            await gate.wait()
+            seen.append((tick.stock_code, tick.price))
+
+        dispatcher = TickDispatcher(handler, shards=1, queue_size=queue_size, overflow=policy)
+        dispatcher.start()
+        await asyncio.sleep(0)
+
+        producer = asyncio.create_task(asyncio.wait_for(
+            _put_all(dispatcher, ticks), timeout=1.0
+        ))
+        await asyncio.sleep(0.01)
+        gate.set()
+        await producer
+        await dispatcher.queues[0].join()
+        await dispatcher.stop()
+        return seen, dispatcher.stats()
+
+    return asyncio.run(main())
+
+
+async def _put_all(dispatcher, ticks):
+    for tick in ticks:
+        await dispatcher.put(tick)
+
+
+def test_drop_oldest_keeps_latest_without_blocking():
+    ticks = [_tick('005930', p) for p in range(10)]
+    seen, stats = _run('drop_oldest', 3, ticks)
+
+    # 수신 루프는 대기 없이 넣고, 큐에는 최근 3개만 남음
+    assert seen == [('005930', 7), ('005930', 8), ('005930', 9)]
+    assert stats['dropped'] == 7
+    assert stats['max_depth'] == 3
+
+
+def test_conflate_keeps_latest_per_symbol():
+    ticks = [_tick('005930', 1), _tick('000660', 1), _tick('005930', 2),
+             _tick('005930', 3), _tick('000660', 2)]
+    seen, stats = _run('conflate', 10, ticks)
+
+    # 종목별로 처음 들어온 순서를 유지하면서 최신 틱만 처리
+    assert seen == [('005930', 3), ('000660', 2)]
+    assert stats['conflated'] == 3
+    assert stats['dropped'] == 0
+
+
+def test_block_loses_nothing():
+    ticks = [_tick('005930', p) for p in range(10)]
+    seen, stats = _run('block', 2, ticks)
+
+    assert [price for _, price in seen] == list(range(10))
+    assert stats['dropped'] == 0
+    assert stats['processed'] == 10
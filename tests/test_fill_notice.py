@@ -0,0 +1,146 @@
+"""실시간 체결통보 테스트"""
+import asyncio
+import json
+from datetime import date
+
+import pytest
+
+from src.api import OrderResponse, Position
+from src.api.kis_parser import parse_frame
+from src.api.kis_websocket import KISWebSocketClient
+from src.execution import OrderExecutor
+
+
+def _notice(order_no: str, side: str, code: str, qty: int, price: int, filled: bool = True,
+            rejected: bool = False, cancels: str = '') -> str:
+    """H0STCNI9 레코드 (23개 필드, cancels: 취소 대상 원주문번호)"""
+    fields = [''] * 23
+    fields[1] = '5000000001'
+    fields[2] = order_no
+    fields[3] = cancels
+    fields[5] = '2' if cancels else '0'
+    fields[4] = side
+    fields[8] = code
+    fields[9] = str(qty)
+    fields[10] = str(price)
+    fields[11] = '093001'
+    fields[12] = '1' if rejected else '0'
+    fields[13] = '2' if filled else '1'
+    fields[16] = '10'
+    fields[22] = str(price)
+    return '^'.join(fields)
+
+
+def test_fill_frame_parsed():
+    tr_id, fills = parse_frame('0|H0STCNI9|001|' + _notice('0000012345', '02', '005930', 3, 73100))
+
+    assert tr_id == 'H0STCNI9'
+    fill = fills[0]
+    assert (fill.order_no, fill.order_type, fill.stock_code) == ('0000012345', 'BUY', '005930')
+    assert (fill.quantity, fill.price, fill.filled, fill.rejected) == (3, 73100, True, False)
+
+
+def test_encrypted_frame_decrypted_with_subscribe_key():
+    AES = pytest.importorskip('Crypto.Cipher.AES')
+    from Crypto.Util.Padding import pad
+    import base64
+
+    key, iv = 'k' * 32, 'i' * 16
+    plain = _notice('0000012345', '01', '005930', 2, 73000)
+    cipher = AES.new(key.encode(), AES.MODE_CBC, iv.encode())
+    payload = base64.b64encode(cipher.encrypt(pad(plain.encode(), AES.block_size))).decode()
+    raw = '1|H0STCNI9|001|' + payload
+
+    client = KISWebSocketClient(mode='mock')
+    assert client._parse_message(raw) is None  # 키 수신 전
+
+    asyncio.run(client._handle_control(json.dumps({
+        'header': {'tr_id': 'H0STCNI9', 'tr_key': 'hts', 'encrypt': 'N'},
+        'body': {'rt_cd': '0', 'msg1': 'SUBSCRIBE SUCCESS', 'output': {'iv': iv, 'key': key}},
+    })))
+    _, fills = client._parse_message(raw)
+    assert (fills[0].order_type, fills[0].quantity, fills[0].price) == ('SELL', 2, 73000)
+
+
+def test_fills_update_orders_and_positions():
+    executor = OrderExecutor(mode='mock')
+    executor.positions_synced = True
+    seen = []
+    executor.add_fill_handler(seen.append)
+
+    _, fills = parse_frame('0|H0STCNI9|003|' + '^'.join([
+        _notice('0000000007', '02', '005930', 10, 73000, filled=False),
+        _notice('0000000007', '02', '005930', 4, 73000),
+        _notice('0000000007', '02', '005930', 6, 73500),
+    ]))
+    executor.orders['7'] = OrderResponse(order_id='7', stock_code='005930', order_type='BUY',
+                                         price=0, quantity=10, status='submitted')
+
+    executor.on_fill(fills[0])
+    assert executor.orders['7'].status == 'accepted'
+    executor.on_fill(fills[1])
+    assert executor.orders['7'].status == 'partially_filled'
+    executor.on_fill(fills[2])
+    assert '7' not in executor.orders
+
+    position = executor.positions['005930']
+    assert (position.quantity, position.avg_price) == (10, 73300)
+    assert len(seen) == 2
+
+    _, (sell,) = parse_frame('0|H0STCNI9|001|' + _notice('0000000008', '01', '005930', 10, 74000))
+    executor.on_fill(sell)
+    assert '005930' not in executor.positions
+
+
+def test_rejected_cancelled_and_stale_orders_removed():
+    executor = OrderExecutor(mode='mock')
+    for order_no in ('7', '8', '9'):
+        executor.orders[order_no] = OrderResponse(order_id=order_no, stock_code='005930', order_type='BUY',
+                                                  price=73000, quantity=10, status='submitted')
+
+    _, fills = parse_frame('0|H0STCNI9|002|' + '^'.join([
+        _notice('0000000007', '02', '005930', 10, 73000, filled=False, rejected=True),
+        _notice('0000000010', '02', '005930', 10, 73000, filled=False, cancels='0000000008'),
+    ]))
+    executor.on_fill(fills[0])
+    executor.on_fill(fills[1])
+    assert fills[1].cancelled and not fills[0].cancelled
+    assert list(executor.orders) == ['9']
+
+    # 당일 주문이므로 날짜가 바뀌면 남은 미체결 주문 제거
+    executor.orders_date = date(2024, 1, 2)
+    executor.on_fill(fills[0])
+    assert executor.orders == {}
+
+
+class FakeRest:
+    def __init__(self):
+        self.calls = 0
+
+    def get_positions(self):
+        self.calls += 1
+        return [Position(stock_code='005930', stock_name='', quantity=self.calls, avg_price=70000,
+                         current_price=70000)]
+
+
+def test_positions_served_from_notices_only_while_subscription_active():
+    executor = OrderExecutor(mode='mock')
+    executor.executor = rest = FakeRest()
+
+    async def main():
+        # 체결통보 등록 전: 매번 REST 조회
+        await executor.get_positions()
+        await executor.get_positions()
+        assert rest.calls == 2 and not executor.positions_synced
+
+        # 등록 ACK: 놓친 체결 반영을 위해 다시 조회한 뒤 통보 기반으로 전환
+        await executor.on_notice_status(True)
+        positions = await executor.get_positions()
+        assert rest.calls == 3 and positions[0].quantity == 3
+
+        # 재연결/NACK: REST로 복귀
+        await executor.on_notice_status(False)
+        await executor.get_positions()
+        assert rest.calls == 4
+
+    asyncio.run(main())
@@ -0,0 +1,46 @@
+"""파라미터 그리드 일괄 평가 테스트"""
+import numpy as np
+import pytest
+
+from src.optimization import Backtester, GridOptimizer
+from src.strategy.bollinger_strategy import BollingerStrategy
+from src.strategy.rsi_strategy import RSIStrategy
+from src.strategy.sma_strategy import SMAStrategy
+
+
+GRID_CASES = [
+    (SMAStrategy, {'short_window': [3, 5, 10], 'long_window': [5, 10, 20]}),
+    (BollingerStrategy, {'window': [10, 20], 'window_dev': [1.5, 2.0]}),
+    (RSIStrategy, {'rsi_period': [5, 14]}),
+]
+
+
+@pytest.mark.parametrize("strategy_class,grid", GRID_CASES)
+def test_grid_cells_match_single_backtests(strategy_class, grid):
+    """그리드의 각 셀이 조합별 벡터화 백테스트와 같은 지표를 내는지 확인"""
+    backtester = Backtester()
+    result = GridOptimizer(backtester).evaluate(strategy_class, "005930", grid, days=90)
+    table = result['table']
+
+    assert list(table['score']) == sorted(table['score'], reverse=True)
+    for row in table.to_dict('records'):
+        config = {name: row[name] for name in grid}
+        expected = backtester.run_vectorized_backtest(strategy_class(config=config), "005930", days=90)
+        for key in ('final_equity', 'total_return', 'total_trades', 'win_rate',
+                    'max_drawdown', 'sharpe_ratio'):
+            assert row[key] == pytest.approx(expected[key]), (config, key)
+
+
+def test_surface_and_best_cells():
+    grid = {'short_window': [3, 5, 10], 'long_window': [5, 10, 20]}
+    result = GridOptimizer().evaluate(SMAStrategy, "005930", grid, days=90)
+
+    surface = result['surface']['score']
+    assert surface.shape == (3, 3)
+    # short >= long 조합은 무효
+    assert np.isnan(surface[1, 0]) and np.isnan(surface[2, 1]) and not np.isnan(surface[0, 2])
+    assert len(result['table']) == 6
+
+    best = GridOptimizer.best_cells(result, k=2)
+    assert len(best) == 2 and best[0]['score'] == np.nanmax(surface)
+    assert set(best[0]['params']) == set(grid)
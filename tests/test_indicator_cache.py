@@ -0,0 +1,57 @@
+"""지표 캐시 테스트"""
+import numpy as np
+import pandas as pd
+
+from src.strategy.base import BaseStrategy
+from src.strategy.bollinger_strategy import BollingerStrategy
+from src.strategy.indicator_cache import IndicatorCache
+from src.strategy.sma_strategy import SMAStrategy
+import src.strategy.indicator_cache as indicator_cache
+
+
+def _frame(seed: int = 0, n: int = 120) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 10000 + np.cumsum(rng.normal(0, 100, n))
+    return pd.DataFrame({'open': close, 'high': close + 50, 'low': close - 50,
+                         'close': close, 'volume': np.full(n, 1000)})
+
+
+def test_lru_eviction_under_memory_cap():
+    close = pd.Series(np.arange(100, dtype=float))
+    cache = IndicatorCache(max_bytes=2 * 100 * 8)
+    calls = []
+
+    def compute(window):
+        calls.append(window)
+        return close.rolling(window).mean()
+
+    for window in (3, 5, 3, 7):
+        cache.get('sma', (window,), (close,), lambda: compute(window))
+
+    # 3은 최근 사용되어 남고, 가장 오래된 5가 제거됨
+    assert calls == [3, 5, 7]
+    cache.get('sma', (3,), (close,), lambda: compute(3))
+    cache.get('sma', (5,), (close,), lambda: compute(5))
+    assert calls == [3, 5, 7, 5]
+    assert cache.stats()['evictions'] == 2 and cache.nbytes <= cache.max_bytes
+
+    # 데이터가 다르면 다른 키
+    cache.get('sma', (3,), (close + 1,), lambda: compute(3))
+    assert calls[-1] == 3
+
+
+def test_cached_signals_match_uncached(monkeypatch):
+    monkeypatch.setattr(indicator_cache, '_cache_instance', IndicatorCache())
+    df = _frame()
+
+    for strategy in (SMAStrategy({'short_window': 5, 'long_window': 20}),
+                     BollingerStrategy({'window': 10, 'window_dev': 1.5})):
+        expected = BaseStrategy.generate_signals(strategy, df)
+        assert np.array_equal(strategy.generate_signals(df), expected)
+        assert np.array_equal(strategy.generate_signals(df), expected)
+
+    # 같은 long_window / window를 쓰는 시도는 지표를 재계산하지 않음
+    SMAStrategy({'short_window': 3, 'long_window': 20}).generate_signals(df)
+    BollingerStrategy({'window': 10, 'window_dev': 2.5}).generate_signals(df)
+    stats = indicator_cache._cache_instance.stats()
+    assert stats['misses'] == 4 and stats['hits'] == 5
@@ -0,0 +1,65 @@
+"""스트리밍 지표 테스트"""
+import numpy as np
+import pandas as pd
+import pytest
+import ta
+
+from src.strategy.indicators import SMA, WilderRSI, MACD, BollingerBands, Stochastic
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(7)
+    close = 50000 * np.exp(np.cumsum(rng.normal(0.0005, 0.02, 300)))
+    high = close * (1 + rng.uniform(0, 0.02, 300))
+    low = close * (1 - rng.uniform(0, 0.02, 300))
+    return pd.Series(close), pd.Series(high), pd.Series(low)
+
+
+def _assert_series_close(streamed, expected):
+    streamed = np.asarray(streamed, dtype=float)
+    expected = np.asarray(expected, dtype=float)
+    np.testing.assert_array_equal(np.isnan(streamed), np.isnan(expected))
+    mask = ~np.isnan(expected)
+    np.testing.assert_allclose(streamed[mask], expected[mask], rtol=1e-9)
+
+
+def test_sma_matches_ta(prices):
+    close, _, _ = prices
+    sma = SMA(20)
+    _assert_series_close([sma.update(p) for p in close],
+                         ta.trend.SMAIndicator(close=close, window=20).sma_indicator())
+
+
+def test_rsi_matches_ta(prices):
+    close, _, _ = prices
+    rsi = WilderRSI(14)
+    _assert_series_close([rsi.update(p) for p in close],
+                         ta.momentum.RSIIndicator(close=close, window=14).rsi())
+
+
+def test_macd_matches_ta(prices):
+    close, _, _ = prices
+    macd = MACD(12, 26, 9)
+    streamed = [macd.update(p) for p in close]
+    expected = ta.trend.MACD(close=close, window_slow=26, window_fast=12, window_sign=9)
+    _assert_series_close([m for m, _ in streamed], expected.macd())
+    _assert_series_close([s for _, s in streamed], expected.macd_signal())
+
+
+def test_bollinger_matches_ta(prices):
+    close, _, _ = prices
+    bands = BollingerBands(20, 2.0)
+    streamed = [bands.update(p) for p in close]
+    expected = ta.volatility.BollingerBands(close=close, window=20, window_dev=2.0)
+    _assert_series_close([h for _, h, _ in streamed], expected.bollinger_hband())
+    _assert_series_close([l for _, _, l in streamed], expected.bollinger_lband())
+
+
+def test_stochastic_matches_ta(prices):
+    close, high, low = prices
+    stoch = Stochastic(14, 3)
+    streamed = [stoch.update(h, l, c) for h, l, c in zip(high, low, close)]
+    expected = ta.momentum.StochasticOscillator(high=high, low=low, close=close, window=14, smooth_window=3)
+    _assert_series_close([k for k, _ in streamed], expected.stoch())
+    _assert_series_close([d for _, d in streamed], expected.stoch_signal())
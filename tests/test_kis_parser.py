@@ -0,0 +1,47 @@
+"""실시간 프레임 파서 테스트"""
+from src.api.kis_parser import parse_frame
+
+
+def _trade_fields(code: str, time: str, price: int, volume: int) -> list:
+    """H0STCNT0 레코드 (46개 필드)"""
+    fields = ['0'] * 46
+    fields[0] = code
+    fields[1] = time
+    fields[2] = str(price)
+    fields[3] = '5'
+    fields[4] = '-1100'
+    fields[5] = '-1.48'
+    fields[7], fields[8], fields[9] = '74000', '74500', '72900'
+    fields[10], fields[11] = str(price + 100), str(price)
+    fields[12] = str(volume)
+    fields[13] = '1234567'
+    return fields
+
+
+def test_single_record():
+    raw = '0|H0STCNT0|001|' + '^'.join(_trade_fields('005930', '093001', 73100, 15))
+    tr_id, ticks = parse_frame(raw)
+
+    assert tr_id == 'H0STCNT0'
+    assert len(ticks) == 1
+    tick = ticks[0]
+    assert (tick.stock_code, tick.time, tick.price, tick.volume) == ('005930', '093001', 73100, 15)
+    assert (tick.open, tick.high, tick.low) == (74000, 74500, 72900)
+    assert (tick.ask, tick.bid) == (73200, 73100)
+    assert tick.change == -1100 and tick.change_rate == -1.48
+    assert tick.cum_volume == 1234567
+
+
+def test_multiple_records_in_one_frame():
+    records = [_trade_fields('005930', f'09000{i}', 73000 + i * 100, i + 1) for i in range(4)]
+    raw = '0|H0STCNT0|004|' + '^'.join(f for record in records for f in record)
+    _, ticks = parse_frame(raw)
+
+    assert [t.price for t in ticks] == [73000, 73100, 73200, 73300]
+    assert [t.volume for t in ticks] == [1, 2, 3, 4]
+
+
+def test_non_data_frames_ignored():
+    assert parse_frame('{"header": {"tr_id": "PINGPONG"}}') is None
+    assert parse_frame('1|H0STCNI0|001|encrypted') is None
+    assert parse_frame('0|UNKNOWN|001|a^b') is None
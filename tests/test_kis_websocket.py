@@ -0,0 +1,132 @@
+"""WebSocket 제어 프레임 처리 테스트"""
+import asyncio
+import json
+
+from src.api.kis_websocket import KISWebSocketClient
+
+
+class FakeSocket:
+    def __init__(self):
+        self.sent = []
+        self.pongs = []
+
+    async def send(self, message):
+        self.sent.append(json.loads(message))
+
+    async def pong(self, data):
+        self.pongs.append(data)
+
+    async def close(self):
+        self.closed = True
+
+
+def _ack(tr_id: str, tr_key: str, rt_cd: str = '0', msg: str = 'SUBSCRIBE SUCCESS') -> str:
+    return json.dumps({
+        'header': {'tr_id': tr_id, 'tr_key': tr_key, 'encrypt': 'N'},
+        'body': {'rt_cd': rt_cd, 'msg_cd': 'OPSP0000', 'msg1': msg},
+    })
+
+
+def _client() -> KISWebSocketClient:
+    client = KISWebSocketClient(mode='mock', tr_ids=['H0STCNT0', 'H0STASP0'])
+    client.websocket = FakeSocket()
+    client.approval_key = 'key'
+    return client
+
+
+def test_pingpong_echoed():
+    client = _client()
+    ping = json.dumps({'header': {'tr_id': 'PINGPONG', 'datetime': '20240102090000'}})
+
+    asyncio.run(client._handle_control(ping))
+
+    assert client.websocket.pongs == [ping]
+    assert client.pings == 1 and client.acks == 0
+
+
+def test_acks_and_nacks_tracked_per_subscription():
+    client = _client()
+
+    async def main():
+        await client.subscribe('005930')
+        assert set(client.pending) == {('H0STCNT0', '005930'), ('H0STASP0', '005930')}
+
+        await client._handle_control(_ack('H0STCNT0', '005930'))
+        await client._handle_control(_ack('H0STASP0', '005930', rt_cd='1', msg='MAX SUBSCRIBE OVER'))
+
+        await client.unsubscribe('005930')
+        await client._handle_control(_ack('H0STCNT0', '005930', msg='UNSUBSCRIBE SUCCESS'))
+
+    asyncio.run(main())
+
+    assert client.acks == 2 and client.nacks == 1
+    assert client.rejected == {('H0STASP0', '005930'): 'MAX SUBSCRIBE OVER'}
+    assert client.active == set()
+    assert list(client.pending) == [('H0STASP0', '005930')]  # 해제 응답 대기 중
+    assert [m['header']['tr_type'] for m in client.websocket.sent] == ['1', '1', '2', '2']
+
+
+def test_resubscribe_latency_recorded_when_all_acks_arrive():
+    client = _client()
+
+    async def main():
+        client._resubscribe_started = 0.0
+        await client.subscribe('005930')
+        await client._handle_control(_ack('H0STCNT0', '005930'))
+        assert client.last_resubscribe_latency is None
+        await client._handle_control(_ack('H0STASP0', '005930'))
+
+    asyncio.run(main())
+
+    assert client.last_resubscribe_latency is not None
+    assert client.stats()['active'] == 2 and client.stats()['pending'] == 0
+
+
+def test_notice_status_follows_fill_subscription():
+    client = _client()
+    client.hts_id = 'hts'
+    statuses = []
+    client.set_notice_handler(statuses.append)
+
+    async def main():
+        await client.subscribe_fills()
+        await client._handle_control(_ack(client.fill_tr_id, 'hts'))
+        await client.subscribe_fills()
+        await client._handle_control(_ack(client.fill_tr_id, 'hts', rt_cd='1', msg='INVALID HTS ID'))
+        # 다른 채널 응답은 통보 상태와 무관
+        await client.subscribe('005930')
+        await client._handle_control(_ack('H0STCNT0', '005930'))
+
+    asyncio.run(main())
+
+    assert statuses == [True, False]
+
+
+def test_rejected_approval_key_invalidated_before_reconnect(monkeypatch):
+    client = _client()
+    invalidated = []
+
+    class FakeManager:
+        def invalidate_approval_key(self, key=None):
+            invalidated.append(key)
+
+        def get_approval_key(self):
+            return 'new-key'
+
+    async def fake_connect():
+        client.approval_key = FakeManager().get_approval_key()
+        client.approval_rejected = False
+
+    monkeypatch.setattr('src.api.kis_websocket.get_token_manager', lambda mode: FakeManager())
+    monkeypatch.setattr(client, 'connect', fake_connect)
+
+    async def main():
+        await client.subscribe('005930')
+        await client._handle_control(_ack('H0STCNT0', '005930', rt_cd='1', msg='invalid approval : NOT FOUND'))
+        assert client.approval_rejected and client.websocket.closed
+        await client._reconnect()
+
+    asyncio.run(main())
+
+    assert invalidated == ['key']
+    assert client.approval_key == 'new-key' and not client.approval_rejected
@@ -0,0 +1,65 @@
+"""OHLCV 저장소 테스트"""
+import numpy as np
+import pandas as pd
+
+from src.data.ohlcv_store import OHLCVStore
+from src.optimization import Backtester
+
+
+def _bars(start: str, periods: int, freq: str = '1min') -> pd.DataFrame:
+    dates = pd.date_range(start=start, periods=periods, freq=freq)
+    close = np.linspace(50000, 51000, periods)
+    return pd.DataFrame({
+        'date': dates,
+        'open': close - 10,
+        'high': close + 20,
+        'low': close - 20,
+        'close': close,
+        'volume': np.arange(periods, dtype=np.int64) + 100
+    })
+
+
+def test_append_is_idempotent_and_ordered(tmp_path):
+    """같은 구간을 다시 넣어도 중복 없이 마지막 시각 이후만 추가"""
+    store = OHLCVStore(root=str(tmp_path))
+    bars = _bars('2024-01-02 09:00', 120)
+    
+    assert store.append('005930', '1m', bars.iloc[:60]) == 60
+    assert store.append('005930', '1m', bars) == 60
+    assert store.append('005930', '1m', bars) == 0
+    assert store.count('005930', '1m') == 120
+    
+    loaded = store.load('005930', '1m')
+    pd.testing.assert_series_equal(loaded['close'], bars['close'], check_names=False)
+    assert (loaded['date'] == bars['date']).all()
+    assert store.last_timestamp('005930', '1m') == bars['date'].iloc[-1].to_pydatetime()
+
+
+def test_load_range_uses_memmap_slice(tmp_path):
+    """구간 조회는 메모리 맵 슬라이스로 반환"""
+    store = OHLCVStore(root=str(tmp_path))
+    store.append('000660', '1m', _bars('2024-01-02 09:00', 100))
+    
+    arrays = store.load_arrays('000660', '1m', start=pd.Timestamp('2024-01-02 09:10'), end=pd.Timestamp('2024-01-02 09:19'))
+    assert isinstance(arrays['close'], np.memmap)
+    assert len(arrays['close']) == 10
+    assert store.load_arrays('035420', '1m') == {}
+
+
+def test_backtester_reads_from_store(tmp_path):
+    """저장소에 데이터가 있으면 Mock 대신 저장된 봉을 사용"""
+    store = OHLCVStore(root=str(tmp_path))
+    store.append('005930', '1d', _bars('2023-01-02', 400, freq='D'))
+    
+    df = Backtester(store=store).get_historical_data('005930', days=30)
+    assert len(df) == 31
+    assert df['close'].iloc[-1] == 51000
+
+
+def test_backtester_skips_store_with_too_few_bars(tmp_path):
+    """실시간 봉 며칠치만 있는 저장소는 요청 기간을 채우지 못하므로 사용하지 않음"""
+    store = OHLCVStore(root=str(tmp_path))
+    store.append('005930', '1d', _bars('2024-01-02', 2, freq='D'))
+    
+    df = Backtester(store=store).get_historical_data('005930', days=90)
+    assert len(df) == 91  # Mock 데이터
@@ -0,0 +1,59 @@
+"""베이지안 최적화 배치(ask/tell) 모드 테스트"""
+import numpy as np
+import pytest
+from bayes_opt import BayesianOptimization, UtilityFunction
+
+from src.optimization import Backtester, BayesianOptimizer
+from src.optimization import optimizer as optimizer_module
+from src.strategy.rsi_strategy import RSIStrategy
+
+BOUNDS = {'rsi_period': (5, 20), 'buy_threshold': (20, 40), 'sell_threshold': (60, 80)}
+
+
+def test_batch_mode_registers_every_evaluation(monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("single worker must evaluate inline")
+    monkeypatch.setattr(optimizer_module, 'ProcessPoolExecutor', no_pool)
+
+    optimizer = BayesianOptimizer(Backtester(vectorized=True))
+    result = optimizer.optimize_strategy(
+        RSIStrategy, "005930", BOUNDS, n_iterations=4, init_points=2,
+        batch_size=3, n_workers=1
+    )
+
+    # 초기 2개 + 탐색 4개 (라운드 3개 + 1개)
+    assert len(result['optimization_history']) == 6
+    assert result['best_score'] == max(h['score'] for h in result['optimization_history'])
+
+
+@pytest.mark.parametrize("liar", ['min', 'mean', 'max', 'kriging'])
+def test_suggest_batch_spreads_candidates_without_touching_history(liar):
+    optimizer = BayesianOptimizer()
+    study = BayesianOptimization(f=None, pbounds=BOUNDS, random_state=1, verbose=0)
+    rng = np.random.RandomState(0)
+    for _ in range(4):
+        params = study.space.array_to_params(study.space.random_sample())
+        study.register(params=params, target=float(rng.normal()))
+
+    utility = UtilityFunction(kind='ucb', kappa=2.576, xi=0.0)
+    batch = optimizer._suggest_batch(study, utility, BOUNDS, 3, liar)
+
+    assert len(batch) == 3
+    assert len({tuple(sorted(p.items())) for p in batch}) == 3  # 가짜 관측값으로 같은 후보 반복 방지
+    assert len(study.space) == 4  # 실제 기록에는 등록하지 않음
+
+
+def test_duplicate_candidates_skipped_on_register(monkeypatch):
+    optimizer = BayesianOptimizer(Backtester(vectorized=True))
+    study = BayesianOptimization(f=None, pbounds=BOUNDS, random_state=1, verbose=0)
+
+    def suggest(opt, utility, bounds, batch_size, liar):
+        # 이미 관측한 포인트를 다시 제안해도 NotUniqueError 없이 건너뜀
+        first = opt.space.array_to_params(opt.space.params[0])
+        return [first, {'rsi_period': 9.0, 'buy_threshold': 30.0, 'sell_threshold': 70.0}][:batch_size]
+
+    monkeypatch.setattr(optimizer, '_suggest_batch', suggest)
+    optimizer._maximize_batch(study, RSIStrategy, "005930", BOUNDS, 'sharpe_ratio',
+                              init_points=1, n_iterations=2, batch_size=2, n_workers=1)
+
+    assert len(study.space) == 2
@@ -0,0 +1,77 @@
+"""10단계 호가창 테스트"""
+from src.api.kis_parser import parse_frame
+from src.data.order_book import OrderBooks
+
+
+def _quote_fields(code: str, time: str, best_ask: int, best_bid: int, tick: int = 100) -> list:
+    """H0STASP0 레코드 (59개 필드). 잔량은 단계마다 10씩 증가"""
+    fields = ['0'] * 59
+    fields[0] = code
+    fields[1] = time
+    for i in range(10):
+        fields[3 + i] = str(best_ask + tick * i)    # 매도호가 1~10
+        fields[13 + i] = str(best_bid - tick * i)   # 매수호가 1~10
+        fields[23 + i] = str(10 * (i + 1))          # 매도잔량 1~10
+        fields[33 + i] = str(20 * (i + 1))          # 매수잔량 1~10
+    fields[43] = '550'
+    fields[44] = '1100'
+    return fields
+
+
+def _apply(books: OrderBooks, *records):
+    raw = f'0|H0STASP0|{len(records):03d}|' + '^'.join(f for record in records for f in record)
+    tr_id, updates = parse_frame(raw)
+    assert tr_id == 'H0STASP0'
+    for update in updates:
+        books.apply(update)
+
+
+def test_book_levels_and_features():
+    books = OrderBooks()
+    _apply(books, _quote_fields('005930', '090001', 73200, 73100))
+
+    book = books.get('005930')
+    assert book is not None
+    assert (book.best_ask, book.best_bid, book.spread, book.mid) == (73200, 73100, 100, 73150)
+    assert book.total_ask_qty == 550 and book.total_bid_qty == 1100
+    assert book.depth('ask', 3) == 10 + 20 + 30
+    assert book.depth('bid', 3) == 20 + 40 + 60
+    assert book.imbalance(3) == (120 - 60) / 180
+
+    features = book.features()
+    assert features['spread'] == 100 and features['bid_depth'] == 300
+
+
+def test_updates_overwrite_in_place():
+    books = OrderBooks()
+    _apply(books, _quote_fields('005930', '090001', 73200, 73100))
+    levels = books.get('005930').levels
+
+    _apply(books, _quote_fields('005930', '090002', 73300, 73200),
+           _quote_fields('000660', '090002', 130500, 130000, tick=500))
+
+    book = books.get('005930')
+    assert book.levels is levels
+    assert (book.best_ask, book.best_bid, book.updates) == (73300, 73200, 2)
+    assert books.get('000660').best_ask == 130500
+
+
+def test_marketable_price_walks_opposite_side():
+    books = OrderBooks()
+    _apply(books, _quote_fields('005930', '090001', 73200, 73100))
+    book = books.get('005930')
+
+    assert book.marketable_price('BUY', 5) == 73200
+    assert book.marketable_price('BUY', 25) == 73300    # 10 + 20
+    assert book.marketable_price('SELL', 50) == 73000   # 20 + 40
+    assert book.marketable_price('BUY', 10_000) is None  # 10단계 잔량 부족
+
+
+def test_empty_or_discarded_book_is_not_ready():
+    books = OrderBooks()
+    _apply(books, _quote_fields('005930', '090001', 0, 0))
+    assert books.get('005930') is None
+
+    _apply(books, _quote_fields('005930', '090002', 73200, 73100))
+    books.discard('005930')
+    assert books.get('005930') is None
@@ -0,0 +1,53 @@
+"""속도 제한기 테스트"""
+import threading
+import time
+
+from src.api.rate_limiter import RateLimiter, Priority
+
+
+def test_burst_then_throttle():
+    """버킷 용량만큼은 즉시 통과하고 이후에는 초당 rate로 제한"""
+    limiter = RateLimiter(requests_per_second=10, requests_per_minute=1000)
+    
+    start = time.monotonic()
+    for _ in range(10):
+        assert limiter.acquire(timeout=0.01)
+    assert time.monotonic() - start < 0.05
+    
+    assert not limiter.acquire(timeout=0.01)
+    assert limiter.acquire(timeout=0.5)
+
+
+def test_minute_bucket_applies():
+    """분당 한도도 함께 적용"""
+    limiter = RateLimiter(requests_per_second=100, requests_per_minute=3)
+    for _ in range(3):
+        assert limiter.acquire(timeout=0.01)
+    assert not limiter.acquire(timeout=0.05)
+
+
+def test_orders_served_before_quotes():
+    """대기 중인 주문이 시세 조회보다 먼저 토큰을 받음"""
+    limiter = RateLimiter(requests_per_second=5, requests_per_minute=1000)
+    for _ in range(5):
+        limiter.acquire()
+    
+    served = []
+    
+    def worker(priority):
+        limiter.acquire(priority)
+        served.append(priority)
+    
+    threads = [threading.Thread(target=worker, args=(Priority.BALANCE,)) for _ in range(2)]
+    threads += [threading.Thread(target=worker, args=(Priority.QUOTE,)) for _ in range(2)]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    order_thread = threading.Thread(target=worker, args=(Priority.ORDER,))
+    order_thread.start()
+    
+    for t in threads + [order_thread]:
+        t.join(timeout=3)
+    
+    assert served[0] == Priority.ORDER
+    assert served[-2:] == [Priority.BALANCE, Priority.BALANCE]
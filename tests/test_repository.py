@@ -0,0 +1,95 @@
+"""레포지토리 테스트"""
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.database.models import Base, MarketData
+from src.database.repository import MarketDataRepository
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _bars(periods: int) -> pd.DataFrame:
+    close = np.linspace(70000, 71000, periods)
+    return pd.DataFrame({
+        'date': pd.date_range('2024-01-02 09:00', periods=periods, freq='1min'),
+        'open': close - 100,
+        'high': close + 100,
+        'low': close - 200,
+        'close': close,
+        'volume': np.full(periods, 1000)
+    })
+
+
+def test_bulk_upsert_inserts_and_updates(session):
+    """벌크 업서트: 신규 봉은 추가, 기존 봉은 갱신"""
+    bars = _bars(390)
+    assert MarketDataRepository.bulk_upsert(session, '005930', '1m', bars) == 390
+    
+    updated = bars.iloc[-10:].copy()
+    updated['close'] = 80000
+    MarketDataRepository.bulk_upsert(session, '005930', '1m', updated)
+    session.commit()
+    
+    assert session.query(MarketData).count() == 390
+    
+    df = MarketDataRepository.get_ohlcv_frame(session, '005930', '1m')
+    assert list(df.columns) == ['date', 'open', 'high', 'low', 'close', 'volume']
+    assert df['date'].is_monotonic_increasing
+    assert (df['close'].iloc[-10:] == 80000).all()
+    assert df['close'].iloc[0] == 70000
+
+
+def test_get_ohlcv_frame_limit_returns_latest(session):
+    """limit 지정 시 최근 봉을 시간 오름차순으로 반환"""
+    bars = _bars(50)
+    MarketDataRepository.bulk_upsert(session, '000660', '1m', bars)
+    
+    df = MarketDataRepository.get_ohlcv_frame(session, '000660', '1m', limit=5)
+    assert len(df) == 5
+    assert (df['date'].to_numpy() == bars['date'].iloc[-5:].to_numpy()).all()
+
+
+def test_legacy_non_unique_index_migrated():
+    """이전 버전의 비유니크 인덱스는 중복 정리 후 유니크로 다시 생성"""
+    from sqlalchemy import text
+    from src.database.database import migrate_market_data_index
+    
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX idx_stock_timeframe_timestamp"))
+        conn.execute(text("CREATE INDEX idx_stock_timeframe_timestamp ON market_data (stock_code, timeframe, timestamp)"))
+        for close in (100, 200):
+            conn.execute(text(
+                "INSERT INTO market_data (stock_code, timeframe, open_price, high_price, low_price, close_price, volume, timestamp) "
+                f"VALUES ('005930', '1m', 1, 1, 1, {close}, 1, '2024-01-02 09:00:00.000000')"
+            ))
+    
+    assert migrate_market_data_index(engine)
+    assert not migrate_market_data_index(engine)
+    
+    session = sessionmaker(bind=engine)()
+    assert [row.close_price for row in session.query(MarketData)] == [200]
+    assert MarketDataRepository.bulk_upsert(session, '005930', '1m', _bars(3)) == 3
+    session.commit()
+    assert session.query(MarketData).count() == 3
+    session.close()
+
+
+def test_bulk_upsert_rejects_unsupported_dialect():
+    class FakeSession:
+        def get_bind(self):
+            return type('Bind', (), {'dialect': type('Dialect', (), {'name': 'mysql'})()})()
+    
+    with pytest.raises(NotImplementedError):
+        MarketDataRepository.bulk_upsert(FakeSession(), '005930', '1m', _bars(3))
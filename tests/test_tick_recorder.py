@@ -0,0 +1,50 @@
+"""틱 기록기/재생기 테스트"""
+import asyncio
+from datetime import datetime
+
+from src.api.kis_parser import Tick
+from src.data.tick_recorder import TickRecorder, TickReplay
+
+
+def _ns(text: str) -> int:
+    return int(datetime.strptime(text, '%Y-%m-%d %H:%M:%S').timestamp() * 1e9)
+
+
+def _tick(code: str, price: int, volume: int) -> Tick:
+    return Tick(code, '090000', price, -100, -0.5, 70000, 71000, 69000, price + 100, price, volume, 1000)
+
+
+def test_record_and_load_daily_segments(tmp_path):
+    recorder = TickRecorder(root=str(tmp_path), flush_size=2)
+    recorder.record(_tick('005930', 70000, 1), _ns('2024-01-02 09:00:00'))
+    recorder.record(_tick('000660', 130000, 2), _ns('2024-01-02 09:00:01'))
+    recorder.record(_tick('005930', 70100, 3), _ns('2024-01-02 15:20:00'))
+    recorder.record(_tick('005930', 70500, 4), _ns('2024-01-03 09:00:00'))
+    recorder.record_raw('0|H0STCNT0|001|005930^090000', _ns('2024-01-03 09:00:00'))
+    recorder.close()
+
+    assert recorder.days() == ['20240102', '20240103']
+
+    day1 = recorder.load('20240102')
+    assert len(day1) == 3
+    assert day1['price'].tolist() == [70000, 130000, 70100]
+    assert day1['stock_code'].tolist() == [b'005930', b'000660', b'005930']
+    assert recorder.load('20240103')['volume'].tolist() == [4]
+
+    assert list(recorder.iter_raw('20240103')) == [
+        (_ns('2024-01-03 09:00:00'), '0|H0STCNT0|001|005930^090000')
+    ]
+
+
+def test_replay_pushes_ticks_through_handler(tmp_path):
+    recorder = TickRecorder(root=str(tmp_path))
+    for i in range(5):
+        recorder.record(_tick('005930' if i % 2 == 0 else '000660', 70000 + i, i), _ns('2024-01-02 09:00:00') + i)
+    recorder.close()
+
+    received = []
+    replay = TickReplay(recorder, stock_codes=['005930'])
+    replay.set_message_handler(lambda tick: received.append((tick.stock_code, tick.price, tick.volume)))
+    asyncio.run(replay.run())
+
+    assert received == [('005930', 70000, 0), ('005930', 70002, 2), ('005930', 70004, 4)]
@@ -0,0 +1,124 @@
+"""접근 토큰 관리자 테스트"""
+import json
+import threading
+import time
+
+from datetime import datetime, timedelta
+
+from src.api import token_manager
+from src.api.token_manager import TokenManager
+
+
+class FakeResponse:
+    def __init__(self, approval_key: str = None):
+        self.approval_key = approval_key
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        if self.approval_key:
+            return {'approval_key': self.approval_key}
+        return {'access_token': 'token-1', 'expires_in': 86400}
+
+
+class FakeSession:
+    """발급 호출 횟수를 세는 가짜 세션 (응답 지연으로 동시 갱신 경합 유도)"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def post(self, url, **kwargs):
+        self.calls += 1
+        if url.endswith('/oauth2/Approval'):
+            return FakeResponse(approval_key=f"approval-{self.calls}")
+        time.sleep(0.05)
+        return FakeResponse()
+
+
+def _make_manager(tmp_path):
+    manager = TokenManager('mock', token_file=str(tmp_path / "kis_token_mock.json"))
+    manager.session = FakeSession()
+    return manager
+
+
+def test_concurrent_requests_issue_once(tmp_path):
+    """여러 스레드가 동시에 토큰을 요청해도 발급은 한 번만"""
+    manager = _make_manager(tmp_path)
+
+    tokens = []
+    threads = [threading.Thread(target=lambda: tokens.append(manager.get_token())) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert manager.session.calls == 1
+    assert tokens == ['token-1'] * 8
+
+    with open(manager.token_file) as f:
+        assert json.load(f)['access_token'] == 'token-1'
+    # 임시 파일이 남지 않음
+    assert [p.name for p in tmp_path.iterdir()] == ["kis_token_mock.json"]
+
+
+def test_issue_limited_to_once_per_minute(tmp_path):
+    """1분 안에 강제 재발급을 요청하면 호출하지 않고 기존 토큰 유지"""
+    manager = _make_manager(tmp_path)
+    assert manager.refresh()
+    assert manager.refresh(force=True)
+    assert manager.session.calls == 1
+
+
+def test_reload_from_file(tmp_path):
+    """저장된 토큰을 새 관리자가 읽어 재발급 없이 사용"""
+    manager = _make_manager(tmp_path)
+    manager.get_token()
+
+    reloaded = TokenManager('mock', token_file=manager.token_file)
+    reloaded.session = FakeSession()
+
+    assert reloaded.get_token() == 'token-1'
+    assert reloaded.session.calls == 0
+
+
+def test_legacy_token_file_migrated(tmp_path, monkeypatch):
+    """모드별 파일이 없으면 이전 kis_token.json의 토큰을 재발급 없이 옮겨 사용"""
+    expires_at = datetime.now() + timedelta(hours=6)
+    with open(tmp_path / "kis_token.json", 'w') as f:
+        json.dump({'access_token': 'legacy', 'expires_at': expires_at.isoformat()}, f)
+
+    config = token_manager.get_config()
+    original_get = config.get
+    monkeypatch.setattr(config, 'get', lambda key, default=None: (
+        str(tmp_path) if key == 'api.token.dir' else original_get(key, default)
+    ))
+    monkeypatch.setattr(config, 'get_trading_mode', lambda: 'mock')
+
+    manager = TokenManager('mock')
+    manager.session = FakeSession()
+
+    assert manager.get_token() == 'legacy'
+    assert manager.session.calls == 0
+    with open(tmp_path / "kis_token_mock.json") as f:
+        assert json.load(f)['access_token'] == 'legacy'
+
+    # 다른 모드는 이전 파일을 읽지 않음
+    assert TokenManager('real')._access_token is None
+
+
+def test_approval_key_reissued_on_expiry_and_invalidation(tmp_path):
+    """접속키는 공유하되 만료되거나 거부되면 재발급"""
+    manager = _make_manager(tmp_path)
+
+    assert manager.get_approval_key() == 'approval-1'
+    assert manager.get_approval_key() == 'approval-1'
+
+    # 다른 연결이 이미 재발급했다면 예전 키로 무효화해도 새 키 유지
+    manager.invalidate_approval_key('approval-1')
+    assert manager.get_approval_key() == 'approval-2'
+    manager.invalidate_approval_key('approval-1')
+    assert manager.get_approval_key() == 'approval-2'
+
+    manager._approval_key_issued_at -= manager.approval_key_ttl
+    assert manager.get_approval_key() == 'approval-3'
@@ -0,0 +1,67 @@
+"""WebSocket 연결 풀 테스트"""
+import asyncio
+
+from src.api.kis_ws_pool import KISWebSocketPool
+
+
+class FakeClient:
+    """연결 없이 구독 상태만 추적하는 가짜 WebSocket 클라이언트"""
+
+    def __init__(self):
+        self.running = False
+        self.websocket = None
+        self.subscribed_stocks = set()
+        self.message_handler = None
+
+    def set_message_handler(self, handler, tr_id='H0STCNT0'):
+        self.message_handler = handler
+
+    async def run(self, stock_codes=None):
+        self.running = True
+        self.websocket = object()
+        await asyncio.Event().wait()
+
+    async def subscribe(self, code):
+        self.subscribed_stocks.add(code)
+
+    async def unsubscribe(self, code):
+        self.subscribed_stocks.discard(code)
+
+    async def disconnect(self):
+        self.running = False
+
+    def stats(self):
+        return {}
+
+
+def test_subscriptions_spread_and_rebalanced():
+    async def main():
+        pool = KISWebSocketPool(mode='mock', max_per_connection=3, max_connections=2,
+                                client_factory=FakeClient)
+        handler = object()
+        pool.set_message_handler(handler)
+
+        codes = [f"{i:06d}" for i in range(5)]
+        await pool.start(codes)
+        await asyncio.sleep(0)
+
+        assert pool.stats()['subscriptions'] == [3, 2]
+        assert all(c.message_handler is handler for c in pool.connections)
+        assert set().union(*(c.subscribed_stocks for c in pool.connections)) == set(codes)
+
+        # 용량(3 x 2) 초과분은 REST 폴백 대상으로 반환
+        overflow = await pool.update(codes + ['000005', '000006'])
+        assert overflow == ['000006']
+
+        # 두 번째 연결의 종목이 모두 빠지면 연결을 정리
+        second = pool.connections[1]
+        remaining = [c for c in codes if pool.assignment[c] is not second]
+        await pool.update(remaining)
+        assert len(pool.connections) == 1
+        assert not second.running
+        assert pool.subscribed_stocks == set(remaining)
+
+        await pool.stop()
+        assert not pool.connections
+
+    asyncio.run(main())